@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Compare event body encodings on recorded session traces.
+
+Replays JSON-lines traces (spool segments, or Claude transcripts from
+~/.claude/projects) in batches as the hook daemon would send them, and
+reports bytes on the wire and encode CPU time per encoding. MessagePack is
+measured for comparison (if installed) but the monitor server does not
+accept it:
+
+    python3 benchmark_encoding.py ~/.aios/monitor/spool/segment-*.jsonl
+    python3 benchmark_encoding.py --batch-size 1 ~/.claude/projects/*/*.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add lib to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lib.encoding import available_encodings, encode_body
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+
+def load_trace(paths: list[str]) -> list[dict]:
+    events = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    value = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(value, dict):
+                    events.append(value)
+    return events
+
+
+def measure(events: list[dict], encoding: str, batch_size: int) -> tuple[int, float]:
+    """Returns (wire bytes, encode CPU ms) for the whole trace."""
+    wire = 0
+    start = time.process_time()
+    for i in range(0, len(events), batch_size):
+        batch = events[i:i + batch_size]
+        value = batch if batch_size > 1 else batch[0]
+        body = msgpack.packb(value) if encoding == "msgpack" else encode_body(value, encoding)[0]
+        wire += len(body)
+    return wire, (time.process_time() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare monitor event encodings")
+    parser.add_argument("traces", nargs="+", help="JSON-lines trace files")
+    parser.add_argument("--batch-size", type=int, default=50, help="Events per request")
+    args = parser.parse_args()
+
+    events = load_trace(args.traces)
+    if not events:
+        print("No events found in the given traces")
+        sys.exit(1)
+
+    print(f"{len(events)} events, batches of {args.batch_size}\n")
+    print(f"{'encoding':<10} {'wire bytes':>12} {'ratio':>7} {'encode ms':>10}")
+
+    baseline = None
+    encodings = available_encodings() + (["msgpack"] if HAS_MSGPACK else [])
+    for encoding in encodings:
+        wire, cpu_ms = measure(events, encoding, max(1, args.batch_size))
+        baseline = baseline or wire
+        print(f"{encoding:<10} {wire:>12} {wire / baseline:>7.2f} {cpu_ms:>10.1f}")
+
+    missing = {"zstd", "msgpack"} - set(encodings)
+    if missing:
+        print(f"\nNot installed: {', '.join(sorted(missing))} (pip install zstandard msgpack)")
+
+
+if __name__ == "__main__":
+    main()
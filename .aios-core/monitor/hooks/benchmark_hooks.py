@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark hook latency with and without the hook daemon.
+
+Runs a hook script as a fresh process (as Claude does) against a local
+stand-in server and reports p50/p99 wall time per mode:
+
+    python3 benchmark_hooks.py
+    python3 benchmark_hooks.py --runs 200 --hook post_tool_use
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add lib to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lib.metrics import percentile
+from tests.stub_server import StubServer
+
+HOOKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SAMPLE_EVENT = {
+    "session_id": "benchmark",
+    "cwd": HOOKS_DIR,
+    "tool_name": "Bash",
+    "tool_input": {"command": "ls -la", "description": "List files"},
+    "tool_result": "total 0\n" * 50,
+}
+
+
+def run_hook(hook: str, payload: bytes, env: dict[str, str], runs: int) -> list[float]:
+    """Run the hook `runs` times, returning wall times in ms."""
+    script = os.path.join(HOOKS_DIR, f"{hook}.py")
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, script], input=payload, env=env, check=False)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def wait_for_socket(path: str, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if os.path.exists(path):
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark monitor hook latency")
+    parser.add_argument("--runs", type=int, default=100, help="Invocations per mode")
+    parser.add_argument("--hook", default="pre_tool_use", help="Hook script name")
+    args = parser.parse_args()
+
+    payload = json.dumps(SAMPLE_EVENT).encode("utf-8")
+    results = {}
+
+    with StubServer() as server, tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, "hooks.sock")
+        env = {
+            **os.environ,
+            "AIOS_MONITOR_URL": server.url,
+            "AIOS_MONITOR_MODE": "http",
+            "AIOS_MONITOR_SOCKET": socket_path,
+            # Keep benchmark runs out of the user's hook metrics and rate limits
+            "AIOS_MONITOR_METRICS_FILE": os.path.join(tmp, "hook-metrics.jsonl"),
+            "AIOS_MONITOR_SAMPLING": "off",
+        }
+
+        # Before: no daemon listening, every hook processes in-process
+        results["in-process"] = run_hook(args.hook, payload, env, args.runs)
+
+        # After: hooks hand stdin to the daemon
+        daemon = subprocess.Popen(
+            [sys.executable, os.path.join(HOOKS_DIR, "hook_daemon.py"), "--socket", socket_path],
+            env=env,
+            stdout=subprocess.DEVNULL,
+        )
+        try:
+            if not wait_for_socket(socket_path):
+                print("❌ Hook daemon did not start")
+                sys.exit(1)
+            results["daemon"] = run_hook(args.hook, payload, env, args.runs)
+            # Let the daemon finish forwarding before counting deliveries
+            time.sleep(0.5)
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+        delivered = len(server.events)
+
+    print(f"\nHook: {args.hook} ({args.runs} runs per mode)")
+    print(f"{'mode':<12} {'p50 ms':>8} {'p99 ms':>8} {'mean ms':>8}")
+    for mode, timings in results.items():
+        mean = sum(timings) / len(timings)
+        print(f"{mode:<12} {percentile(timings, 50):>8.1f} {percentile(timings, 99):>8.1f} {mean:>8.1f}")
+    print(f"\nEvents delivered: {delivered}/{args.runs * len(results)}")
+
+
+if __name__ == "__main__":
+    main()
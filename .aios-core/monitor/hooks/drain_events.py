@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Spool drainer - forwards spooled hook events to the monitor server.
+
+Run alongside the monitor server when hooks use AIOS_MONITOR_MODE=spool:
+
+    python3 drain_events.py            # drain every 2s until interrupted
+    python3 drain_events.py --once     # drain once and exit
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add lib to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lib.send_event import post_events
+from lib.spool import drain
+
+
+def forward(batch):
+    """Send a batch as one POST; returns how many events were accepted."""
+    return post_events(batch, timeout_ms=5000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drain the AIOS monitor event spool")
+    parser.add_argument("--once", action="store_true", help="Drain once and exit")
+    parser.add_argument("--interval", type=float, default=2.0, help="Seconds between drains")
+    parser.add_argument("--batch-size", type=int, default=100, help="Events per batch")
+    args = parser.parse_args()
+
+    while True:
+        sent, remaining = drain(forward, batch_size=args.batch_size)
+        if sent or remaining:
+            print(f"[drain] sent={sent} pending={remaining}", flush=True)
+
+        if args.once:
+            sys.exit(0 if remaining == 0 else 1)
+
+        try:
+            time.sleep(args.interval)
+        except KeyboardInterrupt:
+            break
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Hook daemon - processes monitor hook events in a long-lived process.
+
+Hook scripts hand their stdin to this daemon over a unix socket
+(lib/client.py), so enrichment imports and the HTTP connection to the
+monitor server stay warm instead of being rebuilt on every tool call.
+
+    python3 hook_daemon.py                    # listen on ~/.aios/monitor/hooks.sock
+    python3 hook_daemon.py --socket /tmp/h.sock
+"""
+
+import argparse
+import os
+import signal
+import socket
+import socketserver
+import sys
+
+# Add lib to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lib.client import SOCKET_PATH
+from lib.metrics import HookTimer
+from lib.pipeline import handle_stream
+from lib.send_event import enable_batching
+
+
+class HookRequestHandler(socketserver.StreamRequestHandler):
+    """Reads `<event_type>\\n<payload>`; the payload is parsed as it streams in."""
+
+    def handle(self):
+        timer = HookTimer("daemon")
+        event_type = self.rfile.readline(256).decode("ascii", "replace").strip()
+        if not event_type:
+            return
+
+        try:
+            handle_stream(event_type, self.rfile, timer)
+        except Exception as e:
+            print(f"[hook-daemon] Failed to process {event_type}: {e}", file=sys.stderr, flush=True)
+
+
+class HookDaemon(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def socket_in_use(path: str) -> bool:
+    """True if a daemon is accepting connections on `path`."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+        return True
+    except (ConnectionRefusedError, FileNotFoundError):
+        return False
+    finally:
+        sock.close()
+
+
+def _interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AIOS monitor hook daemon")
+    parser.add_argument("--socket", default=SOCKET_PATH, help="Unix socket path")
+    args = parser.parse_args()
+
+    os.makedirs(os.path.dirname(args.socket), exist_ok=True)
+    if os.path.exists(args.socket):
+        if socket_in_use(args.socket):
+            print(f"[hook-daemon] Already running on {args.socket}", file=sys.stderr, flush=True)
+            sys.exit(1)
+        # Stale socket from a previous run
+        os.unlink(args.socket)
+
+    # Events are posted in batches over pooled keep-alive connections
+    batcher = enable_batching()
+    # Flush buffered events on `kill` as well as Ctrl-C
+    signal.signal(signal.SIGTERM, _interrupt)
+
+    with HookDaemon(args.socket, HookRequestHandler) as server:
+        os.chmod(args.socket, 0o600)
+        print(f"[hook-daemon] Listening on {args.socket}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(args.socket)
+            batcher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Hook overhead report - p50/p95/p99 phase timings per hook type.
+
+Reads the rolling metrics file written by the hooks (lib/metrics.py):
+
+    python3 hooks_report.py                   # table per hook type
+    python3 hooks_report.py --budget-ms 50    # exit 1 if any p99 total exceeds 50ms
+    python3 hooks_report.py --json
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lib.metrics import METRICS_FILE, PHASES, percentile, read_metrics
+
+PERCENTILES = (50, 95, 99)
+
+
+def summarize(entries: list[dict]) -> dict[str, dict]:
+    """Group entries by hook type: count plus percentiles for each phase."""
+    by_type: dict[str, list[dict]] = {}
+    for entry in entries:
+        by_type.setdefault(str(entry.get("type")), []).append(entry)
+
+    report = {}
+    for event_type, items in sorted(by_type.items()):
+        phases = {}
+        for phase in PHASES:
+            values = [e[phase] for e in items if isinstance(e.get(phase), (int, float))]
+            if values:
+                phases[phase] = {f"p{p}": round(percentile(values, p), 2) for p in PERCENTILES}
+        report[event_type] = {
+            "count": len(items),
+            "dropped": sum(1 for e in items if e.get("sent") is False),
+            "phases": phases,
+        }
+    return report
+
+
+def print_table(report: dict[str, dict]) -> None:
+    header = f"{'Hook':<24} {'Phase':<8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    print(header)
+    print("-" * len(header))
+    for event_type, summary in report.items():
+        label = f"{event_type} ({summary['count']})"
+        for phase, stats in summary["phases"].items():
+            print(f"{label:<24} {phase:<8} {stats['p50']:>8.2f} {stats['p95']:>8.2f} {stats['p99']:>8.2f}")
+            label = ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report AIOS monitor hook overhead")
+    parser.add_argument("--file", default=str(METRICS_FILE), help="Metrics file")
+    parser.add_argument("--budget-ms", type=float, help="Fail if any p99 total exceeds this")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    args = parser.parse_args()
+
+    entries = read_metrics(Path(args.file))
+    if not entries:
+        print(f"No hook metrics recorded in {args.file}")
+        sys.exit(0)
+
+    report = summarize(entries)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_table(report)
+
+    if args.budget_ms is not None:
+        over = [
+            event_type for event_type, summary in report.items()
+            if summary["phases"].get("total", {}).get("p99", 0) > args.budget_ms
+        ]
+        if over:
+            print(f"\nOver budget ({args.budget_ms}ms p99): {', '.join(over)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Hook client shim.
+
+Hands the hook's stdin to the resident hook daemon over a unix socket so the
+hook process never imports json, urllib or the enrichment code. When the
+daemon is not running, the event is processed in-process instead.
+
+Keep this module's imports minimal - they are paid on every tool call.
+"""
+
+import os
+import socket
+import sys
+import time
+
+SOCKET_PATH = os.environ.get(
+    "AIOS_MONITOR_SOCKET",
+    os.path.join(os.path.expanduser("~"), ".aios", "monitor", "hooks.sock")
+)
+CHUNK_SIZE = 64 * 1024
+
+
+def connect_daemon(socket_path: str = SOCKET_PATH) -> socket.socket | None:
+    """Connect to the hook daemon. Returns None if it is not running."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(0.2)
+        sock.connect(socket_path)
+        sock.settimeout(2.0)
+        return sock
+    except OSError:
+        sock.close()
+        return None
+
+
+def stream_to_daemon(sock: socket.socket, event_type: str, stream) -> None:
+    """Send `<event_type>\\n` followed by the payload, chunk by chunk."""
+    sock.sendall(event_type.encode("ascii") + b"\n")
+    while True:
+        chunk = stream.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        sock.sendall(chunk)
+
+
+def run_hook(event_type: str) -> None:
+    """Entry point used by every hook script."""
+    start = time.perf_counter()
+    stdin = sys.stdin.buffer
+
+    sock = connect_daemon()
+    if sock is not None:
+        try:
+            stream_to_daemon(sock, event_type, stdin)
+        except OSError:
+            # Daemon went away mid-stream - never block Claude
+            pass
+        finally:
+            sock.close()
+        return
+
+    # Daemon not running - process in this process
+    from .metrics import HookTimer
+    from .pipeline import handle_stream
+    try:
+        handle_stream(event_type, stdin, HookTimer("inprocess", start))
+    except ValueError:
+        # Malformed hook payload - never block Claude
+        pass
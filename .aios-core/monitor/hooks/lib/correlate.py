@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Pre/Post tool-use correlation.
+
+PreToolUse stores its start time under the call's tool_use_id; PostToolUse
+picks it up and reports `duration_ms` itself, so the monitor server never
+has to pair events. Entries are one tiny file per in-flight call, which
+works the same for one-shot hook processes and the hook daemon without any
+locking. Entries whose PostToolUse never arrives are swept after
+STALE_AFTER_S.
+"""
+
+import os
+import re
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+CORRELATION_DIR = Path(os.environ.get(
+    "AIOS_MONITOR_CORRELATION_DIR",
+    str(Path.home() / ".aios" / "monitor" / "tool-calls")
+))
+STALE_AFTER_S = 3600
+# Roughly one PreToolUse in SWEEP_EVERY sweeps stale entries
+SWEEP_EVERY = 100
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def _entry_path(tool_use_id: str, directory: Path) -> Path:
+    return directory / _UNSAFE.sub("_", tool_use_id)[:200]
+
+
+def record_start(tool_use_id: str, directory: Path = CORRELATION_DIR, now: float | None = None) -> None:
+    """Remember when a tool call started."""
+    now = time.time() if now is None else now
+    directory.mkdir(parents=True, exist_ok=True)
+    _entry_path(tool_use_id, directory).write_text(repr(now), encoding="ascii")
+
+    if zlib.crc32(tool_use_id.encode("utf-8")) % SWEEP_EVERY == 0:
+        sweep_stale(directory, now)
+
+
+def pop_duration_ms(tool_use_id: str, directory: Path = CORRELATION_DIR, now: float | None = None) -> int | None:
+    """Duration since record_start() for this call, or None if it was not seen."""
+    now = time.time() if now is None else now
+    path = _entry_path(tool_use_id, directory)
+    try:
+        started = float(path.read_text(encoding="ascii"))
+        path.unlink()
+    except (OSError, ValueError):
+        return None
+    return max(0, int((now - started) * 1000))
+
+
+def sweep_stale(directory: Path = CORRELATION_DIR, now: float | None = None) -> int:
+    """Remove entries older than STALE_AFTER_S. Returns how many were removed."""
+    cutoff = (time.time() if now is None else now) - STALE_AFTER_S
+    removed = 0
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return removed
+
+
+def correlate(event_type: str, data: dict[str, Any], member_sizes: dict[str, int]) -> None:
+    """
+    Add tool-call correlation fields to a Pre/PostToolUse payload in place.
+
+    PreToolUse gains input_bytes; PostToolUse gains input_bytes, output_bytes
+    and duration_ms (when its PreToolUse was seen). Sizes are raw payload
+    bytes, measured before truncation.
+    """
+    if event_type not in ("PreToolUse", "PostToolUse"):
+        return
+
+    if "tool_input" in member_sizes:
+        data["input_bytes"] = member_sizes["tool_input"]
+
+    tool_use_id = data.get("tool_use_id")
+    if not isinstance(tool_use_id, str) or not tool_use_id:
+        tool_use_id = None
+
+    try:
+        if event_type == "PreToolUse":
+            if tool_use_id:
+                record_start(tool_use_id)
+            return
+
+        for key in ("tool_response", "tool_result"):
+            if key in member_sizes:
+                data["output_bytes"] = member_sizes[key]
+                break
+
+        if tool_use_id:
+            duration_ms = pop_duration_ms(tool_use_id)
+            if duration_ms is not None:
+                data["duration_ms"] = duration_ms
+    except OSError:
+        # Correlation is best effort - never block Claude
+        pass
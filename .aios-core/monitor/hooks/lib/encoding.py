@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Request body encodings for monitor events (AIOS_MONITOR_ENCODING).
+
+- json:    plain JSON (default, always available)
+- gzip:    gzip-compressed JSON (stdlib)
+- zstd:    zstd-compressed JSON (requires `zstandard`)
+
+The encoding is announced with a Content-Encoding header. Encodings whose
+library is missing fall back to plain JSON, and send_event drops back to
+JSON for good once the server answers 415. The monitor server only decodes
+JSON bodies, so MessagePack is measured by benchmark_encoding.py but never
+sent.
+"""
+
+import gzip
+import json
+import os
+from typing import Any
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+ENCODING = os.environ.get("AIOS_MONITOR_ENCODING", "json").lower()
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def available_encodings() -> list[str]:
+    encodings = ["json", "gzip"]
+    if HAS_ZSTD:
+        encodings.append("zstd")
+    return encodings
+
+
+def resolve_encoding(encoding: str = ENCODING) -> str:
+    """The requested encoding if usable here, otherwise json."""
+    return encoding if encoding in available_encodings() else "json"
+
+
+def encode_body(value: Any, encoding: str = "json") -> tuple[bytes, dict[str, str]]:
+    """
+    Serialize an event (or list of events) for POST /events.
+
+    Returns:
+        (body, headers)
+
+    Raises:
+        TypeError / ValueError if the value is not serializable
+    """
+    encoding = resolve_encoding(encoding)
+    payload = json.dumps(value, separators=(",", ":")).encode("utf-8")
+    if encoding == "gzip":
+        return gzip.compress(payload, GZIP_LEVEL), {**JSON_HEADERS, "Content-Encoding": "gzip"}
+    if encoding == "zstd":
+        # Compressors are not thread-safe; a new one per body is cheap
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+        return compressor.compress(payload), {**JSON_HEADERS, "Content-Encoding": "zstd"}
+    return payload, JSON_HEADERS
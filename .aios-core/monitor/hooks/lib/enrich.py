@@ -3,18 +3,53 @@
 Enrich events with AIOS context (agent, story, task, etc.)
 """
 
+import json
 import os
 import re
+import time
 from pathlib import Path
 from typing import Any
 
+# Project markers, strongest first: a .git directory marks the repository root
+PROJECT_MARKERS = [".git", "package.json", "Cargo.toml", "go.mod", "pyproject.toml"]
+
+PROJECT_CACHE_FILE = Path(os.environ.get(
+    "AIOS_MONITOR_PROJECT_CACHE",
+    str(Path.home() / ".aios" / "monitor" / "project-cache.json")
+))
+PROJECT_CACHE_MAX_ENTRIES = 256
+# In-process results are trusted this long before revalidating (hook daemon)
+PROJECT_MEMO_TTL_S = 5.0
+# Disk entries verified this recently are reused without stat calls
+PROJECT_VERIFY_TTL_S = float(os.environ.get("AIOS_MONITOR_PROJECT_TTL_S", "30"))
+
+_project_memo: dict[str, tuple[str, float]] = {}
+
+# Core AIOS agents, always recognized even outside an AIOS checkout
+DEFAULT_AGENT_IDS = [
+    "dev", "architect", "qa", "pm", "po", "sm", "analyst", "devops", "aios-master",
+]
+# Agent sources relative to the project root
+AGENT_DIRS = [".aios-core/development/agents"]
+SQUADS_DIR = "squads"
+SQUAD_REGISTRY = "squads/squad-creator/data/squad-registry.yaml"
+
+AGENT_CACHE_FILE = Path(os.environ.get(
+    "AIOS_MONITOR_AGENT_CACHE",
+    str(Path.home() / ".aios" / "monitor" / "agent-cache.json")
+))
+AGENT_CACHE_MAX_ENTRIES = 32
+
+_agent_matchers: dict[str, tuple[re.Pattern[str], float]] = {}
+
 
 def enrich_event(data: dict[str, Any]) -> dict[str, Any]:
     """Add AIOS context to event data."""
 
     # Project detection
     cwd = data.get("cwd", os.getcwd())
-    data["project"] = detect_project(cwd)
+    project_root = find_project_root(cwd)
+    data["project"] = Path(project_root).name
 
     # AIOS context from environment
     if os.environ.get("AIOS_AGENT"):
@@ -29,7 +64,7 @@ def enrich_event(data: dict[str, Any]) -> dict[str, Any]:
     # Try to detect AIOS agent from user prompt if available
     user_prompt = data.get("user_prompt", "")
     if user_prompt:
-        detected_agent = detect_agent_from_prompt(user_prompt)
+        detected_agent = detect_agent_from_prompt(user_prompt, project_root)
         if detected_agent and not data.get("aios_agent"):
             data["aios_agent"] = detected_agent
 
@@ -37,22 +72,230 @@ def enrich_event(data: dict[str, Any]) -> dict[str, Any]:
 
 
 def detect_project(cwd: str) -> str:
-    """Detect project name from cwd."""
+    """Detect project name from cwd (the name of its project root)."""
+    return Path(find_project_root(cwd)).name
+
+
+def find_project_root(cwd: str) -> str:
+    """
+    Resolve the project root for cwd.
+
+    Walks up from cwd to the nearest directory with a .git marker, falling
+    back to the nearest directory with any other project marker, then cwd.
+    Results are memoized in-process and cached on disk keyed by cwd. A disk
+    entry verified less than PROJECT_VERIFY_TTL_S ago is used as is. An
+    older one is reused while the mtimes of cwd and the root are unchanged,
+    and is then re-stamped. A one-shot hook process therefore does one read
+    of the cache file on a hit, and no stat calls. That read is the floor
+    without the hook daemon.
+    """
+    now = time.monotonic()
+    memo = _project_memo.get(cwd)
+    if memo and now - memo[1] < PROJECT_MEMO_TTL_S:
+        return memo[0]
+
+    cache = _load_json_cache(PROJECT_CACHE_FILE)
+    entry = cache.get(cwd)
+    wall = time.time()
+    if _project_cache_fresh(entry, wall):
+        root = entry["root"]
+    elif entry and _project_cache_valid(cwd, entry):
+        root = entry["root"]
+        entry["verified_at"] = wall
+        _save_json_cache(PROJECT_CACHE_FILE, cache, PROJECT_CACHE_MAX_ENTRIES)
+    else:
+        root = _walk_project_root(cwd)
+        stamp = _dir_mtimes(cwd, root)
+        if stamp is not None:
+            cache.pop(cwd, None)
+            cache[cwd] = {"root": root, "mtimes": stamp, "verified_at": wall}
+            _save_json_cache(PROJECT_CACHE_FILE, cache, PROJECT_CACHE_MAX_ENTRIES)
+
+    _project_memo[cwd] = (root, now)
+    return root
+
+
+def _walk_project_root(cwd: str) -> str:
     path = Path(cwd)
+    nearest = None
+
+    for candidate in (path, *path.parents):
+        if (candidate / ".git").exists():
+            return str(candidate)
+        if nearest is None and any((candidate / m).exists() for m in PROJECT_MARKERS[1:]):
+            nearest = candidate
+
+    return str(nearest or path)
+
+
+def _dir_mtimes(cwd: str, root: str) -> list[int] | None:
+    try:
+        return [os.stat(cwd).st_mtime_ns, os.stat(root).st_mtime_ns]
+    except OSError:
+        return None
+
+
+def _project_cache_fresh(entry: Any, wall: float) -> bool:
+    if not isinstance(entry, dict) or "root" not in entry:
+        return False
+    verified_at = entry.get("verified_at")
+    return isinstance(verified_at, (int, float)) and 0 <= wall - verified_at < PROJECT_VERIFY_TTL_S
+
+
+def _project_cache_valid(cwd: str, entry: dict[str, Any]) -> bool:
+    return isinstance(entry, dict) and "root" in entry and \
+        entry.get("mtimes") == _dir_mtimes(cwd, entry["root"])
+
+
+def _load_json_cache(path: Path) -> dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
 
-    # Check for common project markers
-    markers = [".git", "package.json", "Cargo.toml", "go.mod", "pyproject.toml"]
-    for marker in markers:
-        if (path / marker).exists():
-            return path.name
 
-    return path.name
+def _save_json_cache(path: Path, cache: dict[str, Any], max_entries: int) -> None:
+    # Keep the most recently added entries
+    if len(cache) > max_entries:
+        for key in list(cache)[:len(cache) - max_entries]:
+            del cache[key]
 
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
 
-def detect_agent_from_prompt(prompt: str) -> str | None:
-    """Detect AIOS agent activation from prompt."""
-    # Look for @agent patterns
-    match = re.search(r'@(dev|architect|qa|pm|po|sm|analyst|devops|aios-master)', prompt.lower())
+
+def detect_agent_from_prompt(prompt: str, project_root: str | None = None) -> str | None:
+    """
+    Detect AIOS agent activation (`@agent`) from prompt.
+
+    Matches case-insensitively against the raw prompt with one precompiled
+    pattern, so cost stays linear in prompt size and no lowercased copy is
+    made.
+    """
+    match = get_agent_matcher(project_root).search(prompt)
     if match:
-        return match.group(1)
+        return match.group(1).lower()
     return None
+
+
+def get_agent_matcher(project_root: str | None = None) -> re.Pattern[str]:
+    """Compiled `@agent` pattern for the agents known in project_root."""
+    key = project_root or ""
+    now = time.monotonic()
+    memo = _agent_matchers.get(key)
+    if memo and now - memo[1] < PROJECT_MEMO_TTL_S:
+        return memo[0]
+
+    agent_ids = set(DEFAULT_AGENT_IDS)
+    if project_root:
+        agent_ids.update(load_agent_ids(project_root))
+
+    # Not preceded by a word char (skips e-mail addresses), whole id only
+    pattern = re.compile(rf"(?<!\w)@({_trie_pattern(agent_ids)})(?![\w-])", re.IGNORECASE)
+
+    _agent_matchers[key] = (pattern, now)
+    return pattern
+
+
+def _trie_pattern(words: set[str]) -> str:
+    """
+    Regex alternation shaped as a prefix trie, so each prompt position is
+    checked against at most one branch per character instead of every id.
+    Longer ids are tried before their prefixes ('aios-master' before 'aios').
+    """
+    trie: dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word.lower():
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict[str, Any]) -> str:
+        branches = [re.escape(c) + build(child) for c, child in sorted(node.items()) if c]
+        if not branches:
+            return ""
+        optional = "" in node
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if optional else "")
+
+    return build(trie)
+
+
+def load_agent_ids(project_root: str) -> list[str]:
+    """
+    Agent ids defined in a project: AIOS core agent files, squad agent
+    files and squad registry `agent_names`. Cached on disk keyed by root
+    and invalidated by the mtimes of the agent sources.
+    """
+    stamp = _agent_sources_stamp(project_root)
+    if not stamp:
+        return []
+
+    cache = _load_json_cache(AGENT_CACHE_FILE)
+    entry = cache.get(project_root)
+    if isinstance(entry, dict) and entry.get("stamp") == stamp:
+        return entry.get("ids", [])
+
+    root = Path(project_root)
+    agent_ids = set()
+    for agents_dir in _agent_dirs(root):
+        try:
+            agent_ids.update(p.stem for p in agents_dir.glob("*.md"))
+        except OSError:
+            continue
+    agent_ids.update(_registry_agent_names(root / SQUAD_REGISTRY))
+    agent_ids = sorted(a.lower() for a in agent_ids if a)
+
+    cache.pop(project_root, None)
+    cache[project_root] = {"stamp": stamp, "ids": agent_ids}
+    _save_json_cache(AGENT_CACHE_FILE, cache, AGENT_CACHE_MAX_ENTRIES)
+    return agent_ids
+
+
+def _agent_dirs(root: Path) -> list[Path]:
+    dirs = [root / d for d in AGENT_DIRS]
+    try:
+        with os.scandir(root / SQUADS_DIR) as entries:
+            dirs.extend(Path(e.path) / "agents" for e in entries if e.is_dir())
+    except OSError:
+        pass
+    return [d for d in dirs if d.is_dir()]
+
+
+def _agent_sources_stamp(project_root: str) -> dict[str, int]:
+    root = Path(project_root)
+    stamp = {}
+    for path in [root / SQUADS_DIR, root / SQUAD_REGISTRY, *_agent_dirs(root)]:
+        try:
+            stamp[str(path)] = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+    return stamp
+
+
+def _registry_agent_names(registry: Path) -> list[str]:
+    """Read `agent_names:` lists from the squad registry without a YAML parser."""
+    names = []
+    try:
+        with open(registry, "r", encoding="utf-8") as f:
+            in_list = False
+            for line in f:
+                stripped = line.strip()
+                if stripped == "agent_names:":
+                    in_list = True
+                elif in_list and stripped.startswith("- "):
+                    names.append(stripped[2:].strip().strip("'\""))
+                elif stripped:
+                    in_list = False
+    except OSError:
+        pass
+    return names
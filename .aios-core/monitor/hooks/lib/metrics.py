@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Hook latency self-instrumentation.
+
+Every processed hook event appends one JSON line with its phase timings
+(startup, parse, correlate, sample, enrich, send, total; milliseconds) to a
+local rolling metrics file. `hooks_report.py` summarizes it.
+
+Interpreter start-up is not included: in-process hooks measure from the
+shim's entry point (`startup` is the pipeline import), daemon-handled hooks
+from the moment the daemon accepts the request.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+METRICS_FILE = Path(os.environ.get(
+    "AIOS_MONITOR_METRICS_FILE",
+    str(Path.home() / ".aios" / "monitor" / "hook-metrics.jsonl")
+))
+METRICS_ENABLED = os.environ.get("AIOS_MONITOR_METRICS", "on").lower() != "off"
+# Rolled over to <file>.1 past this size, so at most ~2x is kept on disk
+MAX_BYTES = int(os.environ.get("AIOS_MONITOR_METRICS_MAX_BYTES", str(1024 * 1024)))
+
+PHASES = ("startup", "parse", "correlate", "sample", "enrich", "send", "total")
+
+
+class HookTimer:
+    """Records consecutive phase durations for one hook event."""
+
+    def __init__(self, mode: str, start: float | None = None):
+        self.mode = mode
+        self.start = start if start is not None else time.perf_counter()
+        self._last = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        if start is not None:
+            self.phases["startup"] = round((self._last - start) * 1000, 3)
+
+    def mark(self, phase: str) -> None:
+        """Close `phase`, measured since the previous mark."""
+        now = time.perf_counter()
+        self.phases[phase] = round((now - self._last) * 1000, 3)
+        self._last = now
+
+    def record(self, event_type: str, **fields: Any) -> None:
+        """Append the timings to the metrics file (never raises)."""
+        if not METRICS_ENABLED:
+            return
+        self.phases["total"] = round((time.perf_counter() - self.start) * 1000, 3)
+        entry = {
+            "ts": int(time.time() * 1000),
+            "type": event_type,
+            "mode": self.mode,
+            **self.phases,
+            **fields,
+        }
+        try:
+            append_metric(entry)
+        except OSError:
+            pass
+
+
+def append_metric(entry: dict[str, Any], path: Path = METRICS_FILE) -> None:
+    """Append one line; a single O_APPEND write keeps concurrent writers whole."""
+    line = (json.dumps(entry, separators=(",", ":")) + "\n").encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+    try:
+        os.write(fd, line)
+        size = os.fstat(fd).st_size
+    finally:
+        os.close(fd)
+
+    if size > MAX_BYTES:
+        try:
+            os.replace(path, path.with_name(path.name + ".1"))
+        except OSError:
+            pass
+
+
+def read_metrics(path: Path = METRICS_FILE) -> list[dict[str, Any]]:
+    """All recorded entries, oldest first (rolled-over file included)."""
+    entries = []
+    for candidate in (path.with_name(path.name + ".1"), path):
+        try:
+            with open(candidate, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(entry, dict):
+                        entries.append(entry)
+        except OSError:
+            continue
+    return entries
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
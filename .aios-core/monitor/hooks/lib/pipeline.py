@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Per-hook event processing shared by the hook scripts and the hook daemon.
+
+Each event passes the sampling policy, the hook type trims its own large
+fields, then every event is enriched with AIOS context and sent to the
+monitor server.
+"""
+
+import io
+from typing import Any, BinaryIO
+
+from .correlate import correlate
+from .enrich import enrich_event
+from .metrics import HookTimer
+from .sampling import SUMMARY_EVENT, check_event
+from .send_event import send_event
+from .stream_json import StreamingJSONReader
+
+
+def _truncate_strings(value: Any, limit: int, suffix: str) -> Any:
+    """Truncate every string in a nested dict/list structure."""
+    if isinstance(value, str):
+        return value[:limit] + suffix if len(value) > limit else value
+    if isinstance(value, dict):
+        return {k: _truncate_strings(v, limit, suffix) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_truncate_strings(v, limit, suffix) for v in value]
+    return value
+
+
+def _prepare_pre_tool_use(data: dict[str, Any]) -> None:
+    # Truncate large fields to avoid memory issues
+    if "tool_input" in data:
+        data["tool_input"] = _truncate_strings(data["tool_input"], 500, "...")
+
+
+def _prepare_post_tool_use(data: dict[str, Any]) -> None:
+    for key in ("tool_result", "tool_response"):
+        if key in data:
+            data[key] = _truncate_strings(data[key], 1000, "...[truncated]")
+
+    if "tool_input" in data:
+        data["tool_input"] = _truncate_strings(data["tool_input"], 500, "...")
+
+
+def _prepare_user_prompt_submit(data: dict[str, Any]) -> None:
+    # Store user prompt for agent detection, truncated if too long
+    prompt = data.get("user_prompt")
+    if isinstance(prompt, str) and len(prompt) > 1000:
+        data["user_prompt"] = prompt[:1000] + "..."
+
+
+PREPARERS = {
+    "PreToolUse": _prepare_pre_tool_use,
+    "PostToolUse": _prepare_post_tool_use,
+    "UserPromptSubmit": _prepare_user_prompt_submit,
+}
+
+
+def prepare_event(event_type: str, data: dict[str, Any]) -> dict[str, Any]:
+    """Apply hook-specific trimming and AIOS enrichment."""
+    preparer = PREPARERS.get(event_type)
+    if preparer:
+        preparer(data)
+
+    return enrich_event(data)
+
+
+def handle_stream(event_type: str, stream: BinaryIO, timer: HookTimer | None = None) -> bool:
+    """
+    Process a hook payload (the hook's stdin) end to end.
+
+    The payload is parsed incrementally and large strings are truncated
+    while reading, so memory stays bounded regardless of tool output.
+    Phase timings are recorded to the hook metrics file.
+
+    Returns:
+        True if the event was sent, False otherwise (including sampled out)
+    """
+    timer = timer or HookTimer("inprocess")
+
+    reader = StreamingJSONReader(stream)
+    data = reader.read()
+    timer.mark("parse")
+    if not isinstance(data, dict):
+        return False
+
+    # Before sampling, so durations survive a dropped PreToolUse
+    correlate(event_type, data, reader.member_sizes)
+    timer.mark("correlate")
+
+    keep, summary = check_event(event_type, data)
+    if summary is not None:
+        send_event(SUMMARY_EVENT, summary)
+    timer.mark("sample")
+    if not keep:
+        timer.record(event_type, sent=False)
+        return False
+
+    if reader.truncated:
+        data["payload_truncated"] = True
+
+    data = prepare_event(event_type, data)
+    timer.mark("enrich")
+    sent = send_event(event_type, data)
+    timer.mark("send")
+    timer.record(event_type, sent=sent)
+    return sent
+
+
+def handle_event(event_type: str, raw: bytes) -> bool:
+    """Process a hook payload that is already in memory."""
+    return handle_stream(event_type, io.BytesIO(raw))
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Sampling and rate limiting for high-frequency monitor events.
+
+Policy (JSON, AIOS_MONITOR_SAMPLING_CONFIG, merged over DEFAULT_POLICY):
+
+    {
+      "enabled": true,
+      "rates": {"PreToolUse": 0.5, "PostToolUse": 0.5},
+      "always_keep": ["Stop", "SubagentStop", "UserPromptSubmit"],
+      "keep_errors": true,
+      "rate_limits": {"PreToolUse": {"per_second": 20, "burst": 100}},
+      "summary_interval_s": 60
+    }
+
+Overrides are merged key by key, so setting one `rates` or `rate_limits`
+entry keeps the others (set an entry to null to remove it). No rate limits
+are configured by default.
+
+Pre/Post events of the same tool call share one decision. Sampling is
+hashed from tool_use_id. Rate limiting is decided by whichever of the two
+arrives first (against the PreToolUse limit, or PostToolUse if only that
+is set), and the other follows that decision.
+
+Token buckets and drop counters live in a small state file so they hold
+across hook processes. The file is only locked and written when an event is
+dropped, when a rate limit is configured for the event, or when a summary is
+due. A marker file exists while dropped counts are unreported, and its mtime
+is the start of the window, so kept events only stat it. Once per summary
+interval the dropped counts are reported as a SamplingSummary event.
+"""
+
+import json
+import os
+import random
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+CONFIG_FILE = Path(os.environ.get(
+    "AIOS_MONITOR_SAMPLING_CONFIG",
+    str(Path.home() / ".aios" / "monitor" / "sampling.json")
+))
+STATE_FILE = Path(os.environ.get(
+    "AIOS_MONITOR_SAMPLING_STATE",
+    str(Path.home() / ".aios" / "monitor" / "sampling-state.json")
+))
+# Exists while dropped counts await a summary; mtime = window start
+PENDING_FILE = STATE_FILE.with_name(STATE_FILE.name + ".pending")
+SUMMARY_EVENT = "SamplingSummary"
+
+# Events of one tool call that share a decision
+PAIRED_EVENTS = ("PreToolUse", "PostToolUse")
+PAIR_BUCKET = "ToolUse"
+# Pending pair decisions are forgotten after this long (or beyond the cap)
+DECISION_TTL_S = 600
+MAX_DECISIONS = 1000
+
+DEFAULT_POLICY: dict[str, Any] = {
+    "enabled": os.environ.get("AIOS_MONITOR_SAMPLING", "on").lower() != "off",
+    "rates": {},
+    "always_keep": ["Stop", "SubagentStop", "UserPromptSubmit"],
+    "keep_errors": True,
+    # Opt-in: limits make every limited event lock the state file
+    "rate_limits": {},
+    "summary_interval_s": 60,
+}
+
+_policy: dict[str, Any] | None = None
+
+
+def load_policy() -> dict[str, Any]:
+    """Policy from CONFIG_FILE merged over the defaults (cached per process)."""
+    global _policy
+    if _policy is None:
+        overrides: Any = {}
+        try:
+            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
+                overrides = json.load(f)
+        except (OSError, ValueError):
+            pass
+        _policy = merge_policy(DEFAULT_POLICY, overrides if isinstance(overrides, dict) else {})
+    return _policy
+
+
+def merge_policy(base: dict[str, Any], overrides: dict[str, Any]) -> dict[str, Any]:
+    """Overrides over base; nested dicts (rates, rate_limits) merge per entry."""
+    policy = {k: dict(v) if isinstance(v, dict) else v for k, v in base.items()}
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(policy.get(key), dict):
+            policy[key].update(value)
+        else:
+            policy[key] = value
+    return policy
+
+
+def is_error_event(data: dict[str, Any]) -> bool:
+    if data.get("is_error"):
+        return True
+    response = data.get("tool_response")
+    return isinstance(response, dict) and bool(response.get("is_error") or response.get("error"))
+
+
+def _sampled_in(data: dict[str, Any], rate: float) -> bool:
+    if rate >= 1:
+        return True
+    if rate <= 0:
+        return False
+    # Same decision for the PreToolUse and PostToolUse of one tool call
+    tool_use_id = data.get("tool_use_id")
+    if isinstance(tool_use_id, str) and tool_use_id:
+        return (zlib.crc32(tool_use_id.encode("utf-8")) % 10000) < rate * 10000
+    return random.random() < rate
+
+
+def check_event(event_type: str, data: dict[str, Any]) -> tuple[bool, dict[str, Any] | None]:
+    """
+    Decide whether to forward an event.
+
+    Returns:
+        (keep, summary) - summary is the data of a SamplingSummary event to
+        send now, or None
+    """
+    policy = load_policy()
+    if not policy.get("enabled"):
+        return True, None
+
+    if event_type in policy.get("always_keep", []) or \
+            (policy.get("keep_errors") and is_error_event(data)):
+        return True, _summary_if_due(event_type, policy, data)
+
+    rate = policy.get("rates", {}).get(event_type)
+    if not _sampled_in(data, 1.0 if rate is None else float(rate)):
+        return False, _record(event_type, "sampled", policy, data)
+
+    pair_id = _pair_id(event_type, data)
+    limit = _rate_limit(event_type, pair_id, policy)
+    if not limit:
+        return True, _summary_if_due(event_type, policy, data)
+
+    return _take_token(event_type, pair_id, limit, policy, data)
+
+
+def _pair_id(event_type: str, data: dict[str, Any]) -> str | None:
+    tool_use_id = data.get("tool_use_id")
+    if event_type in PAIRED_EVENTS and isinstance(tool_use_id, str) and tool_use_id:
+        return tool_use_id
+    return None
+
+
+def _rate_limit(event_type: str, pair_id: str | None, policy: dict[str, Any]) -> dict[str, Any] | None:
+    limits = policy.get("rate_limits") or {}
+    if pair_id is None:
+        return limits.get(event_type)
+    # One limit for the pair, so both halves are decided the same way
+    return next((limits[e] for e in PAIRED_EVENTS if limits.get(e)), None)
+
+
+def _summary_if_due(event_type: str, policy: dict[str, Any], data: dict[str, Any]) -> dict[str, Any] | None:
+    """For kept events: one stat of the pending marker, locking only when a summary is due."""
+    try:
+        window_start = PENDING_FILE.stat().st_mtime
+    except OSError:
+        return None
+    if time.time() - window_start < float(policy.get("summary_interval_s", 60)):
+        return None
+    return _record(event_type, None, policy, data)
+
+
+# ── shared state ──────────────────────────────────────────────────────────
+
+
+def _with_state(update):
+    """Run update(state) under an exclusive lock on the state file."""
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(STATE_FILE, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if HAS_FCNTL:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        raw = b""
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            raw += chunk
+        try:
+            state = json.loads(raw) if raw else {}
+        except ValueError:
+            state = {}
+
+        result = update(state)
+
+        encoded = json.dumps(state, separators=(",", ":")).encode("utf-8")
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.ftruncate(fd, 0)
+        os.write(fd, encoded)
+        return result
+    finally:
+        os.close(fd)
+
+
+def _take_token(
+    event_type: str,
+    pair_id: str | None,
+    limit: dict[str, Any],
+    policy: dict[str, Any],
+    data: dict[str, Any],
+) -> tuple[bool, dict[str, Any] | None]:
+    per_second = float(limit.get("per_second", 10))
+    burst = float(limit.get("burst", per_second))
+
+    def update(state):
+        now = time.time()
+        decisions = state.setdefault("decisions", {})
+        decided = decisions.pop(pair_id, None) if pair_id else None
+        if decided is not None:
+            # The other half of this tool call was already decided
+            keep = bool(decided[0])
+        else:
+            bucket = state.setdefault("buckets", {}).setdefault(
+                PAIR_BUCKET if pair_id else event_type, {"tokens": burst, "updated": now}
+            )
+            elapsed = max(0.0, now - bucket["updated"])
+            bucket["tokens"] = min(burst, bucket["tokens"] + elapsed * per_second)
+            bucket["updated"] = now
+
+            keep = bucket["tokens"] >= 1
+            if keep:
+                bucket["tokens"] -= 1
+            if pair_id:
+                decisions[pair_id] = [keep, now]
+                _prune_decisions(decisions, now)
+
+        summary = _count(state, event_type, None if keep else "rate_limited", policy, data, now)
+        return keep, summary
+
+    try:
+        return _with_state(update)
+    except OSError:
+        # State unavailable - fail open
+        return True, None
+
+
+def _prune_decisions(decisions: dict[str, Any], now: float) -> None:
+    for key in [k for k, (_, at) in decisions.items() if now - at > DECISION_TTL_S]:
+        del decisions[key]
+    # Insertion order is oldest first
+    for key in list(decisions)[:max(0, len(decisions) - MAX_DECISIONS)]:
+        del decisions[key]
+
+
+def _record(
+    event_type: str,
+    reason: str | None,
+    policy: dict[str, Any],
+    data: dict[str, Any],
+) -> dict[str, Any] | None:
+    try:
+        return _with_state(lambda state: _count(state, event_type, reason, policy, data, time.time()))
+    except OSError:
+        return None
+
+
+def _count(
+    state: dict[str, Any],
+    event_type: str,
+    reason: str | None,
+    policy: dict[str, Any],
+    data: dict[str, Any],
+    now: float,
+) -> dict[str, Any] | None:
+    """Count a drop (reason set) and return a summary when one is due."""
+    dropped = state.setdefault("dropped", {})
+    if reason:
+        if not dropped:
+            # First drop of a window
+            state["window_start"] = now
+        if not PENDING_FILE.exists():
+            _set_pending(True, state.get("window_start", now))
+        by_type = dropped.setdefault(event_type, {})
+        by_type[reason] = by_type.get(reason, 0) + 1
+
+    window_start = state.get("window_start", now)
+    if not dropped or now - window_start < float(policy.get("summary_interval_s", 60)):
+        return None
+
+    summary = {
+        "session_id": data.get("session_id"),
+        "cwd": data.get("cwd"),
+        "window_start": int(window_start * 1000),
+        "window_end": int(now * 1000),
+        "dropped": dropped,
+        "dropped_total": sum(n for counts in dropped.values() for n in counts.values()),
+    }
+    state["dropped"] = {}
+    state.pop("window_start", None)
+    _set_pending(False, now)
+    return summary
+
+
+def _set_pending(pending: bool, now: float) -> None:
+    try:
+        if pending:
+            PENDING_FILE.touch()
+            os.utime(PENDING_FILE, (now, now))
+        else:
+            PENDING_FILE.unlink()
+    except OSError:
+        pass
@@ -2,16 +2,254 @@
 """
 Send event to AIOS Monitor server.
 Non-blocking with short timeout to avoid slowing Claude.
+
+Delivery modes (AIOS_MONITOR_MODE):
+- http:  POST each event to the server (default)
+- spool: append to the local spool; drain_events.py forwards it later
+
+Long-lived processes (hook daemon, drainer) reuse keep-alive connections
+from a small pool and can batch events into one POST of a JSON array.
+Bodies can be compressed (AIOS_MONITOR_ENCODING, see encoding.py).
 """
 
-import json
+import http.client
 import os
+import threading
 import time
-import urllib.request
+import urllib.parse
 from typing import Any
 
+from .encoding import JSON_HEADERS, encode_body, resolve_encoding
+
 SERVER_URL = os.environ.get("AIOS_MONITOR_URL", "http://localhost:4001")
 TIMEOUT_MS = int(os.environ.get("AIOS_MONITOR_TIMEOUT_MS", "500"))
+MODE = os.environ.get("AIOS_MONITOR_MODE", "http").lower()
+BATCH_SIZE = int(os.environ.get("AIOS_MONITOR_BATCH_SIZE", "50"))
+BATCH_AGE_MS = int(os.environ.get("AIOS_MONITOR_BATCH_AGE_MS", "200"))
+POOL_SIZE = 4
+
+
+class ConnectionPool:
+    """Keep-alive HTTP connections to the monitor server, reused LIFO."""
+
+    def __init__(self, server_url: str = SERVER_URL, max_idle: int = POOL_SIZE):
+        parts = urllib.parse.urlsplit(server_url)
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.events_path = parts.path.rstrip("/") + "/events"
+        self.max_idle = max_idle
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def _open(self, timeout_ms: int) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=timeout_ms / 1000)
+        return http.client.HTTPConnection(self.host, self.port, timeout=timeout_ms / 1000)
+
+    def _acquire(self, timeout_ms: int) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            if self._idle:
+                conn = self._idle.pop()
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout_ms / 1000)
+                return conn, True
+        return self._open(timeout_ms), False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def post(
+        self,
+        body: bytes,
+        timeout_ms: int = TIMEOUT_MS,
+        headers: dict[str, str] | None = None,
+    ) -> int:
+        """
+        POST an encoded body to /events.
+
+        Returns:
+            HTTP status code, or 0 if the server could not be reached
+        """
+        # A pooled connection may have been closed by the server; retry once
+        for _ in range(2):
+            conn, reused = self._acquire(timeout_ms)
+            try:
+                conn.request(
+                    "POST",
+                    self.events_path,
+                    body=body,
+                    headers=headers or JSON_HEADERS
+                )
+                response = conn.getresponse()
+                response.read()
+            except Exception:
+                conn.close()
+                if reused:
+                    continue
+                return 0
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            return response.status
+
+        return 0
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._idle:
+                conn.close()
+            self._idle.clear()
+
+
+_pool = ConnectionPool()
+
+# Cleared once the server rejects an array body (pre-batching server)
+_batch_supported = True
+
+# Reset to json once the server rejects the configured encoding
+_encoding = resolve_encoding()
+
+
+def build_event(event_type: str, data: dict[str, Any]) -> dict[str, Any]:
+    """Wrap hook data in the /events envelope."""
+    return {
+        "type": event_type,
+        "timestamp": int(time.time() * 1000),
+        "data": data
+    }
+
+
+def _post_value(value: Any, timeout_ms: int) -> int:
+    """
+    Encode and POST an event or array of events.
+
+    Returns:
+        HTTP status code, 0 if unreachable, -1 if the value is not serializable
+    """
+    global _encoding
+
+    try:
+        body, headers = encode_body(value, _encoding)
+    except (TypeError, ValueError):
+        return -1
+
+    status = _pool.post(body, timeout_ms, headers)
+    if _encoding != "json" and status == 415:
+        # Server cannot decode this encoding - plain JSON from now on
+        _encoding = "json"
+        body, headers = encode_body(value)
+        status = _pool.post(body, timeout_ms, headers)
+    return status
+
+
+def post_event(event: dict[str, Any], timeout_ms: int = TIMEOUT_MS) -> bool:
+    """POST a single event envelope over a pooled connection."""
+    return 200 <= _post_value(event, timeout_ms) < 300
+
+
+def post_events(events: list[dict[str, Any]], timeout_ms: int = TIMEOUT_MS) -> int:
+    """
+    POST a batch of event envelopes as one JSON array.
+
+    Falls back to one POST per event if the server does not accept arrays.
+
+    Returns:
+        Number of events from the start of the batch that were accepted
+    """
+    global _batch_supported
+
+    if not events:
+        return 0
+
+    if _batch_supported and len(events) > 1:
+        status = _post_value(events, timeout_ms)
+        if 200 <= status < 300:
+            return len(events)
+        if status not in (400, -1):
+            return 0
+        if status == 400:
+            _batch_supported = False
+
+    accepted = 0
+    for event in events:
+        if not post_event(event, timeout_ms):
+            break
+        accepted += 1
+    return accepted
+
+
+class EventBatcher:
+    """
+    Buffers events and posts them as arrays.
+
+    A batch is flushed when it reaches `max_size` events or when its oldest
+    event is `max_age_ms` old, whichever comes first.
+    """
+
+    def __init__(self, max_size: int = BATCH_SIZE, max_age_ms: int = BATCH_AGE_MS):
+        self.max_size = max(1, max_size)
+        self.max_age_ms = max(1, max_age_ms)
+        self._events: list[dict[str, Any]] = []
+        self._oldest = 0.0
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def add(self, event: dict[str, Any]) -> None:
+        with self._lock:
+            if not self._events:
+                self._oldest = time.monotonic()
+            self._events.append(event)
+            full = len(self._events) >= self.max_size
+        if full:
+            self.flush()
+        else:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Send everything buffered. Returns the number of events accepted."""
+        with self._send_lock:
+            with self._lock:
+                batch, self._events = self._events, []
+            return post_events(batch) if batch else 0
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait()
+            self._wake.clear()
+            with self._lock:
+                if not self._events:
+                    continue
+                remaining = self.max_age_ms / 1000 - (time.monotonic() - self._oldest)
+            if remaining > 0:
+                time.sleep(remaining)
+            self.flush()
+
+    def close(self) -> None:
+        self._closed = True
+        self._wake.set()
+        self.flush()
+
+
+_batcher: EventBatcher | None = None
+
+
+def enable_batching(max_size: int = BATCH_SIZE, max_age_ms: int = BATCH_AGE_MS) -> EventBatcher:
+    """Batch HTTP sends from this process (for long-lived processes only)."""
+    global _batcher
+    if _batcher is None:
+        _batcher = EventBatcher(max_size, max_age_ms)
+    return _batcher
 
 
 def send_event(event_type: str, data: dict[str, Any]) -> bool:
@@ -23,25 +261,21 @@ def send_event(event_type: str, data: dict[str, Any]) -> bool:
         data: Event data from Claude hook
 
     Returns:
-        True if sent successfully, False otherwise
+        True if sent (or spooled/queued) successfully, False otherwise
     """
-    try:
-        payload = json.dumps({
-            "type": event_type,
-            "timestamp": int(time.time() * 1000),
-            "data": data
-        }).encode("utf-8")
-
-        req = urllib.request.Request(
-            f"{SERVER_URL}/events",
-            data=payload,
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
-
-        urllib.request.urlopen(req, timeout=TIMEOUT_MS / 1000)
+    event = build_event(event_type, data)
+
+    if MODE == "spool":
+        try:
+            from .spool import append_event
+            return append_event(event)
+        except Exception:
+            # Spool unavailable - fall through to a direct send
+            pass
+
+    if _batcher is not None:
+        _batcher.add(event)
         return True
 
-    except Exception:
-        # Silent fail - never block Claude
-        return False
+    # Silent fail - never block Claude
+    return post_event(event)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Local append-only event spool.
+
+Hooks append one JSON line per event to the active spool file, which costs a
+single write() instead of an HTTP round trip. A separate drainer
+(drain_events.py) claims the active file by renaming it to a segment and
+forwards the events to the monitor server. A segment is only deleted once
+every event in it was accepted, so nothing is lost across restarts.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+SPOOL_DIR = Path(os.environ.get(
+    "AIOS_MONITOR_SPOOL_DIR",
+    str(Path.home() / ".aios" / "monitor" / "spool")
+))
+ACTIVE_FILE = "events.jsonl"
+SEGMENT_PREFIX = "segment-"
+LOCK_FILE = "drain.lock"
+
+
+def _lock(fd: int, mode: int) -> None:
+    if HAS_FCNTL:
+        fcntl.flock(fd, mode)
+
+
+def append_event(event: dict[str, Any], spool_dir: Path = SPOOL_DIR) -> bool:
+    """
+    Append a single event to the active spool file.
+
+    Writers hold a shared lock while writing; the drainer takes an exclusive
+    lock on a claimed segment, so a write that raced with the rename is
+    retried against the new active file instead of being dropped.
+    """
+    line = (json.dumps(event, separators=(",", ":")) + "\n").encode("utf-8")
+    path = spool_dir / ACTIVE_FILE
+
+    for _ in range(3):
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        except FileNotFoundError:
+            spool_dir.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+
+        try:
+            _lock(fd, fcntl.LOCK_SH if HAS_FCNTL else 0)
+            # The drainer may have claimed this inode between open() and lock()
+            try:
+                current = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if os.fstat(fd).st_ino != current.st_ino:
+                continue
+            os.write(fd, line)
+            return True
+        finally:
+            os.close(fd)
+
+    return False
+
+
+def claim_active(spool_dir: Path = SPOOL_DIR) -> Path | None:
+    """Rename the active spool file to a new segment (drainer only)."""
+    active = spool_dir / ACTIVE_FILE
+    if not active.exists() or active.stat().st_size == 0:
+        return None
+
+    segment = spool_dir / f"{SEGMENT_PREFIX}{time.time_ns():020d}-{os.getpid()}.jsonl"
+    try:
+        os.rename(active, segment)
+    except FileNotFoundError:
+        return None
+    return segment
+
+
+def pending_segments(spool_dir: Path = SPOOL_DIR) -> list[Path]:
+    """Claimed segments waiting to be drained, oldest first."""
+    if not spool_dir.exists():
+        return []
+    return sorted(spool_dir.glob(f"{SEGMENT_PREFIX}*.jsonl"))
+
+
+def read_segment(segment: Path) -> Iterator[dict[str, Any]]:
+    """Yield events from a segment, skipping torn or corrupt lines."""
+    with open(segment, "rb") as f:
+        for raw in f:
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                yield json.loads(raw)
+            except ValueError:
+                continue
+
+
+def drain(
+    forward: Callable[[list[dict[str, Any]]], int],
+    batch_size: int = 100,
+    spool_dir: Path = SPOOL_DIR,
+) -> tuple[int, int]:
+    """
+    Forward all spooled events.
+
+    Args:
+        forward: Callable that sends a batch and returns how many events
+            from the start of the batch were accepted
+        batch_size: Events handed to `forward` per call
+        spool_dir: Spool directory
+
+    Returns:
+        (sent, remaining) event counts
+    """
+    spool_dir.mkdir(parents=True, exist_ok=True)
+    lock_fd = os.open(spool_dir / LOCK_FILE, os.O_WRONLY | os.O_CREAT, 0o600)
+    try:
+        if HAS_FCNTL:
+            try:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                # Another drainer is running
+                return 0, 0
+
+        claim_active(spool_dir)
+
+        sent = 0
+        for segment in pending_segments(spool_dir):
+            seg_sent, remaining = _drain_segment(segment, forward, batch_size)
+            sent += seg_sent
+            if remaining:
+                return sent, remaining + _count_pending(spool_dir, after=segment)
+        return sent, 0
+    finally:
+        os.close(lock_fd)
+
+
+def _drain_segment(
+    segment: Path,
+    forward: Callable[[list[dict[str, Any]]], int],
+    batch_size: int,
+) -> tuple[int, int]:
+    fd = os.open(segment, os.O_RDWR)
+    try:
+        # Wait for writers that opened the file before it was claimed
+        _lock(fd, fcntl.LOCK_EX if HAS_FCNTL else 0)
+
+        events = list(read_segment(segment))
+        sent = 0
+        while sent < len(events):
+            batch = events[sent:sent + batch_size]
+            accepted = forward(batch)
+            sent += accepted
+            if accepted < len(batch):
+                break
+
+        if sent >= len(events):
+            segment.unlink()
+            return sent, 0
+
+        # Keep the unsent tail for the next run
+        tmp = segment.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            for event in events[sent:]:
+                f.write((json.dumps(event, separators=(",", ":")) + "\n").encode("utf-8"))
+        os.replace(tmp, segment)
+        return sent, len(events) - sent
+    finally:
+        os.close(fd)
+
+
+def _count_pending(spool_dir: Path, after: Path) -> int:
+    count = 0
+    for segment in pending_segments(spool_dir):
+        if segment.name > after.name:
+            count += sum(1 for _ in read_segment(segment))
+    return count
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON reader with bounded memory.
+
+Parses a JSON document from a binary stream in fixed-size chunks. Long
+strings are truncated while they are read (the rest is skipped, never
+buffered), at any nesting depth, and once the total kept size reaches a
+budget further nested values are skipped. Memory stays bounded by the chunk size
+plus the kept payload, no matter how large the hook input is.
+"""
+
+import codecs
+import json
+import os
+import re
+from typing import Any, BinaryIO
+
+CHUNK_SIZE = 64 * 1024
+MAX_STRING = int(os.environ.get("AIOS_MONITOR_MAX_STRING", "1000"))
+MAX_PAYLOAD = int(os.environ.get("AIOS_MONITOR_MAX_PAYLOAD", str(256 * 1024)))
+MAX_DEPTH = 64
+TRUNCATED_SUFFIX = "...[truncated]"
+
+_WS = re.compile(rb"[ \t\n\r]*")
+_STRING_RUN = re.compile(rb'[^"\\]*')
+_NUMBER = re.compile(rb"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?")
+_NUMBER_CHARS = re.compile(rb"[0-9+\-.eE]*")
+_HEX4 = re.compile(rb"[0-9a-fA-F]{4}")
+_ESCAPES = {
+    b'"': '"', b"\\": "\\", b"/": "/",
+    b"b": "\b", b"f": "\f", b"n": "\n", b"r": "\r", b"t": "\t",
+}
+_LITERALS = {b"t": (b"true", True), b"f": (b"false", False), b"n": (b"null", None)}
+# json.loads(bytes) decodes with "surrogatepass"; match it
+_utf8_decoder = codecs.getincrementaldecoder("utf-8")
+
+
+class StreamingJSONReader:
+    """
+    Single-use reader for one JSON document.
+
+    Attributes:
+        truncated: True if any string was cut or any value dropped
+        member_sizes: raw byte size of each top-level object member's value
+            (measured before truncation)
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        max_string: int = MAX_STRING,
+        max_payload: int = MAX_PAYLOAD,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        self.stream = stream
+        self.max_string = max_string
+        self.remaining = max_payload
+        self.chunk_size = chunk_size
+        self.truncated = False
+        self.member_sizes: dict[str, int] = {}
+        self._buf = b""
+        self._pos = 0
+        # Stream offset of self._buf[0]
+        self._base = 0
+        self._eof = False
+
+    # ── buffer ────────────────────────────────────────────────────────────
+
+    def _fill(self) -> bool:
+        """Read another chunk, keeping unread bytes. False at end of stream."""
+        if self._eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._base += self._pos
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> bytes:
+        while self._pos >= len(self._buf):
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON input")
+        return self._buf[self._pos:self._pos + 1]
+
+    def _skip_ws(self) -> bytes:
+        while True:
+            self._pos = _WS.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf) or not self._fill():
+                break
+        return self._peek()
+
+    def _expect(self, char: bytes) -> None:
+        if self._skip_ws() != char:
+            raise ValueError(f"Expected {char!r} at offset {self._pos}")
+        self._pos += 1
+
+    # ── values ────────────────────────────────────────────────────────────
+
+    def read(self) -> Any:
+        """Parse the document. Raises ValueError on malformed input."""
+        value = self._value(keep=True, depth=0)
+        # Only whitespace may follow the document
+        while True:
+            self._pos = _WS.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                raise ValueError("Extra data after JSON document")
+            if not self._fill():
+                return value
+
+    def _value(self, keep: bool, depth: int) -> Any:
+        if depth > MAX_DEPTH:
+            raise ValueError("JSON nesting too deep")
+
+        char = self._skip_ws()
+        if char == b"{":
+            return self._object(keep, depth)
+        if char == b"[":
+            return self._array(keep, depth)
+        if char == b'"':
+            return self._string(keep)
+        if char in _LITERALS:
+            return self._literal(*_LITERALS[char], keep)
+        return self._number(keep)
+
+    def _charge(self, size: int) -> bool:
+        """Spend payload budget; False once it is exhausted."""
+        if self.remaining <= 0:
+            self.truncated = True
+            return False
+        self.remaining -= size
+        return True
+
+    def _object(self, keep: bool, depth: int) -> dict[str, Any] | None:
+        self._pos += 1
+        result: dict[str, Any] = {}
+        if self._skip_ws() == b"}":
+            self._pos += 1
+            return result if keep else None
+
+        while True:
+            if self._skip_ws() != b'"':
+                raise ValueError(f"Expected object key at offset {self._pos}")
+            # Top-level fields (session_id, tool_name, ...) are always kept
+            keep_item = keep and (depth == 0 or self._charge(0))
+            key = self._string(keep_item)
+            self._expect(b":")
+            self._skip_ws()
+            start = self._base + self._pos
+            value = self._value(keep_item, depth + 1)
+            if keep_item:
+                result[key] = value
+                if depth == 0:
+                    self.member_sizes[key] = self._base + self._pos - start
+
+            char = self._skip_ws()
+            self._pos += 1
+            if char == b"}":
+                return result if keep else None
+            if char != b",":
+                raise ValueError(f"Expected ',' or '}}' at offset {self._pos - 1}")
+
+    def _array(self, keep: bool, depth: int) -> list[Any] | None:
+        self._pos += 1
+        result: list[Any] = []
+        if self._skip_ws() == b"]":
+            self._pos += 1
+            return result if keep else None
+
+        while True:
+            keep_item = keep and self._charge(0)
+            value = self._value(keep_item, depth + 1)
+            if keep_item:
+                result.append(value)
+
+            char = self._skip_ws()
+            self._pos += 1
+            if char == b"]":
+                return result if keep else None
+            if char != b",":
+                raise ValueError(f"Expected ',' or ']' at offset {self._pos - 1}")
+
+    def _literal(self, token: bytes, value: Any, keep: bool) -> Any:
+        while len(self._buf) - self._pos < len(token) and self._fill():
+            pass
+        if self._buf[self._pos:self._pos + len(token)] != token:
+            raise ValueError(f"Invalid literal at offset {self._pos}")
+        self._pos += len(token)
+        if keep:
+            self._charge(len(token))
+        return value
+
+    def _number(self, keep: bool) -> int | float | None:
+        # Make sure the number is not split across chunks
+        while _NUMBER_CHARS.match(self._buf, self._pos).end() >= len(self._buf):
+            if not self._fill():
+                break
+        token_end = _NUMBER_CHARS.match(self._buf, self._pos).end()
+        match = _NUMBER.match(self._buf, self._pos)
+        if not match or match.end() == self._pos or match.end() != token_end:
+            raise ValueError(f"Invalid value at offset {self._pos}")
+        self._pos = match.end()
+        if not keep:
+            return None
+        self._charge(match.end() - match.start())
+        return json.loads(match.group())
+
+    def _string(self, keep: bool) -> str | None:
+        """Read a string, keeping at most max_string decoded characters of it."""
+        self._pos += 1
+        budget = self.max_string if keep else 0
+        decoder = _utf8_decoder("surrogatepass")
+        parts: list[str] = []
+        size = 0
+        cut = False
+        # A kept \uD800-\uDBFF escape waiting for its low half
+        high = None
+
+        while True:
+            end = _STRING_RUN.match(self._buf, self._pos).end()
+            if end > self._pos:
+                high = None
+                if size < budget:
+                    piece = decoder.decode(self._buf[self._pos:end])
+                    if size + len(piece) > budget:
+                        piece = piece[:budget - size]
+                        cut = True
+                    parts.append(piece)
+                    size += len(piece)
+                elif keep:
+                    cut = True
+                self._pos = end
+
+            if self._pos >= len(self._buf):
+                if not self._fill():
+                    raise ValueError("Unterminated string")
+                continue
+
+            if self._buf[self._pos:self._pos + 1] == b'"':
+                self._pos += 1
+                break
+
+            # Backslash escape: \uXXXX is 6 bytes, the others 2
+            while len(self._buf) - self._pos < 2:
+                if not self._fill():
+                    raise ValueError("Unterminated string")
+            kind = self._buf[self._pos + 1:self._pos + 2]
+            if not keep:
+                # Skipped strings only need the escaped quote or backslash consumed
+                self._pos += 2
+                continue
+
+            if kind != b"u":
+                if kind not in _ESCAPES:
+                    raise ValueError(f"Invalid escape at offset {self._base + self._pos}")
+                self._pos += 2
+                high = None
+                if size < budget:
+                    parts.append(_ESCAPES[kind])
+                    size += 1
+                else:
+                    cut = True
+                continue
+
+            while len(self._buf) - self._pos < 6:
+                if not self._fill():
+                    raise ValueError("Unterminated string")
+            if not _HEX4.fullmatch(self._buf, self._pos + 2, self._pos + 6):
+                raise ValueError(f"Invalid \\u escape at offset {self._base + self._pos}")
+            code = int(self._buf[self._pos + 2:self._pos + 6], 16)
+            self._pos += 6
+
+            if high is not None and 0xDC00 <= code <= 0xDFFF:
+                # Second half of a surrogate pair: still one character
+                parts[-1] = chr(0x10000 + ((high - 0xD800) << 10) + (code - 0xDC00))
+                high = None
+            elif size < budget:
+                parts.append(chr(code))
+                size += 1
+                high = code if 0xD800 <= code <= 0xDBFF else None
+            else:
+                high = None
+                cut = True
+
+        if not keep:
+            return None
+
+        if not cut:
+            # Raises on a UTF-8 sequence left incomplete at the closing quote
+            parts.append(decoder.decode(b"", final=True))
+        text = "".join(parts)
+
+        if cut:
+            # A high surrogate whose pair was cut off can't be encoded on send
+            if text and "\ud800" <= text[-1] <= "\udbff":
+                text = text[:-1]
+            text += TRUNCATED_SUFFIX
+            self.truncated = True
+
+        self._charge(len(text))
+        return text
+
+
+def load_truncated(
+    stream: BinaryIO,
+    max_string: int = MAX_STRING,
+    max_payload: int = MAX_PAYLOAD,
+) -> tuple[Any, bool]:
+    """
+    Parse a JSON document from a binary stream with bounded memory.
+
+    Returns:
+        (value, truncated) - truncated is True if anything was cut or dropped
+    """
+    reader = StreamingJSONReader(stream, max_string, max_payload)
+    value = reader.read()
+    return value, reader.truncated
@@ -3,26 +3,18 @@
 SubagentStop hook - captures when a subagent (Task tool) stops.
 """
 
-import json
-import sys
 import os
+import sys
 
 # Add lib to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from lib.send_event import send_event
-from lib.enrich import enrich_event
+from lib.client import run_hook
 
 
 def main():
-    # Read event from stdin
-    data = json.load(sys.stdin)
-
-    # Enrich with AIOS context
-    data = enrich_event(data)
-
-    # Send to monitor server
-    send_event("SubagentStop", data)
+    # Hand stdin to the hook daemon (processed in-process if it is not running)
+    run_hook("SubagentStop")
 
 
 if __name__ == "__main__":
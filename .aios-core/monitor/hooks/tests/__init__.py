@@ -0,0 +1 @@
+# Tests for AIOS monitor hooks
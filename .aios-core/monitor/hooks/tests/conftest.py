@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for monitor hook tests
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Hooks import their helpers as the `lib` package
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib import send_event
+from lib.send_event import ConnectionPool
+from tests.stub_server import StubServer
+
+
+@pytest.fixture
+def stub_server():
+    """A running StubServer that accepts batches"""
+    with StubServer() as server:
+        yield server
+
+
+@pytest.fixture
+def sender(monkeypatch):
+    """
+    send_event pointed at a server: call it with a StubServer.
+
+    Resets the per-process state (pool, batch support, encoding) that
+    send_event keeps in module globals.
+    """
+    pools = []
+
+    def point_at(server, encoding="json"):
+        pool = ConnectionPool(server.url)
+        pools.append(pool)
+        monkeypatch.setattr(send_event, "_pool", pool)
+        monkeypatch.setattr(send_event, "_batch_supported", True)
+        monkeypatch.setattr(send_event, "_encoding", encoding)
+        return send_event
+
+    yield point_at
+    for pool in pools:
+        pool.close()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the monitor server's POST /events endpoint.
+
+Used by the hook tests and benchmark_hooks.py to check delivery without running
+the Bun server. Accepts a single envelope or a batched array over
+keep-alive connections, plain or gzip/zstd-compressed (like the server,
+anything else gets a 415); received envelopes are kept in memory. With
+accept_batches=False it answers arrays with 400, like a pre-batching server.
+"""
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+
+class _EventsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; avoid delayed-ACK stalls
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", "0"))
+        body = self.rfile.read(length)
+
+        if self.path.rstrip("/").endswith("/events"):
+            encoding = self.headers.get("Content-Encoding", "identity").lower()
+            if "msgpack" in self.headers.get("Content-Type", "") or \
+                    encoding not in self.server.encodings:
+                self._reply(415, b'{"error":"Unsupported encoding"}')
+                return
+
+            try:
+                if encoding == "gzip":
+                    body = gzip.decompress(body)
+                elif encoding == "zstd":
+                    body = zstandard.ZstdDecompressor().decompress(body)
+                payload = json.loads(body)
+            except Exception:
+                # Malformed JSON or compressed data
+                self._reply(400, b'{"error":"Invalid payload"}')
+                return
+
+            if isinstance(payload, list) and not self.server.accept_batches:
+                self._reply(400, b'{"error":"Invalid event"}')
+                return
+            self.server.record(payload, length)
+            self._reply(200, b'{"ok":true}')
+        else:
+            self._reply(404, b"Not found")
+
+    def _reply(self, status: int, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """In-process /events server. Use as a context manager."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        encodings: tuple[str, ...] | None = None,
+        accept_batches: bool = True,
+    ):
+        super().__init__((host, port), _EventsHandler)
+        self.accept_batches = accept_batches
+        self.encodings = encodings or ("identity", "gzip", *(("zstd",) if HAS_ZSTD else ()))
+        self.events: list[dict[str, Any]] = []
+        self.requests = 0
+        self.wire_bytes = 0
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, payload: Any, wire_bytes: int = 0) -> None:
+        with self._lock:
+            self.requests += 1
+            self.wire_bytes += wire_bytes
+            if isinstance(payload, list):
+                self.events.extend(payload)
+            else:
+                self.events.append(payload)
+
+    def start(self) -> "StubServer":
+        # Short poll so stop() returns quickly
+        self._thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Stand-in /events server")
+    parser.add_argument("--port", type=int, default=4001)
+    args = parser.parse_args()
+
+    server = StubServer(port=args.port)
+    print(f"Stub monitor server on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
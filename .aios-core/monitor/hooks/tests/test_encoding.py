@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for encoding.py body encodings and the 415 fallback in send_event.py
+Run with: pytest .aios-core/monitor/hooks/tests/test_encoding.py -v
+"""
+
+import gzip
+import json
+
+import pytest
+
+from lib.encoding import HAS_ZSTD, available_encodings, encode_body, resolve_encoding
+from lib.send_event import build_event
+from tests.stub_server import StubServer
+
+
+class TestEncodeBody:
+    """Tests for encode_body round trips"""
+
+    def test_json_round_trip(self):
+        """Plain JSON needs no Content-Encoding"""
+        event = build_event("Stop", {"text": "olá"})
+        body, headers = encode_body(event, "json")
+
+        assert json.loads(body) == event
+        assert headers == {"Content-Type": "application/json"}
+
+    def test_gzip_round_trip(self):
+        """gzip bodies decompress to the same JSON"""
+        events = [build_event("PreToolUse", {"n": i}) for i in range(10)]
+        body, headers = encode_body(events, "gzip")
+
+        assert json.loads(gzip.decompress(body)) == events
+        assert headers["Content-Encoding"] == "gzip"
+
+    @pytest.mark.skipif(not HAS_ZSTD, reason="zstandard not installed")
+    def test_zstd_round_trip(self):
+        """zstd bodies decompress to the same JSON"""
+        import zstandard
+
+        event = build_event("Stop", {})
+        body, headers = encode_body(event, "zstd")
+
+        assert json.loads(zstandard.ZstdDecompressor().decompress(body)) == event
+        assert headers["Content-Encoding"] == "zstd"
+
+    def test_unknown_encoding_falls_back_to_json(self):
+        """Unavailable encodings (msgpack included) resolve to json"""
+        assert resolve_encoding("brotli") == "json"
+        assert resolve_encoding("msgpack") == "json"
+        assert "msgpack" not in available_encodings()
+
+    def test_unserializable_value_raises(self):
+        """Values JSON can't encode raise TypeError"""
+        with pytest.raises(TypeError):
+            encode_body({"bad": object()}, "gzip")
+
+
+class TestEncodingFallback:
+    """Tests for send_event switching back to JSON"""
+
+    def test_gzip_is_accepted(self, stub_server, sender):
+        """A server that accepts gzip keeps getting gzip"""
+        send_event = sender(stub_server, encoding="gzip")
+        event = build_event("Stop", {})
+
+        assert send_event.post_event(event)
+        assert stub_server.events == [event]
+        assert send_event._encoding == "gzip"
+
+    def test_falls_back_to_json_on_415(self, sender):
+        """A 415 resends the body as JSON and keeps JSON from then on"""
+        with StubServer(encodings=("identity",)) as server:
+            send_event = sender(server, encoding="gzip")
+            first, second = build_event("Stop", {"n": 1}), build_event("Stop", {"n": 2})
+
+            assert send_event.post_event(first)
+            assert send_event._encoding == "json"
+            assert send_event.post_event(second)
+            assert server.events == [first, second]
+            # The rejected gzip body was not recorded
+            assert server.requests == 2
+
+    def test_400_keeps_encoding(self, sender):
+        """A rejected batch (400) is not mistaken for an unsupported encoding"""
+        with StubServer(accept_batches=False) as server:
+            send_event = sender(server, encoding="gzip")
+            events = [build_event("PreToolUse", {"n": i}) for i in range(3)]
+
+            assert send_event.post_events(events) == 3
+            assert send_event._batch_supported is False
+            assert send_event._encoding == "gzip"
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for hook_daemon.py startup
+Run with: pytest .aios-core/monitor/hooks/tests/test_hook_daemon.py -v
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+import hook_daemon
+from lib.client import connect_daemon
+
+HOOKS_DIR = Path(__file__).parent.parent
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="unix sockets not available")
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to ~100 bytes; pytest's tmp_path can be longer
+    with tempfile.TemporaryDirectory(prefix="aios-") as tmp:
+        yield os.path.join(tmp, "hooks.sock")
+
+
+def start_daemon(socket_path):
+    env = {**os.environ, "AIOS_MONITOR_URL": "http://127.0.0.1:9"}
+    return subprocess.Popen(
+        [sys.executable, str(HOOKS_DIR / "hook_daemon.py"), "--socket", socket_path],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+
+
+def wait_for_daemon(socket_path, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        sock = connect_daemon(socket_path)
+        if sock is not None:
+            sock.close()
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class TestStartup:
+    """Tests for socket handling when the daemon starts"""
+
+    def test_socket_in_use(self, socket_path):
+        """A listening socket is in use; a missing path is not"""
+        assert not hook_daemon.socket_in_use(socket_path)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen()
+        try:
+            assert hook_daemon.socket_in_use(socket_path)
+        finally:
+            server.close()
+
+        # Closed without unlinking: the file is left behind, nobody listens
+        assert os.path.exists(socket_path)
+        assert not hook_daemon.socket_in_use(socket_path)
+
+    def test_replaces_stale_socket(self, socket_path):
+        """A socket file left by a dead daemon is removed and rebound"""
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+
+        daemon = start_daemon(socket_path)
+        try:
+            assert wait_for_daemon(socket_path)
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+    def test_second_daemon_leaves_running_one_alone(self, socket_path):
+        """Starting a second daemon exits instead of taking the socket"""
+        first = start_daemon(socket_path)
+        try:
+            assert wait_for_daemon(socket_path)
+
+            second = start_daemon(socket_path)
+            _, stderr = second.communicate(timeout=10)
+
+            assert second.returncode == 1
+            assert b"Already running" in stderr
+            assert first.poll() is None
+            assert wait_for_daemon(socket_path, timeout=1)
+        finally:
+            first.terminate()
+            first.wait()
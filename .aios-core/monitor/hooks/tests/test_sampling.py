@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for sampling.py policy merging, rate limits and state handling
+Run with: pytest .aios-core/monitor/hooks/tests/test_sampling.py -v
+"""
+
+import pytest
+
+from lib import sampling
+
+
+@pytest.fixture
+def policy(tmp_path, monkeypatch):
+    """Point sampling at a temp state file; call with policy overrides."""
+    monkeypatch.setattr(sampling, "STATE_FILE", tmp_path / "state.json")
+    monkeypatch.setattr(sampling, "PENDING_FILE", tmp_path / "state.json.pending")
+
+    def use(overrides=None):
+        merged = sampling.merge_policy(sampling.DEFAULT_POLICY, {"enabled": True, **(overrides or {})})
+        monkeypatch.setattr(sampling, "_policy", merged)
+        return merged
+
+    return use
+
+
+def tool_call(tool_use_id):
+    return {"session_id": "s1", "tool_use_id": tool_use_id}
+
+
+class TestMergePolicy:
+    """Tests for merging overrides over the defaults"""
+
+    def test_nested_entries_are_merged(self):
+        """Overriding one rate limit keeps the others"""
+        base = {"rate_limits": {"PreToolUse": {"per_second": 1}, "PostToolUse": {"per_second": 2}}}
+        merged = sampling.merge_policy(base, {"rate_limits": {"PostToolUse": {"per_second": 5}}})
+
+        assert merged["rate_limits"] == {
+            "PreToolUse": {"per_second": 1},
+            "PostToolUse": {"per_second": 5},
+        }
+
+    def test_defaults_are_not_mutated(self):
+        """Merging copies the default dicts"""
+        sampling.merge_policy(sampling.DEFAULT_POLICY, {"rates": {"PreToolUse": 0.5}})
+
+        assert sampling.DEFAULT_POLICY["rates"] == {}
+
+
+class TestCheckEvent:
+    """Tests for check_event decisions and state handling"""
+
+    def test_default_policy_never_touches_state(self, policy):
+        """Without limits or rates, kept events create no state file"""
+        policy()
+
+        for i in range(5):
+            assert sampling.check_event("PreToolUse", tool_call(f"t{i}")) == (True, None)
+            assert sampling.check_event("Stop", {}) == (True, None)
+
+        assert not sampling.STATE_FILE.exists()
+
+    def test_pair_shares_rate_limit_decision(self, policy):
+        """PostToolUse follows the decision made for its PreToolUse"""
+        policy({"rate_limits": {"PreToolUse": {"per_second": 0.001, "burst": 1}}})
+
+        assert sampling.check_event("PreToolUse", tool_call("a"))[0] is True
+        assert sampling.check_event("PreToolUse", tool_call("b"))[0] is False
+        # The bucket is empty, but both halves still match their Pre
+        assert sampling.check_event("PostToolUse", tool_call("a"))[0] is True
+        assert sampling.check_event("PostToolUse", tool_call("b"))[0] is False
+
+    def test_drop_marks_pending_summary(self, policy):
+        """The first drop creates the pending marker"""
+        policy({"rates": {"PreToolUse": 0}})
+
+        assert sampling.check_event("PreToolUse", tool_call("a")) == (False, None)
+        assert sampling.PENDING_FILE.exists()
+
+    def test_kept_event_emits_due_summary(self, policy):
+        """A kept event reports drops once the interval has passed"""
+        active = policy({"rates": {"PreToolUse": 0}})
+
+        assert sampling.check_event("PreToolUse", tool_call("a")) == (False, None)
+        active["summary_interval_s"] = 0
+        keep, summary = sampling.check_event("Stop", {"session_id": "s1"})
+
+        assert keep is True
+        assert summary["dropped"] == {"PreToolUse": {"sampled": 1}}
+        assert not sampling.PENDING_FILE.exists()
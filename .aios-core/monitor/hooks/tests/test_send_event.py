@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Tests for send_event.py batching and connection pooling
+Run with: pytest .aios-core/monitor/hooks/tests/test_send_event.py -v
+"""
+
+import socket
+import time
+
+import pytest
+
+from lib.send_event import EventBatcher, build_event
+from tests.stub_server import StubServer
+
+
+def make_events(count):
+    return [build_event("PreToolUse", {"n": i}) for i in range(count)]
+
+
+class TestConnectionPool:
+    """Tests for ConnectionPool keep-alive reuse"""
+
+    def test_post_returns_status(self, stub_server, sender):
+        """A valid body is accepted"""
+        send_event = sender(stub_server)
+
+        assert send_event._pool.post(b'{"type":"Stop","data":{}}') == 200
+        assert stub_server.events == [{"type": "Stop", "data": {}}]
+
+    def test_connection_is_reused(self, stub_server, sender):
+        """Consecutive posts go over one pooled connection"""
+        send_event = sender(stub_server)
+
+        send_event.post_event(build_event("Stop", {}))
+        conn = send_event._pool._idle[-1]
+        send_event.post_event(build_event("Stop", {}))
+
+        assert send_event._pool._idle == [conn]
+        assert stub_server.requests == 2
+
+    def test_unreachable_server_returns_zero(self, sender):
+        """Connection failures report status 0 instead of raising"""
+        server = StubServer()
+        send_event = sender(server)
+        server.server_close()
+
+        assert send_event._pool.post(b"{}", timeout_ms=200) == 0
+
+    def test_reconnects_after_server_closed_connection(self, stub_server, sender):
+        """A pooled connection closed by the server is replaced transparently"""
+        send_event = sender(stub_server)
+        send_event.post_event(build_event("Stop", {}))
+        send_event._pool._idle[-1].sock.shutdown(socket.SHUT_RDWR)
+
+        assert send_event.post_event(build_event("Stop", {"again": True}))
+        assert len(stub_server.events) == 2
+
+
+class TestPostEvents:
+    """Tests for post_events batch delivery"""
+
+    def test_batch_is_one_request(self, stub_server, sender):
+        """A batch goes out as one JSON array"""
+        send_event = sender(stub_server)
+        events = make_events(5)
+
+        assert send_event.post_events(events) == 5
+        assert stub_server.requests == 1
+        assert stub_server.events == events
+
+    def test_empty_batch(self, stub_server, sender):
+        """Nothing to send makes no request"""
+        send_event = sender(stub_server)
+
+        assert send_event.post_events([]) == 0
+        assert stub_server.requests == 0
+
+    def test_falls_back_to_single_posts_on_400(self, sender):
+        """A server that rejects arrays gets one POST per event"""
+        with StubServer(accept_batches=False) as server:
+            send_event = sender(server)
+            events = make_events(3)
+
+            assert send_event.post_events(events) == 3
+            assert server.events == events
+            assert server.requests == 3
+            assert send_event._batch_supported is False
+
+    def test_fallback_is_remembered(self, sender):
+        """After one rejected array, later batches skip the array attempt"""
+        with StubServer(accept_batches=False) as server:
+            send_event = sender(server)
+            send_event.post_events(make_events(2))
+            server.requests = 0
+
+            assert send_event.post_events(make_events(2)) == 2
+            assert server.requests == 2
+
+    def test_unserializable_event_is_not_sent(self, stub_server, sender):
+        """An event that can't be encoded stops the batch there"""
+        send_event = sender(stub_server)
+        events = make_events(1) + [build_event("Stop", {"bad": object()})]
+
+        assert send_event.post_events(events) == 1
+        assert stub_server.events == events[:1]
+        assert send_event._batch_supported is True
+
+
+class TestEventBatcher:
+    """Tests for EventBatcher size/age flushing"""
+
+    def test_flushes_when_full(self, stub_server, sender):
+        """Reaching max_size sends the batch right away"""
+        sender(stub_server)
+        batcher = EventBatcher(max_size=3, max_age_ms=60_000)
+        try:
+            for event in make_events(3):
+                batcher.add(event)
+
+            assert stub_server.requests == 1
+            assert len(stub_server.events) == 3
+        finally:
+            batcher.close()
+
+    def test_flushes_when_old(self, stub_server, sender):
+        """A partial batch is sent once its oldest event is max_age_ms old"""
+        sender(stub_server)
+        batcher = EventBatcher(max_size=100, max_age_ms=20)
+        try:
+            batcher.add(make_events(1)[0])
+            deadline = time.monotonic() + 2
+            while not stub_server.events and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert len(stub_server.events) == 1
+        finally:
+            batcher.close()
+
+    def test_close_flushes_remaining(self, stub_server, sender):
+        """close() sends whatever is buffered"""
+        sender(stub_server)
+        batcher = EventBatcher(max_size=100, max_age_ms=60_000)
+        batcher.add(make_events(1)[0])
+        batcher.close()
+
+        assert len(stub_server.events) == 1
+
+    def test_batches_fall_back_on_old_server(self, sender):
+        """Batched events still arrive, one by one, on a pre-batching server"""
+        with StubServer(accept_batches=False) as server:
+            sender(server)
+            batcher = EventBatcher(max_size=4, max_age_ms=60_000)
+            try:
+                for event in make_events(4):
+                    batcher.add(event)
+
+                assert len(server.events) == 4
+            finally:
+                batcher.close()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Tests for spool.py appends and draining
+Run with: pytest .aios-core/monitor/hooks/tests/test_spool.py -v
+"""
+
+import json
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from lib import spool
+
+
+def append_many(spool_dir, writer, count):
+    for i in range(count):
+        spool.append_event({"writer": writer, "n": i, "pad": "x" * 512}, spool_dir)
+
+
+def collect(accept=None):
+    """A forward() that records batches, accepting at most `accept` events per call."""
+    received = []
+
+    def forward(batch):
+        taken = batch if accept is None else batch[:accept]
+        received.extend(taken)
+        return len(taken)
+
+    return forward, received
+
+
+class TestAppend:
+    """Tests for append_event"""
+
+    def test_appends_one_line_per_event(self, tmp_path):
+        """Events land in the active file as JSON lines"""
+        spool.append_event({"type": "Stop"}, tmp_path)
+        spool.append_event({"type": "Notification"}, tmp_path)
+
+        lines = (tmp_path / spool.ACTIVE_FILE).read_text().splitlines()
+        assert [json.loads(line)["type"] for line in lines] == ["Stop", "Notification"]
+
+    def test_creates_missing_spool_dir(self, tmp_path):
+        """The spool directory is created on first append"""
+        spool_dir = tmp_path / "nested" / "spool"
+
+        assert spool.append_event({"type": "Stop"}, spool_dir)
+        assert (spool_dir / spool.ACTIVE_FILE).exists()
+
+    @pytest.mark.skipif(not spool.HAS_FCNTL, reason="flock not available")
+    def test_concurrent_writers_do_not_interleave(self, tmp_path):
+        """Appends from several processes stay whole lines"""
+        # fork: children inherit the test's sys.path
+        ctx = multiprocessing.get_context("fork")
+        procs = [
+            ctx.Process(target=append_many, args=(tmp_path, w, 200))
+            for w in range(4)
+        ]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+
+        events = list(spool.read_segment(tmp_path / spool.ACTIVE_FILE))
+        assert len(events) == 800
+        for w in range(4):
+            assert [e["n"] for e in events if e["writer"] == w] == list(range(200))
+
+    def test_append_after_claim_starts_new_active_file(self, tmp_path):
+        """A write after the drainer's rename goes to a fresh active file"""
+        spool.append_event({"n": 1}, tmp_path)
+        segment = spool.claim_active(tmp_path)
+        spool.append_event({"n": 2}, tmp_path)
+
+        assert [e["n"] for e in spool.read_segment(segment)] == [1]
+        assert [e["n"] for e in spool.read_segment(tmp_path / spool.ACTIVE_FILE)] == [2]
+
+
+class TestDrain:
+    """Tests for drain and segment truncation"""
+
+    def test_drains_and_deletes_segment(self, tmp_path):
+        """Accepted events are forwarded in batches and the segment removed"""
+        for i in range(5):
+            spool.append_event({"n": i}, tmp_path)
+        forward, received = collect()
+
+        assert spool.drain(forward, batch_size=2, spool_dir=tmp_path) == (5, 0)
+        assert [e["n"] for e in received] == list(range(5))
+        assert spool.pending_segments(tmp_path) == []
+        assert not (tmp_path / spool.ACTIVE_FILE).exists()
+
+    def test_partial_accept_keeps_unsent_tail(self, tmp_path):
+        """Events the server did not accept stay in the segment for the next run"""
+        for i in range(5):
+            spool.append_event({"n": i}, tmp_path)
+
+        forward, received = collect(accept=1)
+        # Stops at the first short batch: 1 sent, 4 kept
+        assert spool.drain(forward, batch_size=2, spool_dir=tmp_path) == (1, 4)
+        [segment] = spool.pending_segments(tmp_path)
+        assert [e["n"] for e in spool.read_segment(segment)] == [1, 2, 3, 4]
+
+        forward, received = collect()
+        assert spool.drain(forward, spool_dir=tmp_path) == (4, 0)
+        assert [e["n"] for e in received] == [1, 2, 3, 4]
+
+    def test_remaining_counts_later_segments(self, tmp_path):
+        """A failed drain reports events in segments it did not reach"""
+        spool.append_event({"n": 0}, tmp_path)
+        spool.claim_active(tmp_path)
+        time.sleep(0.001)
+        spool.append_event({"n": 1}, tmp_path)
+
+        assert spool.drain(lambda batch: 0, spool_dir=tmp_path) == (0, 2)
+        assert len(spool.pending_segments(tmp_path)) == 2
+
+    def test_skips_corrupt_lines(self, tmp_path):
+        """Torn or corrupt lines are dropped instead of blocking the drain"""
+        (tmp_path / spool.ACTIVE_FILE).write_bytes(b'{"n":0}\n{"n":\n\n{"n":2}\n')
+        forward, received = collect()
+
+        assert spool.drain(forward, spool_dir=tmp_path) == (2, 0)
+        assert received == [{"n": 0}, {"n": 2}]
+
+    @pytest.mark.skipif(not spool.HAS_FCNTL, reason="flock not available")
+    def test_second_drainer_backs_off(self, tmp_path):
+        """Only one drainer runs at a time"""
+        spool.append_event({"n": 0}, tmp_path)
+        fd = os.open(tmp_path / spool.LOCK_FILE, os.O_WRONLY | os.O_CREAT, 0o600)
+        try:
+            spool.fcntl.flock(fd, spool.fcntl.LOCK_EX)
+            assert spool.drain(lambda batch: len(batch), spool_dir=tmp_path) == (0, 0)
+        finally:
+            os.close(fd)
+
+        assert (tmp_path / spool.ACTIVE_FILE).exists()
+
+    @pytest.mark.skipif(not spool.HAS_FCNTL, reason="flock not available")
+    def test_drain_waits_for_writer_holding_claimed_file(self, tmp_path):
+        """A write in progress on the claimed file is drained, not lost"""
+        spool.append_event({"n": 0}, tmp_path)
+        # A writer that opened and locked the active file before the rename
+        writer_fd = os.open(tmp_path / spool.ACTIVE_FILE, os.O_WRONLY | os.O_APPEND)
+        spool.fcntl.flock(writer_fd, spool.fcntl.LOCK_SH)
+        forward, received = collect()
+
+        drainer = threading.Thread(target=spool.drain, args=(forward,), kwargs={"spool_dir": tmp_path})
+        drainer.start()
+        time.sleep(0.1)
+        os.write(writer_fd, b'{"n":1}\n')
+        os.close(writer_fd)
+        drainer.join(timeout=5)
+
+        assert [e["n"] for e in received] == [0, 1]
+        assert spool.pending_segments(tmp_path) == []
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for stream_json.py streaming parse and truncation
+Run with: pytest .aios-core/monitor/hooks/tests/test_stream_json.py -v
+"""
+
+import io
+import json
+
+import pytest
+
+from lib.stream_json import TRUNCATED_SUFFIX, StreamingJSONReader, load_truncated
+
+DOCUMENTS = [
+    b'{}',
+    b'[]',
+    b'  {"a": 1, "b": [true, false, null], "c": {"d": -1.5e3}}  ',
+    b'{"session_id": "s1", "tool_input": {"command": "ls -la", "n": [0, 10, 2.25]}}',
+    b'"plain"',
+    b'[1, -0, 3.0E+2, "x", [[[]]], {"": ""}]',
+    '{"text": "olá, 世界 😀"}'.encode("utf-8"),
+    rb'{"esc": "quote \" slash \\ \/ \b\f\n\r\t"}',
+    rb'{"u": "\u00e9\u4e16\ud83d\ude00", "keyA": "\ud83d"}',
+    rb'{"lone": "\udc00x\ud83d"}',
+]
+
+
+def parse(raw, chunk_size, max_string=10**6, max_payload=10**7):
+    reader = StreamingJSONReader(io.BytesIO(raw), max_string, max_payload, chunk_size)
+    return reader.read(), reader.truncated
+
+
+class TestParse:
+    """Tests that the reader agrees with json.loads"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 64 * 1024])
+    @pytest.mark.parametrize("raw", DOCUMENTS)
+    def test_matches_json_loads(self, raw, chunk_size):
+        """Any chunking parses to the same value, untruncated"""
+        assert parse(raw, chunk_size) == (json.loads(raw), False)
+
+    @pytest.mark.parametrize("raw", [
+        b'{"a": 1',
+        b'{"a": "unterminated',
+        b'{"a": 1} x',
+        rb'{"a": "\x"}',
+        rb'{"a": "\u12G4"}',
+        b'{"a": "\xff"}',
+        b'{"a": "\xc3"}',
+        b'[1,]',
+        b'{"a" 1}',
+        b'tru',
+    ])
+    def test_malformed_input_raises(self, raw):
+        """Malformed documents raise ValueError, like json.loads"""
+        with pytest.raises(ValueError):
+            json.loads(raw)
+        for chunk_size in (1, 64 * 1024):
+            with pytest.raises(ValueError):
+                parse(raw, chunk_size)
+
+
+class TestTruncation:
+    """Tests for the max_string and max_payload budgets"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+    def test_raw_string_keeps_max_string_characters(self, chunk_size):
+        """Long raw UTF-8 strings keep exactly max_string characters"""
+        raw = json.dumps({"s": "é" * 5000}, ensure_ascii=False).encode("utf-8")
+
+        value, truncated = parse(raw, chunk_size, max_string=1000)
+
+        assert value == {"s": "é" * 1000 + TRUNCATED_SUFFIX}
+        assert truncated
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+    def test_escaped_string_keeps_max_string_characters(self, chunk_size):
+        """\\uXXXX escapes count as one character each, not six bytes"""
+        raw = json.dumps({"s": "é" * 5000}).encode("ascii")
+        assert b"\\u00e9" in raw
+
+        value, _ = parse(raw, chunk_size, max_string=1000)
+
+        assert value == {"s": "é" * 1000 + TRUNCATED_SUFFIX}
+
+    def test_escaped_surrogate_pairs_count_once(self):
+        """An escaped pair is one character of the budget"""
+        raw = json.dumps({"s": "😀" * 50}).encode("ascii")
+
+        value, _ = parse(raw, 64 * 1024, max_string=10)
+
+        assert value == {"s": "😀" * 10 + TRUNCATED_SUFFIX}
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64 * 1024])
+    def test_pair_straddling_the_limit_is_kept_whole(self, chunk_size):
+        """A pair whose high half is the last kept character keeps its low half"""
+        raw = rb'{"s": "ab\ud83d\ude00cd"}'
+
+        value, _ = parse(raw, chunk_size, max_string=3)
+
+        assert value == {"s": "ab😀" + TRUNCATED_SUFFIX}
+
+    @pytest.mark.parametrize("raw", [
+        rb'{"s": "ab\ud83dxyz"}',
+        rb'{"s": "ab\ud83dAyz"}',
+    ])
+    def test_cut_drops_trailing_lone_high_surrogate(self, raw):
+        """A truncated string never ends in an unpaired high surrogate"""
+        value, _ = parse(raw, 64 * 1024, max_string=3)
+
+        assert value == {"s": "ab" + TRUNCATED_SUFFIX}
+        value["s"].encode("utf-8")
+
+    def test_string_at_limit_is_not_truncated(self):
+        """A string of exactly max_string characters is kept as is"""
+        raw = json.dumps({"s": "é" * 10}).encode("ascii")
+
+        assert parse(raw, 64 * 1024, max_string=10) == ({"s": "é" * 10}, False)
+
+    def test_payload_budget_skips_nested_values(self):
+        """Once the payload budget is spent, nested values are dropped"""
+        raw = json.dumps({"tool_input": {"a": "x" * 10, "b": "y\"z" * 10}, "session_id": "s1"}).encode()
+
+        reader = StreamingJSONReader(io.BytesIO(raw), max_string=100, max_payload=20, chunk_size=4)
+        value = reader.read()
+
+        assert value == {"tool_input": {"a": "x" * 10}, "session_id": "s1"}
+        assert reader.truncated
+        assert reader.member_sizes["tool_input"] == len(json.dumps(json.loads(raw)["tool_input"]))
+
+    def test_load_truncated(self):
+        """load_truncated returns the value and the truncated flag"""
+        raw = json.dumps({"s": "x" * 20}).encode()
+
+        assert load_truncated(io.BytesIO(raw), max_string=5) == ({"s": "xxxxx" + TRUNCATED_SUFFIX}, True)
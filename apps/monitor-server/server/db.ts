@@ -90,6 +90,13 @@ export function insertEvent(event: Event): void {
   );
 }
 
+// Insert a batch of events in a single transaction
+export const insertEvents = db.transaction((events: Event[]) => {
+  for (const event of events) {
+    insertEvent(event);
+  }
+});
+
 export function getEvents(options: {
   session_id?: string;
   type?: string;
@@ -214,7 +221,8 @@ export function getStats(): Stats {
   const byTool = db
     .prepare(
       `
-    SELECT tool_name, COUNT(*) as count
+    SELECT tool_name, COUNT(*) as count,
+      AVG(duration_ms) as avg_duration_ms, MAX(duration_ms) as max_duration_ms
     FROM events
     WHERE tool_name IS NOT NULL
     GROUP BY tool_name
@@ -222,7 +230,12 @@ export function getStats(): Stats {
     LIMIT 20
   `
     )
-    .all() as { tool_name: string; count: number }[];
+    .all() as {
+    tool_name: string;
+    count: number;
+    avg_duration_ms: number | null;
+    max_duration_ms: number | null;
+  }[];
 
   const errors = db.prepare('SELECT COUNT(*) as count FROM events WHERE is_error = 1').get() as {
     count: number;
@@ -11,7 +11,7 @@ import { randomUUID } from 'crypto';
 import { existsSync, readdirSync, statSync } from 'fs';
 import { join, basename } from 'path';
 import {
-  insertEvent,
+  insertEvents,
   getEvents,
   getSessions,
   getSession,
@@ -73,6 +73,52 @@ function broadcast(event: Event) {
   }
 }
 
+// Request encodings accepted on POST /events (zstd needs a Bun build with zstd)
+const zstdDecompressSync = (
+  Bun as unknown as { zstdDecompressSync?: (data: Uint8Array) => Uint8Array }
+).zstdDecompressSync;
+const ACCEPTED_ENCODINGS = ['identity', 'gzip', ...(zstdDecompressSync ? ['zstd'] : [])];
+
+class UnsupportedEncodingError extends Error {}
+
+// Decode a POST /events body (plain, gzip or zstd JSON)
+async function readEventBody(req: Request): Promise<EventPayload | EventPayload[]> {
+  const encoding = (req.headers.get('content-encoding') || 'identity').toLowerCase();
+  const contentType = req.headers.get('content-type') || '';
+  if (contentType.includes('msgpack') || !ACCEPTED_ENCODINGS.includes(encoding)) {
+    throw new UnsupportedEncodingError(`${contentType || 'unknown type'} (${encoding})`);
+  }
+
+  if (encoding === 'identity') {
+    return (await req.json()) as EventPayload | EventPayload[];
+  }
+
+  const raw = new Uint8Array(await req.arrayBuffer());
+  const decoded = encoding === 'gzip' ? Bun.gunzipSync(raw) : zstdDecompressSync!(raw);
+  return JSON.parse(new TextDecoder().decode(decoded)) as EventPayload | EventPayload[];
+}
+
+// Build a stored event from a hook payload
+function toEvent(payload: EventPayload): Event {
+  return {
+    id: randomUUID(),
+    type: payload.type,
+    timestamp: payload.timestamp || Date.now(),
+    session_id: (payload.data.session_id as string) || 'unknown',
+    project: payload.data.project as string,
+    cwd: payload.data.cwd as string,
+    tool_name: payload.data.tool_name as string,
+    tool_input: payload.data.tool_input as Record<string, unknown>,
+    tool_result: payload.data.tool_result as string,
+    is_error: payload.data.is_error as boolean,
+    duration_ms: payload.data.duration_ms as number,
+    aios_agent: payload.data.aios_agent as string,
+    aios_story_id: payload.data.aios_story_id as string,
+    aios_task_id: payload.data.aios_task_id as string,
+    data: payload.data,
+  };
+}
+
 // Find Claude transcripts
 function findTranscripts(projectPath?: string, days?: number): string[] {
   const claudeProjectsDir = join(HOME, '.claude', 'projects');
@@ -155,50 +201,53 @@ const _server = Bun.serve({
     const headers = {
       'Access-Control-Allow-Origin': '*',
       'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-      'Access-Control-Allow-Headers': 'Content-Type',
+      'Access-Control-Allow-Headers': 'Content-Type, Content-Encoding',
     };
 
     if (req.method === 'OPTIONS') {
       return new Response(null, { headers });
     }
 
-    // API: Receive events from hooks
+    // API: Receive events from hooks (single payload or batched array)
     if (url.pathname === '/events' && req.method === 'POST') {
       try {
-        const payload = (await req.json()) as EventPayload;
-
-        const event: Event = {
-          id: randomUUID(),
-          type: payload.type,
-          timestamp: payload.timestamp || Date.now(),
-          session_id: (payload.data.session_id as string) || 'unknown',
-          project: payload.data.project as string,
-          cwd: payload.data.cwd as string,
-          tool_name: payload.data.tool_name as string,
-          tool_input: payload.data.tool_input as Record<string, unknown>,
-          tool_result: payload.data.tool_result as string,
-          is_error: payload.data.is_error as boolean,
-          aios_agent: payload.data.aios_agent as string,
-          aios_story_id: payload.data.aios_story_id as string,
-          aios_task_id: payload.data.aios_task_id as string,
-          data: payload.data,
-        };
+        const body = await readEventBody(req);
+        const isBatch = Array.isArray(body);
+        const events = (isBatch ? body : [body]).map(toEvent);
 
         // Save to DB
-        insertEvent(event);
+        insertEvents(events);
 
-        // Update session
-        if (event.session_id) {
-          upsertSession(event.session_id, event);
+        for (const event of events) {
+          // Update session
+          if (event.session_id) {
+            upsertSession(event.session_id, event);
+          }
+
+          // Broadcast to WebSocket clients
+          broadcast(event);
         }
 
-        // Broadcast to WebSocket clients
-        broadcast(event);
+        const result = isBatch
+          ? { ok: true, count: events.length, ids: events.map((e) => e.id) }
+          : { ok: true, id: events[0].id };
 
-        return new Response(JSON.stringify({ ok: true, id: event.id }), {
+        return new Response(JSON.stringify(result), {
           headers: { ...headers, 'Content-Type': 'application/json' },
         });
       } catch (error) {
+        if (error instanceof UnsupportedEncodingError) {
+          // Hooks fall back to plain JSON on 415
+          const message = `Unsupported encoding: ${error.message}`;
+          return new Response(JSON.stringify({ error: message }), {
+            status: 415,
+            headers: {
+              ...headers,
+              'Content-Type': 'application/json',
+              'Accept-Encoding': ACCEPTED_ENCODINGS.join(', '),
+            },
+          });
+        }
         console.error('[Error] Processing event:', error);
         return new Response(JSON.stringify({ error: 'Invalid payload' }), {
           status: 400,
@@ -304,6 +353,7 @@ const _server = Bun.serve({
         JSON.stringify({
           status: 'ok',
           clients: clients.size,
+          encodings: ACCEPTED_ENCODINGS,
           uptime: process.uptime(),
         }),
         {
@@ -319,7 +369,7 @@ const _server = Bun.serve({
           name: 'AIOS Monitor Server',
           version: '1.0.0',
           endpoints: {
-            'POST /events': 'Receive events from hooks',
+            'POST /events': 'Receive events from hooks (object or array)',
             'GET /events': 'Query events',
             'GET /events/recent': 'Get recent events',
             'GET /sessions': 'List sessions',
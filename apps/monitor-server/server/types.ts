@@ -12,7 +12,8 @@ export type EventType =
   | 'SubagentStop'
   | 'Notification'
   | 'PreCompact'
-  | 'SessionStart';
+  | 'SessionStart'
+  | 'SamplingSummary';
 
 export interface Event {
   id: string;
@@ -66,7 +67,12 @@ export interface EventPayload {
 export interface Stats {
   total: number;
   by_type: { type: string; count: number }[];
-  by_tool: { tool_name: string; count: number }[];
+  by_tool: {
+    tool_name: string;
+    count: number;
+    avg_duration_ms: number | null;
+    max_duration_ms: number | null;
+  }[];
   errors: number;
   success_rate: string;
   sessions_active: number;
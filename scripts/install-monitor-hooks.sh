@@ -51,10 +51,18 @@ echo "📚 Installing library files..."
 cp "$HOOKS_SOURCE/lib/__init__.py" "$HOOKS_TARGET/lib/"
 cp "$HOOKS_SOURCE/lib/send_event.py" "$HOOKS_TARGET/lib/"
 cp "$HOOKS_SOURCE/lib/enrich.py" "$HOOKS_TARGET/lib/"
+cp "$HOOKS_SOURCE/lib/spool.py" "$HOOKS_TARGET/lib/"
+cp "$HOOKS_SOURCE/lib/pipeline.py" "$HOOKS_TARGET/lib/"
+cp "$HOOKS_SOURCE/lib/sampling.py" "$HOOKS_TARGET/lib/"
+cp "$HOOKS_SOURCE/lib/metrics.py" "$HOOKS_TARGET/lib/"
+cp "$HOOKS_SOURCE/lib/correlate.py" "$HOOKS_TARGET/lib/"
+cp "$HOOKS_SOURCE/lib/encoding.py" "$HOOKS_TARGET/lib/"
+cp "$HOOKS_SOURCE/lib/client.py" "$HOOKS_TARGET/lib/"
+cp "$HOOKS_SOURCE/lib/stream_json.py" "$HOOKS_TARGET/lib/"
 
 # Copy hook files
 echo "🪝 Installing hooks..."
-for hook in pre_tool_use post_tool_use user_prompt_submit stop subagent_stop notification pre_compact; do
+for hook in pre_tool_use post_tool_use user_prompt_submit stop subagent_stop notification pre_compact drain_events hook_daemon hooks_report; do
     if [ -f "$HOOKS_SOURCE/${hook}.py" ]; then
         cp "$HOOKS_SOURCE/${hook}.py" "$HOOKS_TARGET/"
         chmod +x "$HOOKS_TARGET/${hook}.py"
@@ -0,0 +1,141 @@
+"""
+MMOS Async Database Persister
+=============================
+asyncio front-end for MMOSPersister, for persisting many minds concurrently.
+
+Every public persister method is available as a coroutine with the same
+signature. Calls run the synchronous persister on a dedicated thread pool,
+and a semaphore caps how many are in flight (MMOS_DB_CONCURRENCY), so callers
+can gather hundreds of writes without hand-written threading:
+
+    async with AsyncMMOSPersister() as db:
+        mind_ids = await asyncio.gather(*(
+            db.create_or_update_mind(slug, name) for slug, name in minds
+        ))
+
+Author: MMOS Team
+Created: 2026-10-17
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, TypeVar
+
+try:
+    from .db_persister import MMOSPersister, DB_CONCURRENCY
+except ImportError:
+    from db_persister import MMOSPersister, DB_CONCURRENCY
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# MMOSPersister methods exposed as coroutines
+PERSISTER_METHODS = (
+    'get_mind_id',
+    'get_system_id',
+    'get_component_id',
+    'get_driver_id',
+    'get_tool_id',
+    'invalidate_lookups',
+    'create_or_update_mind',
+    'save_viability_result',
+    'save_system_mapping',
+    'save_component_scores',
+    'save_drivers',
+    'save_values',
+    'save_obsessions',
+    'save_fragments',
+    'save_mind_tools',
+    'save_mind_profile',
+    'update_mind_fidelity',
+    'track_job_execution',
+    'update_pipeline_status',
+    'infer_drivers_from_scores',
+    'get_component_driver_mappings',
+    'save_component_driver_mapping',
+    'bulk_save_component_driver_mappings',
+    'flush_writes',
+)
+
+
+def _async_method(name: str) -> Callable[..., Awaitable[Any]]:
+    method = getattr(MMOSPersister, name)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        return await self.run(getattr(self.persister, name), *args, **kwargs)
+
+    return wrapper
+
+
+class AsyncMMOSPersister:
+    """
+    Coroutine wrapper around a shared MMOSPersister.
+
+    The lookup caches of the wrapped persister are shared by all concurrent
+    calls, so reference tables are still loaded once per process.
+
+    Args:
+        persister: Persister to wrap (default: a new MMOSPersister)
+        client: Client for the new persister (e.g. MemoryClient)
+        concurrency: Max calls in flight (default MMOS_DB_CONCURRENCY)
+    """
+
+    def __init__(
+        self,
+        persister: Optional[MMOSPersister] = None,
+        client: Optional[Any] = None,
+        concurrency: Optional[int] = None
+    ):
+        self.persister = persister or MMOSPersister(client=client)
+        self.concurrency = max(1, concurrency or DB_CONCURRENCY)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix='mmos-async-db'
+        )
+        # Created lazily so the persister can be built outside a running loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> 'AsyncMMOSPersister':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def is_enabled(self) -> bool:
+        return self.persister._is_enabled()
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Run a blocking call on the persister's pool, bounded by the semaphore."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
+
+    async def gather(self, calls: Iterable[Awaitable[T]]) -> List[T]:
+        """
+        Await many persister calls; failures are logged and returned as None.
+
+        Persister writes already swallow database errors, so this only
+        catches bugs in caller-side code running inside the calls.
+        """
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"✗ Async persist failed: {result}", exc_info=result)
+        return [None if isinstance(r, Exception) else r for r in results]
+
+    async def close(self) -> None:
+        """Flush queued writes (write-behind) and stop the thread pool."""
+        await self.run(self.persister.flush_writes)
+        self._executor.shutdown(wait=True)
+
+
+for _name in PERSISTER_METHODS:
+    setattr(AsyncMMOSPersister, _name, _async_method(_name))
+del _name
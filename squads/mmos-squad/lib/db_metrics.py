@@ -0,0 +1,310 @@
+"""
+MMOS Database Metrics
+=====================
+Call counts, latency histograms, retries and failures for every database
+call MMOSPersister makes, grouped by pipeline phase, table and operation.
+
+The persister wraps its client in InstrumentedClient, so each
+table(...).<op>(...).execute() and rpc(...).execute() is timed. The current
+phase follows update_pipeline_status() or can be set explicitly:
+
+    with persister.metrics.phase('synthesis'):
+        persister.save_fragments(...)
+
+    print(persister.metrics.summary())
+    persister.metrics.export('db-metrics.json')
+
+Environment:
+    MMOS_DB_SLOW_MS       Log calls slower than this (default 1000)
+    MMOS_DB_METRICS       'true' logs the summary at pipeline end / exit
+    MMOS_DB_METRICS_FILE  Also write the JSON export there at exit
+
+Author: MMOS Team
+Created: 2026-10-17
+"""
+
+import os
+import json
+import time
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SLOW_CALL_MS = float(os.getenv('MMOS_DB_SLOW_MS', '1000'))
+METRICS_ENABLED = os.getenv('MMOS_DB_METRICS', 'false').lower() == 'true'
+METRICS_FILE = os.getenv('MMOS_DB_METRICS_FILE')
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+SLOWEST_KEPT = 10
+
+OPERATIONS = ('select', 'insert', 'upsert', 'update', 'delete')
+
+
+class CallStats:
+    """Aggregates for one (phase, table, operation)."""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, duration_ms: float, ok: bool, rows: int) -> None:
+        self.calls += 1
+        self.errors += 0 if ok else 1
+        self.rows += rows
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if duration_ms <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def percentile(self, pct: float) -> float:
+        """Upper bound of the bucket holding the pct-th call, capped at the slowest call."""
+        if not self.calls:
+            return 0.0
+        rank = pct / 100 * self.calls
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                bound = LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+                return round(min(float(bound), self.max_ms), 1)
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'retries': self.retries,
+            'rows': self.rows,
+            'total_ms': round(self.total_ms, 1),
+            'avg_ms': round(self.total_ms / self.calls, 1) if self.calls else 0.0,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'max_ms': round(self.max_ms, 1),
+            'histogram': {
+                **{f"<={bound}ms": n for bound, n in zip(LATENCY_BUCKETS_MS, self.buckets)},
+                f">{LATENCY_BUCKETS_MS[-1]}ms": self.buckets[-1]
+            }
+        }
+
+
+class DBMetrics:
+    """
+    Thread-safe registry of database call statistics.
+
+    Args:
+        slow_ms: Calls slower than this are logged and kept as slowest calls
+    """
+
+    def __init__(self, slow_ms: float = SLOW_CALL_MS):
+        self.slow_ms = slow_ms
+        self.current_phase = 'default'
+        self.started_at = time.time()
+        self._stats: Dict[Tuple[str, str, str], CallStats] = {}
+        self._slowest: List[Dict[str, Any]] = []
+        self._reported_calls: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Attribute calls to a phase for the duration of the block."""
+        previous = self.current_phase
+        self.current_phase = name
+        try:
+            yield
+        finally:
+            self.current_phase = previous
+
+    def set_phase(self, name: str) -> None:
+        self.current_phase = name
+
+    # ── recording ─────────────────────────────────────────────────────────
+
+    def _entry(self, table: str, op: str) -> CallStats:
+        key = (self.current_phase, table, op)
+        if key not in self._stats:
+            self._stats[key] = CallStats()
+        return self._stats[key]
+
+    def record(self, table: str, op: str, duration_ms: float, ok: bool = True,
+               rows: int = 0, error: Optional[Exception] = None) -> None:
+        phase = self.current_phase
+        with self._lock:
+            self._entry(table, op).add(duration_ms, ok, rows)
+            if duration_ms >= self.slow_ms:
+                self._slowest.append({
+                    'phase': phase, 'table': table, 'op': op,
+                    'ms': round(duration_ms, 1), 'rows': rows, 'ok': ok, 'at': time.time()
+                })
+                self._slowest.sort(key=lambda call: -call['ms'])
+                del self._slowest[SLOWEST_KEPT:]
+
+        if duration_ms >= self.slow_ms:
+            outcome = f"failed: {error}" if error is not None else f"{rows} rows"
+            logger.warning(f"⏱ Slow DB call: {op} {table} {duration_ms:.0f}ms ({outcome}, phase {phase})")
+
+    def record_retry(self, table: str, op: str) -> None:
+        with self._lock:
+            self._entry(table, op).retries += 1
+
+    # ── reporting ─────────────────────────────────────────────────────────
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-serializable view of all statistics."""
+        with self._lock:
+            calls = [
+                {'phase': phase, 'table': table, 'op': op, **stats.to_dict()}
+                for (phase, table, op), stats in sorted(self._stats.items())
+            ]
+            slowest = list(self._slowest)
+
+        phases: Dict[str, Dict[str, Any]] = {}
+        for call in calls:
+            totals = phases.setdefault(call['phase'], {'calls': 0, 'errors': 0, 'retries': 0, 'total_ms': 0.0})
+            for field in ('calls', 'errors', 'retries', 'total_ms'):
+                totals[field] += call[field]
+        for totals in phases.values():
+            totals['total_ms'] = round(totals['total_ms'], 1)
+
+        return {
+            'started_at': self.started_at,
+            'slow_ms': self.slow_ms,
+            'phases': phases,
+            'calls': calls,
+            'slowest': slowest
+        }
+
+    def export(self, path: str) -> None:
+        """Write snapshot() as JSON."""
+        target = Path(path).expanduser()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(self.snapshot(), indent=2), encoding='utf-8')
+
+    def summary(self) -> str:
+        """Human-readable table: time per phase, then per phase/table/operation."""
+        data = self.snapshot()
+        if not data['calls']:
+            return "No database calls recorded"
+
+        lines = ["\n📊 Database time by phase", f"{'phase':<16} {'calls':>7} {'errors':>7} {'retries':>8} {'total ms':>10}"]
+        for phase, totals in sorted(data['phases'].items(), key=lambda item: -item[1]['total_ms']):
+            lines.append(
+                f"{phase:<16} {totals['calls']:>7} {totals['errors']:>7} {totals['retries']:>8} {totals['total_ms']:>10.1f}"
+            )
+
+        lines += ["", f"{'phase':<16} {'table':<24} {'op':<7} {'calls':>6} {'err':>4} {'retry':>5} "
+                      f"{'rows':>7} {'total ms':>9} {'p50':>6} {'p95':>6} {'max':>8}"]
+        for call in sorted(data['calls'], key=lambda c: -c['total_ms']):
+            lines.append(
+                f"{call['phase']:<16} {call['table']:<24} {call['op']:<7} {call['calls']:>6} "
+                f"{call['errors']:>4} {call['retries']:>5} {call['rows']:>7} {call['total_ms']:>9.1f} "
+                f"{call['p50_ms']:>6.0f} {call['p95_ms']:>6.0f} {call['max_ms']:>8.1f}"
+            )
+
+        if data['slowest']:
+            lines += ["", f"⏱ Slowest calls (>= {self.slow_ms:.0f}ms)"]
+            for call in data['slowest']:
+                lines.append(f"  {call['ms']:>8.1f}ms  {call['op']} {call['table']} ({call['phase']})")
+        return '\n'.join(lines)
+
+    def total_calls(self) -> int:
+        with self._lock:
+            return sum(stats.calls for stats in self._stats.values())
+
+    def report(self) -> None:
+        """Log the summary and write MMOS_DB_METRICS_FILE, as configured."""
+        self._reported_calls = self.total_calls()
+        if METRICS_ENABLED:
+            logger.info(self.summary())
+        if METRICS_FILE:
+            try:
+                self.export(METRICS_FILE)
+            except OSError as e:
+                logger.warning(f"✗ Could not write DB metrics to {METRICS_FILE}: {e}")
+
+    def register_exit_report(self) -> None:
+        if METRICS_ENABLED or METRICS_FILE:
+            atexit.register(self._report_at_exit)
+
+    def _report_at_exit(self) -> None:
+        # Skip when the pipeline already reported and nothing ran since
+        if self.total_calls() != self._reported_calls:
+            self.report()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CLIENT PROXY
+# ═══════════════════════════════════════════════════════════════════════════
+
+class InstrumentedQuery:
+    """Fluent query proxy that times execute()."""
+
+    def __init__(self, query: Any, metrics: DBMetrics, table: str, op: str = 'select'):
+        self._query = query
+        self._metrics = metrics
+        self.table = table
+        self.op = op
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._query, name)
+        if not callable(attr):
+            return attr
+
+        def chained(*args, **kwargs):
+            if name in OPERATIONS:
+                self.op = name
+            result = attr(*args, **kwargs)
+            # Keep wrapping the fluent chain
+            if result is not None and hasattr(result, 'execute'):
+                self._query = result
+                return self
+            return result
+
+        return chained
+
+    def execute(self) -> Any:
+        start = time.perf_counter()
+        try:
+            result = self._query.execute()
+        except Exception as e:
+            self._metrics.record(self.table, self.op, (time.perf_counter() - start) * 1000, ok=False, error=e)
+            raise
+        finally:
+            # Retries made by a wrapped GuardedQuery (resilience.py)
+            for _ in range(getattr(self._query, 'retries', 0)):
+                self._metrics.record_retry(self.table, self.op)
+        data = getattr(result, 'data', None)
+        rows = len(data) if isinstance(data, list) else int(data is not None)
+        self._metrics.record(self.table, self.op, (time.perf_counter() - start) * 1000, rows=rows)
+        return result
+
+
+class InstrumentedClient:
+    """Wraps a supabase-py style client; table() and rpc() calls are timed."""
+
+    def __init__(self, client: Any, metrics: DBMetrics):
+        self.wrapped = client
+        self.metrics = metrics
+
+    def table(self, name: str) -> InstrumentedQuery:
+        return InstrumentedQuery(self.wrapped.table(name), self.metrics, name)
+
+    def rpc(self, name: str, params: Optional[Dict[str, Any]] = None) -> InstrumentedQuery:
+        return InstrumentedQuery(self.wrapped.rpc(name, params or {}), self.metrics, name, 'rpc')
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.wrapped, name)
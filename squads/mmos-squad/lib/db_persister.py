@@ -20,16 +20,51 @@ Tables used:
 SQL Functions used:
 - infer_drivers_from_scores(mind_id): Infers drivers from component scores
 
+Reference-table slugs (systems, components, drivers, tools) are resolved from
+an in-process cache, loaded with one select per table and refreshed after
+MMOS_LOOKUP_TTL seconds (default 300) or invalidate_lookups().
+Component scores, drivers, values and obsessions are written with batched
+upserts of MMOS_DB_BATCH_SIZE rows (default 500) per request. The upserts
+need the unique keys added by migrations/001_mmos_upsert_keys.sql; on a
+database without them those tables fall back to select-then-insert/update.
+
+MMOS_DB_BACKEND selects the storage: supabase (default), sqlite (a local
+file at MMOS_SQLITE_PATH, pushed to Supabase later by scripts/sqlite_sync.py)
+or memory. Any object with the supabase-py fluent table()/rpc() API can also
+be passed as `client`.
+
+With MMOS_DB_WRITE_BEHIND=true, phase writes are queued to a background
+worker with a crash-recovery journal (see write_behind.py); mind creation and
+lookups stay synchronous.
+
+Transient failures are retried with jittered backoff, and a circuit breaker
+fails calls fast after repeated failures (see resilience.py). While it is
+open, phase writes are journaled instead and replayed once it closes, so an
+outage costs the pipeline neither time nor data.
+
+Every client call is timed per pipeline phase, table and operation
+(persister.metrics, see db_metrics.py); MMOS_DB_METRICS=true logs the
+summary when the pipeline completes.
+
 Author: MMOS Team
 Created: 2025-12-19
 """
 
 import os
+import re
 import json
+import hashlib
+import inspect
+import unicodedata
 import logging
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, timezone
 from contextlib import contextmanager
+from pathlib import Path
 
 # Try Supabase client
 try:
@@ -39,8 +74,140 @@ except ImportError:
     HAS_SUPABASE = False
     Client = None
 
+try:
+    from .write_behind import WriteBehindQueue, journal_dir_for, orphaned_journals
+    from .sqlite_client import SQLiteClient
+    from .memory_client import MemoryClient
+    from .driver_inference import DriverInferenceEngine
+    from .db_metrics import DBMetrics, InstrumentedClient
+    from .resilience import RetryPolicy, CircuitBreaker, CircuitOpenError, GuardedClient
+except ImportError:
+    from write_behind import WriteBehindQueue, journal_dir_for, orphaned_journals
+    from sqlite_client import SQLiteClient
+    from memory_client import MemoryClient
+    from driver_inference import DriverInferenceEngine
+    from db_metrics import DBMetrics, InstrumentedClient
+    from resilience import RetryPolicy, CircuitBreaker, CircuitOpenError, GuardedClient
+
 logger = logging.getLogger(__name__)
 
+# Storage backend: supabase (MMOS_DB_PERSIST + SUPABASE_*), sqlite, or memory
+DB_BACKEND = os.getenv('MMOS_DB_BACKEND', 'supabase').lower()
+SQLITE_PATH = os.getenv('MMOS_SQLITE_PATH', str(Path.home() / '.aios' / 'mmos' / 'mmos.db'))
+
+# Reference tables resolved by slug through the lookup cache
+LOOKUP_TABLES = ('mapping_systems', 'system_components', 'drivers', 'toolbox')
+LOOKUP_TTL_SECONDS = float(os.getenv('MMOS_LOOKUP_TTL', '300'))
+LOOKUP_PAGE_SIZE = 1000
+
+# Rows per upsert request for bulk writes
+DB_BATCH_SIZE = int(os.getenv('MMOS_DB_BATCH_SIZE', '500'))
+
+# Fragment writer: rows per insert, concurrent requests
+# (retries and the circuit breaker are configured in resilience.py)
+FRAGMENT_BATCH_SIZE = int(os.getenv('MMOS_FRAGMENT_BATCH_SIZE', '200'))
+DB_CONCURRENCY = int(os.getenv('MMOS_DB_CONCURRENCY', '4'))
+
+# Skip fragments whose normalized content hash is already stored for the mind/source
+FRAGMENT_DEDUP = os.getenv('MMOS_FRAGMENT_DEDUP', 'true').lower() == 'true'
+FRAGMENT_INDEX_COLUMNS = 'id, source_id, content_hash, type, context, insight, location, relevance, category_id, metadata'
+
+# Postgres: no unique or exclusion constraint matching the ON CONFLICT specification
+MISSING_CONFLICT_TARGET = '42P10'
+# Postgres: column does not exist
+UNDEFINED_COLUMN = '42703'
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def fragment_content_hash(content: str) -> str:
+    """SHA-256 of fragment content, normalized (NFC, whitespace collapsed, trimmed)."""
+    normalized = _WHITESPACE.sub(' ', unicodedata.normalize('NFC', content)).strip()
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def _missing_conflict_target(error: Exception) -> bool:
+    """True if an upsert failed because its on_conflict columns have no unique key."""
+    return getattr(error, 'code', None) == MISSING_CONFLICT_TARGET or \
+        'no unique or exclusion constraint' in str(error)
+
+
+def _missing_column(error: Exception, column: str) -> bool:
+    """True if a query failed because `column` does not exist (Postgres or SQLite)."""
+    message = str(error)
+    if getattr(error, 'code', None) != UNDEFINED_COLUMN and 'no such column' not in message:
+        return False
+    return column in message
+
+
+def _fragment_signature(row: Dict[str, Any]) -> str:
+    """Fingerprint of the non-content fields, to detect fragments needing an update."""
+    fields = {c: row.get(c) for c in ('type', 'context', 'insight', 'location', 'relevance',
+                                      'category_id', 'metadata')}
+    return json.dumps(fields, sort_keys=True, default=str)
+
+
+def _queued(key: tuple = (), list_arg: Optional[str] = None, item_key: Optional[str] = None,
+            flush: bool = False):
+    """
+    Route a write through the write-behind queue when it is enabled.
+
+    Queued calls return None immediately; the worker thread later runs the
+    real method. Calls made by the worker itself run directly.
+
+    Calls that find the database circuit open, or that fail while it opens,
+    are journaled as well (diverted) and also return None.
+
+    Args:
+        key: Argument names forming the coalescing key (empty: never coalesce)
+        list_arg: For list upserts, the argument holding the rows...
+        item_key: ...and the row field that identifies a row
+        flush: Start a background flush after queueing (phase boundaries)
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        def enqueue(queue: WriteBehindQueue, self, args, kwargs) -> None:
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            call_kwargs = {k: v for k, v in bound.arguments.items() if k != 'self'}
+            queue.enqueue(
+                method.__name__,
+                call_kwargs,
+                key=tuple(call_kwargs[name] for name in key) if key else None,
+                list_arg=list_arg,
+                item_key=item_key
+            )
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self._is_enabled():
+                return method(self, *args, **kwargs)
+
+            queue = self._write_queue
+            if queue is not None and not queue.is_worker_thread():
+                enqueue(queue, self, args, kwargs)
+                if flush:
+                    queue.flush(wait=False)
+                return None
+
+            if not self.breaker.is_open():
+                try:
+                    with self._divertable():
+                        return method(self, *args, **kwargs)
+                except CircuitOpenError as e:
+                    logger.warning(f"✗ {method.__name__} interrupted by the database circuit: {e}")
+
+            enqueue(self._divert_queue(), self, args, kwargs)
+            logger.info(f"⟳ Database unavailable, {method.__name__} journaled for replay")
+            # Partially applied fragment batches must be re-read before the replay
+            with self._lookup_lock:
+                self._fragment_hashes.clear()
+            return None
+
+        return wrapper
+    return decorator
+
 
 class MMOSPersister:
     """
@@ -63,8 +230,85 @@ class MMOSPersister:
         persister.save_mind_profile(mind_id, 'generalista', system_prompt_content)
     """
 
-    def __init__(self):
-        """Initialize Supabase client."""
+    def __init__(
+        self,
+        client: Optional[Any] = None,
+        write_behind: Optional[bool] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        """
+        Initialize the database client.
+
+        Args:
+            client: Pre-built client (e.g. SQLiteClient or MemoryClient for
+                    offline runs); enables persistence regardless of
+                    MMOS_DB_PERSIST and MMOS_DB_BACKEND
+            write_behind: Queue phase writes to a background worker
+                          (default: MMOS_DB_WRITE_BEHIND=true)
+            retry_policy: Backoff for transient errors, applied to every client
+                          call (default from MMOS_DB_MAX_RETRIES)
+            breaker: Circuit breaker shared by all calls of this persister
+                     (default from MMOS_DB_BREAKER_THRESHOLD / MMOS_DB_BREAKER_RESET)
+        """
+        # slug -> UUID caches (see LOOKUP HELPERS)
+        self._lookups: Dict[str, Dict[str, str]] = {}
+        self._lookups_loaded_at: Dict[str, float] = {}
+        self._mind_ids: Dict[str, str] = {}
+        self._lookup_lock = threading.Lock()
+        # (mind_id, source_id) -> (loaded_at, content_hash -> (fragment id, signature))
+        self._fragment_hashes: Dict[tuple, tuple] = {}
+        self._fragment_dedup = FRAGMENT_DEDUP
+        # Tables whose upsert conflict key is missing in the database
+        self._no_upsert_key: set = set()
+        self._write_queue: Optional[WriteBehindQueue] = None
+        self._outage_queue: Optional[WriteBehindQueue] = None
+        self._driver_engine: Optional[DriverInferenceEngine] = None
+        self._local = threading.local()
+        self.metrics = DBMetrics()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker(policy=self.retry_policy)
+        self.breaker.on_close(self._replay_diverted)
+
+        if write_behind is None:
+            write_behind = os.getenv('MMOS_DB_WRITE_BEHIND', 'false').lower() == 'true'
+
+        self._init_client(client)
+        # Journals only ever replay into the backend they were written for
+        self._journal_dir = journal_dir_for(self._backend_identity())
+        if self.client is not None:
+            # Fast-fails while the circuit is open show up as errors in metrics
+            self.client = InstrumentedClient(
+                GuardedClient(self.client, self.breaker, self.retry_policy), self.metrics
+            )
+            self.metrics.register_exit_report()
+
+        if write_behind and self._is_enabled():
+            self._write_queue = WriteBehindQueue(
+                self._apply_queued, journal_dir=self._journal_dir, hold=self.breaker.is_open
+            )
+            logger.info(f"✓ Write-behind enabled (journal: {self._write_queue.journal_path})")
+        elif self._is_enabled():
+            orphans = orphaned_journals(self._journal_dir)
+            if orphans:
+                # Writes journaled by an earlier run against this database
+                logger.info(f"⟳ Adopting {len(orphans)} orphaned write journal(s) from {self._journal_dir}")
+                self._divert_queue(announce=False)
+
+    def _init_client(self, client: Optional[Any]) -> None:
+        """Set up self.client from an injected client or the environment."""
+        if client is None and DB_BACKEND == 'sqlite':
+            client = SQLiteClient(SQLITE_PATH)
+            logger.info(f"✓ MMOS Database persister using SQLite ({client.path})")
+        elif client is None and DB_BACKEND == 'memory':
+            client = MemoryClient()
+            logger.info("✓ MMOS Database persister using in-memory backend")
+
+        if client is not None:
+            self.feature_flag = True
+            self.client = client
+            return
+
         # Check feature flag
         self.feature_flag = os.getenv('MMOS_DB_PERSIST', 'false').lower() == 'true'
 
@@ -91,19 +335,85 @@ class MMOSPersister:
             self.client = create_client(supabase_url, supabase_key)
             logger.info("✓ MMOS Database persister initialized")
 
+    def _backend_identity(self) -> Optional[str]:
+        """What the journals are keyed by: Supabase URL, SQLite path or 'memory'."""
+        if self.client is None:
+            return None
+        if isinstance(self.client, SQLiteClient):
+            return 'memory' if self.client.path == ':memory:' else f"sqlite:{self.client.path}"
+        if isinstance(self.client, MemoryClient):
+            return 'memory'
+        url = getattr(self.client, 'supabase_url', None) or os.getenv('SUPABASE_URL')
+        return f"supabase:{url}" if url else type(self.client).__name__
+
     def _is_enabled(self) -> bool:
         """Check if database persistence is enabled."""
         return self.feature_flag and self.client is not None
 
+    def _apply_queued(self, op: str, kwargs: Dict[str, Any]) -> Any:
+        """Run a queued write (called on the write-behind worker thread)."""
+        return getattr(self, op)(**kwargs)
+
+    def flush_writes(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued writes are applied (no-op without write-behind).
+
+        Returns:
+            True if the queue drained within the timeout (False right away
+            while the database circuit is open and writes are held)
+        """
+        drained = True
+        for queue in (self._write_queue, self._outage_queue):
+            if queue is not None:
+                drained = queue.flush(wait=True, timeout=timeout) and drained
+        return drained
+
+    def _divert_queue(self, announce: bool = True) -> WriteBehindQueue:
+        """Journal for writes made while the database is unavailable."""
+        if self._write_queue is not None:
+            return self._write_queue
+        with self._lookup_lock:
+            if self._outage_queue is None:
+                self._outage_queue = WriteBehindQueue(
+                    self._apply_queued, journal_dir=self._journal_dir, hold=self.breaker.is_open
+                )
+                if announce:
+                    logger.info(f"✓ Diverted writes journaled to {self._outage_queue.journal_path}")
+        return self._outage_queue
+
+    def _replay_diverted(self) -> None:
+        """Apply diverted writes once the circuit closes (breaker callback)."""
+        for queue in (self._write_queue, self._outage_queue):
+            if queue is not None:
+                queue.flush(wait=False)
+
+    @contextmanager
+    def _divertable(self):
+        """Mark the current call as one _queued can journal on an outage."""
+        previous = getattr(self._local, 'divertable', False)
+        self._local.divertable = True
+        try:
+            yield
+        finally:
+            self._local.divertable = previous
+
     @contextmanager
     def _safe_write(self):
         """
         Context manager for safe database writes.
         Logs errors but doesn't raise (filesystem is source of truth).
+
+        The exception: inside a _queued write, a failure while the database
+        circuit is open is raised as CircuitOpenError so the call is diverted
+        to the journal instead of being lost.
         """
         try:
             yield
         except Exception as e:
+            if getattr(self._local, 'divertable', False) and self.breaker.is_open():
+                if isinstance(e, CircuitOpenError):
+                    raise
+                raise CircuitOpenError(str(e)) from e
             logger.error(f"Database write failed: {e}", exc_info=True)
 
     def _now(self) -> str:
@@ -114,75 +424,268 @@ class MMOSPersister:
     # LOOKUP HELPERS
     # ═══════════════════════════════════════════════════════════════════════════
 
-    def get_mind_id(self, slug: str) -> Optional[str]:
-        """Get mind UUID by slug."""
+    def _warm_lookup(self, table: str) -> Optional[Dict[str, str]]:
+        """
+        Load slug -> UUID for a whole reference table in one bulk select.
+
+        Cached for LOOKUP_TTL_SECONDS (MMOS_LOOKUP_TTL). Returns None if the
+        table could not be loaded.
+        """
+        with self._lookup_lock:
+            loaded_at = self._lookups_loaded_at.get(table)
+            if loaded_at is not None and time.monotonic() - loaded_at < LOOKUP_TTL_SECONDS:
+                return self._lookups[table]
+
+            ids: Dict[str, str] = {}
+            try:
+                start = 0
+                while True:
+                    result = self.client.table(table).select('id, slug').order('id').range(
+                        start, start + LOOKUP_PAGE_SIZE - 1
+                    ).execute()
+                    rows = result.data or []
+                    for row in rows:
+                        ids[row['slug']] = row['id']
+                    if len(rows) < LOOKUP_PAGE_SIZE:
+                        break
+                    start += LOOKUP_PAGE_SIZE
+            except Exception as e:
+                logger.error(f"Failed to load {table} lookup: {e}")
+                return None
+
+            self._lookups[table] = ids
+            self._lookups_loaded_at[table] = time.monotonic()
+            logger.debug(f"Loaded {len(ids)} {table} slugs")
+            return ids
+
+    def _lookup_id(self, table: str, slug: str, label: str) -> Optional[str]:
+        """Resolve a reference-table slug via the cache (one query if it can't load)."""
         if not self._is_enabled():
             return None
 
+        ids = self._warm_lookup(table)
+        if ids is not None:
+            return ids.get(slug)
+
         try:
-            result = self.client.table('minds').select('id').eq('slug', slug).execute()
+            result = self.client.table(table).select('id').eq('slug', slug).execute()
             if result.data and len(result.data) > 0:
                 return result.data[0]['id']
             return None
         except Exception as e:
-            logger.error(f"Failed to get mind_id for '{slug}': {e}")
+            logger.error(f"Failed to get {label} for '{slug}': {e}")
             return None
 
-    def get_system_id(self, system_slug: str) -> Optional[str]:
-        """Get mapping_system UUID by slug (e.g., 'mbti', 'big-five')."""
+    def invalidate_lookups(self, table: Optional[str] = None) -> None:
+        """
+        Drop cached slug -> UUID lookups so the next call reloads them.
+
+        Args:
+            table: Reference table (or 'minds', 'fragments',
+                   'component_driver_map') to invalidate; all if None
+        """
+        with self._lookup_lock:
+            if table is None or table == 'minds':
+                self._mind_ids.clear()
+            if table is None or table == 'fragments':
+                self._fragment_hashes.clear()
+            if self._driver_engine is not None and table in (None, 'component_driver_map'):
+                self._driver_engine.invalidate()
+            for name in LOOKUP_TABLES:
+                if table is None or table == name:
+                    self._lookups.pop(name, None)
+                    self._lookups_loaded_at.pop(name, None)
+
+    def get_mind_id(self, slug: str) -> Optional[str]:
+        """Get mind UUID by slug (found ids are memoized)."""
         if not self._is_enabled():
             return None
 
+        if slug in self._mind_ids:
+            return self._mind_ids[slug]
+
         try:
-            result = self.client.table('mapping_systems').select('id').eq('slug', system_slug).execute()
+            result = self.client.table('minds').select('id').eq('slug', slug).execute()
             if result.data and len(result.data) > 0:
+                self._mind_ids[slug] = result.data[0]['id']
                 return result.data[0]['id']
             return None
         except Exception as e:
-            logger.error(f"Failed to get system_id for '{system_slug}': {e}")
+            logger.error(f"Failed to get mind_id for '{slug}': {e}")
             return None
 
+    def get_system_id(self, system_slug: str) -> Optional[str]:
+        """Get mapping_system UUID by slug (e.g., 'mbti', 'big-five')."""
+        return self._lookup_id('mapping_systems', system_slug, 'system_id')
+
     def get_component_id(self, component_slug: str) -> Optional[str]:
         """Get system_component UUID by slug (e.g., 'mbti-intj', 'mbti-ei')."""
-        if not self._is_enabled():
-            return None
-
-        try:
-            result = self.client.table('system_components').select('id').eq('slug', component_slug).execute()
-            if result.data and len(result.data) > 0:
-                return result.data[0]['id']
-            return None
-        except Exception as e:
-            logger.error(f"Failed to get component_id for '{component_slug}': {e}")
-            return None
+        return self._lookup_id('system_components', component_slug, 'component_id')
 
     def get_driver_id(self, driver_slug: str) -> Optional[str]:
         """Get driver UUID by slug (e.g., 'curiosity', 'autonomy')."""
-        if not self._is_enabled():
-            return None
-
-        try:
-            result = self.client.table('drivers').select('id').eq('slug', driver_slug).execute()
-            if result.data and len(result.data) > 0:
-                return result.data[0]['id']
-            return None
-        except Exception as e:
-            logger.error(f"Failed to get driver_id for '{driver_slug}': {e}")
-            return None
+        return self._lookup_id('drivers', driver_slug, 'driver_id')
 
     def get_tool_id(self, tool_slug: str) -> Optional[str]:
         """Get toolbox UUID by slug (e.g., 'first-principles', 'inversion')."""
-        if not self._is_enabled():
-            return None
+        return self._lookup_id('toolbox', tool_slug, 'tool_id')
 
-        try:
-            result = self.client.table('toolbox').select('id').eq('slug', tool_slug).execute()
-            if result.data and len(result.data) > 0:
-                return result.data[0]['id']
-            return None
-        except Exception as e:
-            logger.error(f"Failed to get tool_id for '{tool_slug}': {e}")
-            return None
+    # ═══════════════════════════════════════════════════════════════════════════
+    # BULK WRITES
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def _bulk_upsert(
+        self,
+        table: str,
+        rows: List[Dict[str, Any]],
+        on_conflict: str,
+        batch_size: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """
+        Upsert rows with one request per chunk instead of select + write per row.
+
+        Rows are grouped by column set (so a missing optional column never
+        overwrites an existing value with NULL), deduplicated on the conflict
+        key (last one wins, as sequential writes would) and sent in chunks of
+        batch_size (MMOS_DB_BATCH_SIZE). A failed chunk is retried row by row
+        so one bad row only fails itself; transient errors (429/5xx) are
+        retried with backoff first.
+
+        If the database has no unique key on the conflict columns (see
+        migrations/001_mmos_upsert_keys.sql), the table is written with
+        select-then-insert/update per row from then on.
+
+        Args:
+            table: Table name
+            rows: Row dicts, all containing the on_conflict columns
+            on_conflict: Comma-separated unique key columns (e.g. 'mind_id,driver_id')
+            batch_size: Rows per request (defaults to MMOS_DB_BATCH_SIZE)
+
+        Returns:
+            Row UUID per input row, in input order (None where the write failed)
+        """
+        key_columns = [c.strip() for c in on_conflict.split(',')]
+        batch_size = max(1, batch_size or DB_BATCH_SIZE)
+
+        def key_of(row: Dict[str, Any]) -> tuple:
+            return tuple(str(row.get(c)) for c in key_columns)
+
+        groups: Dict[tuple, Dict[tuple, Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(tuple(sorted(row)), {})[key_of(row)] = row
+
+        ids_by_key: Dict[tuple, str] = {}
+        for group in groups.values():
+            unique_rows = list(group.values())
+            for start in range(0, len(unique_rows), batch_size):
+                chunk = unique_rows[start:start + batch_size]
+                if table in self._no_upsert_key:
+                    self._select_then_write(table, chunk, key_columns, ids_by_key)
+                    continue
+                try:
+                    result = self.client.table(table).upsert(chunk, on_conflict=on_conflict).execute()
+                    for saved in result.data or []:
+                        ids_by_key[key_of(saved)] = saved['id']
+                    continue
+                except Exception as e:
+                    if self.breaker.is_open():
+                        raise
+                    if _missing_conflict_target(e):
+                        logger.warning(
+                            f"✗ {table} has no unique key on ({on_conflict}); writing rows one by one "
+                            f"(apply migrations/001_mmos_upsert_keys.sql)"
+                        )
+                        self._no_upsert_key.add(table)
+                        self._select_then_write(table, chunk, key_columns, ids_by_key)
+                        continue
+                    logger.warning(f"✗ Bulk upsert of {len(chunk)} {table} rows failed, retrying per row: {e}")
+
+                for row in chunk:
+                    try:
+                        result = self.client.table(table).upsert(row, on_conflict=on_conflict).execute()
+                        if result.data:
+                            ids_by_key[key_of(row)] = result.data[0]['id']
+                    except Exception as e:
+                        if self.breaker.is_open():
+                            raise
+                        logger.error(f"✗ Failed to save {table} row {dict(zip(key_columns, key_of(row)))}: {e}")
+
+        return [ids_by_key.get(key_of(row)) for row in rows]
+
+    def _select_then_write(
+        self,
+        table: str,
+        rows: List[Dict[str, Any]],
+        key_columns: List[str],
+        ids_by_key: Dict[tuple, str]
+    ) -> None:
+        """Update the row matching each key, or insert it (for tables without an upsert key)."""
+        for row in rows:
+            key = tuple(str(row.get(c)) for c in key_columns)
+            try:
+                query = self.client.table(table).select('id')
+                for column in key_columns:
+                    query = query.eq(column, row.get(column))
+                existing = query.limit(1).execute()
+
+                if existing.data:
+                    row_id = existing.data[0]['id']
+                    self.client.table(table).update(row).eq('id', row_id).execute()
+                    ids_by_key[key] = row_id
+                else:
+                    result = self.client.table(table).insert(row).execute()
+                    if result.data:
+                        ids_by_key[key] = result.data[0]['id']
+            except Exception as e:
+                if self.breaker.is_open():
+                    raise
+                logger.error(f"✗ Failed to save {table} row {dict(zip(key_columns, key))}: {e}")
+
+    def _batch_insert(
+        self,
+        table: str,
+        rows: List[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """
+        Insert rows in chunks with bounded concurrency and retry on 429/5xx.
+
+        At most `concurrency` requests are in flight, which keeps the writer
+        from outrunning the database. A chunk that fails for a non-transient
+        reason is retried row by row so one bad row only fails itself.
+
+        Returns:
+            Row UUID per input row, in input order (None where the insert failed)
+        """
+        batch_size = max(1, batch_size or FRAGMENT_BATCH_SIZE)
+        concurrency = max(1, concurrency or DB_CONCURRENCY)
+        chunks = [rows[i:i + batch_size] for i in range(0, len(rows), batch_size)]
+
+        def insert_chunk(chunk: List[Dict[str, Any]]) -> List[Optional[str]]:
+            try:
+                result = self.client.table(table).insert(chunk).execute()
+                saved = result.data or []
+                if len(saved) == len(chunk):
+                    return [row['id'] for row in saved]
+                logger.warning(f"✗ {table} insert returned {len(saved)}/{len(chunk)} rows")
+                return [row['id'] for row in saved] + [None] * (len(chunk) - len(saved))
+            except Exception as e:
+                if self.breaker.is_open():
+                    raise
+                if len(chunk) == 1 or self.retry_policy.is_transient(e):
+                    logger.error(f"✗ Failed to insert {len(chunk)} {table} rows: {e}")
+                    return [None] * len(chunk)
+                logger.warning(f"✗ Insert of {len(chunk)} {table} rows failed, retrying per row: {e}")
+                return [insert_chunk([row])[0] for row in chunk]
+
+        if concurrency == 1 or len(chunks) <= 1:
+            results = [insert_chunk(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                results = list(executor.map(insert_chunk, chunks))
+
+        return [row_id for chunk_ids in results for row_id in chunk_ids]
 
     # ═══════════════════════════════════════════════════════════════════════════
     # PHASE 0: INITIALIZATION
@@ -208,7 +711,8 @@ class MMOSPersister:
             primary_language: Primary language code ('en', 'pt', etc.)
             avatar_url: URL to avatar image
             created_by: Creator identifier
-            mmos_metadata: MMOS-specific metadata dict
+            mmos_metadata: MMOS-specific metadata dict (merged into the
+                stored metadata when the mind exists)
 
         Returns:
             Mind UUID if successful, None if failed/disabled
@@ -235,7 +739,14 @@ class MMOSPersister:
             data = {k: v for k, v in data.items() if v is not None}
 
             if existing_id:
-                # Update existing
+                # Update existing; merge metadata so other phases' keys survive
+                data.pop('mmos_metadata')
+                if mmos_metadata:
+                    existing = self.client.table('minds').select('mmos_metadata').eq('id', existing_id).execute()
+                    current_metadata = {}
+                    if existing.data and len(existing.data) > 0:
+                        current_metadata = existing.data[0].get('mmos_metadata', {}) or {}
+                    data['mmos_metadata'] = {**current_metadata, **mmos_metadata}
                 data['updated_at'] = self._now()
                 result = self.client.table('minds').update(data).eq('id', existing_id).execute()
                 if result.data and len(result.data) > 0:
@@ -246,6 +757,7 @@ class MMOSPersister:
                 result = self.client.table('minds').insert(data).execute()
                 if result.data and len(result.data) > 0:
                     mind_id = result.data[0]['id']
+                    self._mind_ids[slug] = mind_id
                     logger.info(f"✓ Created mind: {slug} (id={mind_id})")
                     return mind_id
 
@@ -256,6 +768,7 @@ class MMOSPersister:
     # PHASE 1: VIABILITY
     # ═══════════════════════════════════════════════════════════════════════════
 
+    @_queued(key=('mind_id',))
     def save_viability_result(
         self,
         mind_id: str,
@@ -318,6 +831,7 @@ class MMOSPersister:
     # PHASE 3: ANALYSIS (8 LAYERS)
     # ═══════════════════════════════════════════════════════════════════════════
 
+    @_queued(key=('mind_id', 'system_slug'))
     def save_system_mapping(
         self,
         mind_id: str,
@@ -386,6 +900,7 @@ class MMOSPersister:
             logger.warning(f"✗ Failed to save {system_slug} mapping")
             return None
 
+    @_queued(key=('mind_id',), list_arg='scores', item_key='component_slug')
     def save_component_scores(
         self,
         mind_id: str,
@@ -413,53 +928,45 @@ class MMOSPersister:
         if not self._is_enabled():
             return []
 
-        created_ids = []
+        rows = []
+        now = self._now()
 
         for score in scores:
-            with self._safe_write():
-                component_slug = score.get('component_slug')
-                if not component_slug:
-                    continue
-
-                component_id = self.get_component_id(component_slug)
-                if not component_id:
-                    logger.warning(f"✗ Component not found: {component_slug}")
-                    continue
+            component_slug = score.get('component_slug')
+            if not component_slug:
+                continue
 
-                data = {
-                    'mind_id': mind_id,
-                    'component_id': component_id,
-                    'score_numeric': score.get('score_numeric'),
-                    'score_text': score.get('score_text'),
-                    'score_rank': score.get('score_rank'),
-                    'confidence': score.get('confidence'),
-                    'evidence': score.get('evidence', []),
-                    'notes': score.get('notes'),
-                    'assessed_by': assessed_by,
-                    'assessed_at': self._now()
-                }
-
-                # Filter None values
-                data = {k: v for k, v in data.items() if v is not None}
+            component_id = self.get_component_id(component_slug)
+            if not component_id:
+                logger.warning(f"✗ Component not found: {component_slug}")
+                continue
 
-                # Upsert: update if exists for same mind+component
-                existing = self.client.table('mind_component_scores').select('id').eq(
-                    'mind_id', mind_id
-                ).eq('component_id', component_id).execute()
+            data = {
+                'mind_id': mind_id,
+                'component_id': component_id,
+                'score_numeric': score.get('score_numeric'),
+                'score_text': score.get('score_text'),
+                'score_rank': score.get('score_rank'),
+                'confidence': score.get('confidence'),
+                'evidence': score.get('evidence', []),
+                'notes': score.get('notes'),
+                'assessed_by': assessed_by,
+                'assessed_at': now,
+                'updated_at': now
+            }
 
-                if existing.data and len(existing.data) > 0:
-                    score_id = existing.data[0]['id']
-                    data['updated_at'] = self._now()
-                    result = self.client.table('mind_component_scores').update(data).eq('id', score_id).execute()
-                else:
-                    result = self.client.table('mind_component_scores').insert(data).execute()
+            # Filter None values
+            rows.append({k: v for k, v in data.items() if v is not None})
 
-                if result.data and len(result.data) > 0:
-                    created_ids.append(result.data[0]['id'])
+        created_ids = []
+        with self._safe_write():
+            ids = self._bulk_upsert('mind_component_scores', rows, on_conflict='mind_id,component_id')
+            created_ids = [i for i in ids if i]
 
         logger.info(f"✓ Saved {len(created_ids)}/{len(scores)} component scores for mind {mind_id}")
         return created_ids
 
+    @_queued(key=('mind_id',), list_arg='drivers', item_key='driver_slug')
     def save_drivers(
         self,
         mind_id: str,
@@ -486,55 +993,47 @@ class MMOSPersister:
         if not self._is_enabled():
             return []
 
-        created_ids = []
+        rows = []
+        now = self._now()
 
         for driver in drivers:
-            with self._safe_write():
-                driver_slug = driver.get('driver_slug')
-                if not driver_slug:
-                    continue
+            driver_slug = driver.get('driver_slug')
+            if not driver_slug:
+                continue
 
-                driver_id = self.get_driver_id(driver_slug)
-                if not driver_id:
-                    logger.warning(f"✗ Driver not found: {driver_slug}")
-                    continue
-
-                strength = driver.get('strength', 5)
-                strength = max(1, min(10, strength))  # Clamp 1-10
-
-                data = {
-                    'mind_id': mind_id,
-                    'driver_id': driver_id,
-                    'relationship': driver.get('relationship', 'moderate'),
-                    'strength': strength,
-                    'evidence': driver.get('evidence'),
-                    'context': driver.get('context'),
-                    'confidence': driver.get('confidence'),
-                    'assessed_by': assessed_by,
-                    'extracted_at': self._now()
-                }
+            driver_id = self.get_driver_id(driver_slug)
+            if not driver_id:
+                logger.warning(f"✗ Driver not found: {driver_slug}")
+                continue
 
-                # Filter None values
-                data = {k: v for k, v in data.items() if v is not None}
+            strength = driver.get('strength', 5)
+            strength = max(1, min(10, strength))  # Clamp 1-10
 
-                # Upsert: update if exists for same mind+driver
-                existing = self.client.table('mind_drivers').select('id').eq(
-                    'mind_id', mind_id
-                ).eq('driver_id', driver_id).execute()
+            data = {
+                'mind_id': mind_id,
+                'driver_id': driver_id,
+                'relationship': driver.get('relationship', 'moderate'),
+                'strength': strength,
+                'evidence': driver.get('evidence'),
+                'context': driver.get('context'),
+                'confidence': driver.get('confidence'),
+                'assessed_by': assessed_by,
+                'extracted_at': now,
+                'updated_at': now
+            }
 
-                if existing.data and len(existing.data) > 0:
-                    mapping_id = existing.data[0]['id']
-                    data['updated_at'] = self._now()
-                    result = self.client.table('mind_drivers').update(data).eq('id', mapping_id).execute()
-                else:
-                    result = self.client.table('mind_drivers').insert(data).execute()
+            # Filter None values
+            rows.append({k: v for k, v in data.items() if v is not None})
 
-                if result.data and len(result.data) > 0:
-                    created_ids.append(result.data[0]['id'])
+        created_ids = []
+        with self._safe_write():
+            ids = self._bulk_upsert('mind_drivers', rows, on_conflict='mind_id,driver_id')
+            created_ids = [i for i in ids if i]
 
         logger.info(f"✓ Saved {len(created_ids)}/{len(drivers)} drivers for mind {mind_id}")
         return created_ids
 
+    @_queued(key=('mind_id',), list_arg='values', item_key='name')
     def save_values(
         self,
         mind_id: str,
@@ -556,44 +1055,35 @@ class MMOSPersister:
         if not self._is_enabled():
             return []
 
-        created_ids = []
+        rows = []
 
         for value in values:
-            with self._safe_write():
-                name = value.get('name')
-                if not name:
-                    continue
+            name = value.get('name')
+            if not name:
+                continue
 
-                importance = value.get('importance_10', 5)
-                importance = max(0, min(10, importance))  # Clamp 0-10
+            importance = value.get('importance_10', 5)
+            importance = max(0, min(10, importance))  # Clamp 0-10
 
-                data = {
-                    'mind_id': mind_id,
-                    'name': name,
-                    'importance_10': importance,
-                    'notes': value.get('notes')
-                }
-
-                # Filter None values
-                data = {k: v for k, v in data.items() if v is not None}
-
-                # Check if exists (by mind_id + name)
-                existing = self.client.table('mind_values').select('id').eq(
-                    'mind_id', mind_id
-                ).eq('name', name).execute()
+            data = {
+                'mind_id': mind_id,
+                'name': name,
+                'importance_10': importance,
+                'notes': value.get('notes')
+            }
 
-                if existing.data and len(existing.data) > 0:
-                    value_id = existing.data[0]['id']
-                    result = self.client.table('mind_values').update(data).eq('id', value_id).execute()
-                else:
-                    result = self.client.table('mind_values').insert(data).execute()
+            # Filter None values
+            rows.append({k: v for k, v in data.items() if v is not None})
 
-                if result.data and len(result.data) > 0:
-                    created_ids.append(result.data[0]['id'])
+        created_ids = []
+        with self._safe_write():
+            ids = self._bulk_upsert('mind_values', rows, on_conflict='mind_id,name')
+            created_ids = [i for i in ids if i]
 
         logger.info(f"✓ Saved {len(created_ids)}/{len(values)} values for mind {mind_id}")
         return created_ids
 
+    @_queued(key=('mind_id',), list_arg='obsessions', item_key='name')
     def save_obsessions(
         self,
         mind_id: str,
@@ -616,47 +1106,37 @@ class MMOSPersister:
         if not self._is_enabled():
             return []
 
-        created_ids = []
+        rows = []
 
         for obsession in obsessions:
-            with self._safe_write():
-                name = obsession.get('name')
-                if not name:
-                    continue
+            name = obsession.get('name')
+            if not name:
+                continue
 
-                intensity = obsession.get('intensity_10', 5)
-                intensity = max(0, min(10, intensity))  # Clamp 0-10
+            intensity = obsession.get('intensity_10', 5)
+            intensity = max(0, min(10, intensity))  # Clamp 0-10
 
-                # Resolve driver if provided
-                driven_by = None
-                driver_slug = obsession.get('driven_by')
-                if driver_slug:
-                    driven_by = self.get_driver_id(driver_slug)
+            # Resolve driver if provided
+            driven_by = None
+            driver_slug = obsession.get('driven_by')
+            if driver_slug:
+                driven_by = self.get_driver_id(driver_slug)
 
-                data = {
-                    'mind_id': mind_id,
-                    'name': name,
-                    'intensity_10': intensity,
-                    'notes': obsession.get('notes'),
-                    'driven_by': driven_by
-                }
-
-                # Filter None values
-                data = {k: v for k, v in data.items() if v is not None}
-
-                # Check if exists (by mind_id + name)
-                existing = self.client.table('mind_obsessions').select('id').eq(
-                    'mind_id', mind_id
-                ).eq('name', name).execute()
+            data = {
+                'mind_id': mind_id,
+                'name': name,
+                'intensity_10': intensity,
+                'notes': obsession.get('notes'),
+                'driven_by': driven_by
+            }
 
-                if existing.data and len(existing.data) > 0:
-                    obs_id = existing.data[0]['id']
-                    result = self.client.table('mind_obsessions').update(data).eq('id', obs_id).execute()
-                else:
-                    result = self.client.table('mind_obsessions').insert(data).execute()
+            # Filter None values
+            rows.append({k: v for k, v in data.items() if v is not None})
 
-                if result.data and len(result.data) > 0:
-                    created_ids.append(result.data[0]['id'])
+        created_ids = []
+        with self._safe_write():
+            ids = self._bulk_upsert('mind_obsessions', rows, on_conflict='mind_id,name')
+            created_ids = [i for i in ids if i]
 
         logger.info(f"✓ Saved {len(created_ids)}/{len(obsessions)} obsessions for mind {mind_id}")
         return created_ids
@@ -665,15 +1145,100 @@ class MMOSPersister:
     # PHASE 4: SYNTHESIS
     # ═══════════════════════════════════════════════════════════════════════════
 
+    def _fragment_index(self, mind_id: str, source_id: Optional[str]) -> Optional[Dict[str, tuple]]:
+        """
+        content_hash -> (fragment id, signature) for a mind/source, loaded
+        with one paged select and cached for MMOS_LOOKUP_TTL seconds.
+
+        Returns None when the fragments table has no content_hash column
+        (dedup is then switched off for this persister); other errors raise.
+        """
+        cache_key = (mind_id, source_id)
+        with self._lookup_lock:
+            cached = self._fragment_hashes.get(cache_key)
+            if cached and time.monotonic() - cached[0] < LOOKUP_TTL_SECONDS:
+                return cached[1]
+
+        def page(start: int):
+            query = self.client.table('fragments').select(FRAGMENT_INDEX_COLUMNS).eq('mind_id', mind_id)
+            # eq() never matches NULL
+            query = query.is_('source_id', 'null') if source_id is None else query.eq('source_id', source_id)
+            return query.order('id').range(start, start + LOOKUP_PAGE_SIZE - 1)
+
+        index: Dict[str, tuple] = {}
+        legacy_ids: List[str] = []
+        try:
+            start = 0
+            while True:
+                result = page(start).execute()
+                rows = result.data or []
+                for row in rows:
+                    if row.get('content_hash'):
+                        index[row['content_hash']] = (row['id'], _fragment_signature(row))
+                    else:
+                        legacy_ids.append(row['id'])
+                if len(rows) < LOOKUP_PAGE_SIZE:
+                    break
+                start += LOOKUP_PAGE_SIZE
+        except Exception as e:
+            if not _missing_column(e, 'content_hash'):
+                # Inserting blind would duplicate fragments; let the save fail
+                raise
+            logger.warning(f"✗ Fragment dedup disabled (needs fragments.content_hash): {e}")
+            self._fragment_dedup = False
+            return None
+
+        if legacy_ids:
+            index.update(self._backfill_content_hashes(legacy_ids))
+
+        with self._lookup_lock:
+            self._fragment_hashes[cache_key] = (time.monotonic(), index)
+        return index
+
+    def _backfill_content_hashes(self, fragment_ids: List[str]) -> Dict[str, tuple]:
+        """Hash fragments stored before dedup existed and save their content_hash."""
+        index: Dict[str, tuple] = {}
+        updates = []
+        for start in range(0, len(fragment_ids), LOOKUP_PAGE_SIZE):
+            chunk = fragment_ids[start:start + LOOKUP_PAGE_SIZE]
+            result = self.client.table('fragments').select(
+                FRAGMENT_INDEX_COLUMNS + ', mind_id, content'
+            ).in_('id', chunk).execute()
+            for row in result.data or []:
+                if not row.get('content'):
+                    continue
+                content_hash = fragment_content_hash(row['content'])
+                # Older duplicates keep no hash, so they are not matched twice
+                if content_hash in index:
+                    continue
+                index[content_hash] = (row['id'], _fragment_signature(row))
+                updates.append({**row, 'content_hash': content_hash})
+
+        if updates:
+            self._bulk_upsert('fragments', updates, on_conflict='id')
+            logger.info(f"✓ Backfilled content_hash for {len(updates)} fragments")
+        return index
+
+    @_queued()
     def save_fragments(
         self,
         mind_id: str,
         source_id: str,
         fragments: List[Dict[str, Any]],
-        category_id: int = 1
-    ) -> List[str]:
+        category_id: int = 1,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
-        Save knowledge base fragments (for RAG).
+        Save knowledge base fragments (for RAG), idempotently.
+
+        Each fragment is keyed by the hash of its normalized content
+        (fragments.content_hash) per mind and source. Hashes already stored
+        are preloaded once, so on a re-run unchanged fragments are skipped
+        without queries, fragments whose other fields changed are updated in
+        place, and only new content is inserted (in chunks, several chunks at
+        a time, with 429/5xx retried with exponential backoff). Set
+        MMOS_FRAGMENT_DEDUP=false to always insert.
 
         Args:
             mind_id: UUID of the mind
@@ -687,45 +1252,123 @@ class MMOSPersister:
                 - relevance: Relevance score 0-10
                 - metadata: Optional additional metadata
             category_id: Category ID (default 1)
+            batch_size: Fragments per insert (default MMOS_FRAGMENT_BATCH_SIZE)
+            concurrency: Concurrent inserts (default MMOS_DB_CONCURRENCY)
 
         Returns:
-            List of created fragment UUIDs
+            Dict with:
+                - inserted / updated / unchanged / failed: fragment counts
+                - ids: fragment UUID per input fragment, in input order
+                  (None where the write failed or the fragment had no content)
         """
+        report: Dict[str, Any] = {
+            'inserted': 0, 'updated': 0, 'unchanged': 0, 'failed': 0, 'ids': [None] * len(fragments)
+        }
         if not self._is_enabled():
-            return []
+            return report
 
-        created_ids = []
+        rows = []
+        # Input position of each row (fragments without content get no row)
+        positions = []
 
-        for fragment in fragments:
-            with self._safe_write():
-                content = fragment.get('content')
-                if not content:
-                    continue
-
-                relevance = fragment.get('relevance', 5)
-                relevance = max(0, min(10, relevance))  # Clamp 0-10
+        for input_position, fragment in enumerate(fragments):
+            content = fragment.get('content')
+            if not content:
+                continue
+            positions.append(input_position)
 
-                data = {
-                    'mind_id': mind_id,
-                    'source_id': source_id,
-                    'category_id': category_id,
-                    'type': fragment.get('type', 'quote'),
-                    'content': content,
-                    'context': fragment.get('context', ''),
-                    'insight': fragment.get('insight', ''),
-                    'location': fragment.get('location', ''),
-                    'relevance': relevance,
-                    'metadata': fragment.get('metadata', {})
-                }
+            relevance = fragment.get('relevance', 5)
+            relevance = max(0, min(10, relevance))  # Clamp 0-10
 
-                result = self.client.table('fragments').insert(data).execute()
+            rows.append({
+                'mind_id': mind_id,
+                'source_id': source_id,
+                'category_id': category_id,
+                'type': fragment.get('type', 'quote'),
+                'content': content,
+                'context': fragment.get('context', ''),
+                'insight': fragment.get('insight', ''),
+                'location': fragment.get('location', ''),
+                'relevance': relevance,
+                'metadata': fragment.get('metadata', {})
+            })
 
-                if result.data and len(result.data) > 0:
-                    created_ids.append(result.data[0]['id'])
+        report['failed'] = len(rows)
+        with self._safe_write():
+            index = self._fragment_index(mind_id, source_id) if self._fragment_dedup else None
+            if index is None:
+                ids = self._batch_insert('fragments', rows, batch_size, concurrency)
+                report['inserted'] = sum(1 for i in ids if i)
+                report['failed'] = len(ids) - report['inserted']
+                report['ids'] = self._ids_by_input(len(fragments), positions, ids)
+                logger.info(f"✓ Saved {report['inserted']}/{len(fragments)} fragments for mind {mind_id}")
+                return report
+
+            # Classify against stored hashes (and earlier fragments of this batch)
+            ids: List[Optional[str]] = [None] * len(rows)
+            to_insert, to_update, duplicates = [], [], []
+            first_seen: Dict[str, int] = {}
+            for position, row in enumerate(rows):
+                row['content_hash'] = fragment_content_hash(row['content'])
+                if row['content_hash'] in first_seen:
+                    duplicates.append((position, first_seen[row['content_hash']]))
+                    continue
+                first_seen[row['content_hash']] = position
+
+                stored = index.get(row['content_hash'])
+                if stored is None:
+                    to_insert.append(position)
+                elif stored[1] != _fragment_signature(row):
+                    to_update.append(position)
+                    ids[position] = stored[0]
+                else:
+                    report['unchanged'] += 1
+                    ids[position] = stored[0]
+
+            if to_update:
+                updated = self._bulk_upsert(
+                    'fragments', [{**rows[p], 'id': ids[p]} for p in to_update], on_conflict='id'
+                )
+                for position, fragment_id in zip(to_update, updated):
+                    ids[position] = fragment_id
+                    if fragment_id:
+                        report['updated'] += 1
+                        index[rows[position]['content_hash']] = (fragment_id, _fragment_signature(rows[position]))
+
+            if to_insert:
+                inserted = self._batch_insert(
+                    'fragments', [rows[p] for p in to_insert], batch_size, concurrency
+                )
+                for position, fragment_id in zip(to_insert, inserted):
+                    ids[position] = fragment_id
+                    if fragment_id:
+                        report['inserted'] += 1
+                        index[rows[position]['content_hash']] = (fragment_id, _fragment_signature(rows[position]))
+
+            # Repeats within the batch share the id of their first occurrence
+            for position, first in duplicates:
+                ids[position] = ids[first]
+                report['unchanged'] += 1 if ids[first] else 0
+
+            report['failed'] = sum(1 for i in ids if not i)
+            report['ids'] = self._ids_by_input(len(fragments), positions, ids)
+
+        logger.info(
+            f"✓ Saved fragments for mind {mind_id}: {report['inserted']} inserted, "
+            f"{report['updated']} updated, {report['unchanged']} unchanged"
+            + (f", {report['failed']} failed" if report['failed'] else "")
+        )
+        return report
 
-        logger.info(f"✓ Saved {len(created_ids)}/{len(fragments)} fragments for mind {mind_id}")
-        return created_ids
+    @staticmethod
+    def _ids_by_input(count: int, positions: List[int], ids: List[Optional[str]]) -> List[Optional[str]]:
+        """Spread per-row ids back over the input fragments (None for the rest)."""
+        by_input: List[Optional[str]] = [None] * count
+        for position, fragment_id in zip(positions, ids):
+            by_input[position] = fragment_id
+        return by_input
 
+    @_queued(key=('mind_id',), list_arg='tools', item_key='tool_slug')
     def save_mind_tools(
         self,
         mind_id: str,
@@ -799,6 +1442,7 @@ class MMOSPersister:
     # PHASE 5: IMPLEMENTATION
     # ═══════════════════════════════════════════════════════════════════════════
 
+    @_queued(key=('mind_id', 'profile_type'))
     def save_mind_profile(
         self,
         mind_id: str,
@@ -865,6 +1509,7 @@ class MMOSPersister:
     # PHASE 6: TESTING
     # ═══════════════════════════════════════════════════════════════════════════
 
+    @_queued(key=('mind_id',))
     def update_mind_fidelity(
         self,
         mind_id: str,
@@ -927,6 +1572,7 @@ class MMOSPersister:
     # TRACKING & UTILITIES
     # ═══════════════════════════════════════════════════════════════════════════
 
+    @_queued()
     def track_job_execution(
         self,
         name: str,
@@ -993,6 +1639,7 @@ class MMOSPersister:
             logger.warning(f"✗ Failed to track job: {name}")
             return None
 
+    @_queued(flush=True)
     def update_pipeline_status(
         self,
         mind_id: str,
@@ -1014,6 +1661,10 @@ class MMOSPersister:
         if not self._is_enabled():
             return False
 
+        # Later calls are attributed to the new phase in persister.metrics
+        self.metrics.set_phase(status)
+        success = False
+
         with self._safe_write():
             # Fetch existing mmos_metadata
             existing = self.client.table('minds').select('mmos_metadata').eq('id', mind_id).execute()
@@ -1036,20 +1687,25 @@ class MMOSPersister:
                 'updated_at': self._now()
             }).eq('id', mind_id).execute()
 
-            success = result.data and len(result.data) > 0
+            success = bool(result.data)
             if success:
                 logger.info(f"✓ Updated pipeline status for mind {mind_id}: {status}")
-            return success
+
+        if status == 'completed':
+            self.metrics.report()
+        return success
 
     # ═══════════════════════════════════════════════════════════════════════════
     # DRIVER INFERENCE
     # ═══════════════════════════════════════════════════════════════════════════
 
-    def infer_drivers_from_scores(self, mind_id: str) -> List[Dict[str, Any]]:
+    def infer_drivers_from_scores(self, mind_id: str, local: bool = False) -> List[Dict[str, Any]]:
         """
         Infer drivers from component scores using component_driver_map.
 
-        Uses SQL function: infer_drivers_from_scores(mind_id)
+        Uses SQL function: infer_drivers_from_scores(mind_id), or with
+        local=True the client-side DriverInferenceEngine (see
+        driver_engine()), which keeps component_driver_map in memory.
 
         This function:
         1. Looks up scores in mind_component_scores
@@ -1059,6 +1715,7 @@ class MMOSPersister:
 
         Args:
             mind_id: UUID of the mind
+            local: Compute client-side instead of calling the RPC
 
         Returns:
             List of dicts with:
@@ -1074,6 +1731,15 @@ class MMOSPersister:
         if not self._is_enabled():
             return []
 
+        if local:
+            try:
+                drivers = self.driver_engine().infer(mind_id)
+                logger.info(f"✓ Inferred {len(drivers)} drivers for mind {mind_id} (local)")
+                return drivers
+            except Exception as e:
+                logger.error(f"Failed to infer drivers locally for mind {mind_id}: {e}")
+                return []
+
         try:
             # Call the SQL function via RPC
             result = self.client.rpc(
@@ -1090,6 +1756,20 @@ class MMOSPersister:
             logger.error(f"Failed to infer drivers for mind {mind_id}: {e}")
             return []
 
+    def driver_engine(self, reload: bool = False) -> DriverInferenceEngine:
+        """
+        Client-side driver inference over a cached component_driver_map.
+
+        Loaded on first use; pass reload=True after changing the map. Use it
+        directly for batch inference (infer_all) or what-if scores
+        (infer_scores).
+        """
+        if self._driver_engine is None:
+            self._driver_engine = DriverInferenceEngine(self.client)
+        if reload or not self._driver_engine.loaded:
+            self._driver_engine.load()
+        return self._driver_engine
+
     def get_component_driver_mappings(self, component_slug: str) -> List[Dict[str, Any]]:
         """
         Get all driver mappings for a component.
@@ -1177,6 +1857,8 @@ class MMOSPersister:
 
             if result.data and len(result.data) > 0:
                 mapping_id = result.data[0]['id']
+                if self._driver_engine is not None:
+                    self._driver_engine.invalidate()
                 logger.info(f"✓ Saved component-driver mapping: {component_slug} → {driver_slug}")
                 return mapping_id
 
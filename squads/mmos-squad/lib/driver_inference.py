@@ -0,0 +1,229 @@
+"""
+MMOS Driver Inference Engine
+============================
+Client-side port of the infer_drivers_from_scores(p_mind_id) SQL function.
+
+component_driver_map is loaded once into a component x driver weight matrix;
+driver strengths are then computed for one mind, every mind, or hypothetical
+scores (what-if) without further database round trips:
+
+    strength[d] = Σ w(c,d) · s'(c) / Σ w(c,d)     over scored components c
+
+    w: primary 1.0, secondary 0.7, partial 0.5, inverse 1.0
+    s': the component score, or 100 - score for inverse mappings
+
+With numpy installed all minds are scored in one matrix product; without it
+a sparse pure-Python loop gives the same results.
+
+Usage:
+    engine = DriverInferenceEngine(persister.client)
+    engine.infer(mind_id)                        # same rows as the RPC
+    engine.infer_all()                           # {mind_id: rows}
+    engine.infer_scores({'mbti-ei': 20, 'big-five-openness': 90})   # what-if
+
+Author: MMOS Team
+Created: 2026-10-17
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+RELEVANCE_WEIGHTS = {'primary': 1.0, 'secondary': 0.7, 'partial': 0.5, 'inverse': 1.0}
+DEFAULT_WEIGHT = 0.5
+PAGE_SIZE = 1000
+
+
+def _fetch_all(client: Any, table: str, columns: str = '*', **filters: Any) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    while True:
+        query = client.table(table).select(columns)
+        for column, value in filters.items():
+            query = query.eq(column, value)
+        page = query.range(len(rows), len(rows) + PAGE_SIZE - 1).execute().data or []
+        rows.extend(page)
+        if len(page) < PAGE_SIZE:
+            return rows
+
+
+class DriverInferenceEngine:
+    """
+    Weighted driver inference over a cached component_driver_map.
+
+    Args:
+        client: Database client (supabase-py, SQLiteClient or MemoryClient)
+        use_numpy: Vectorize with numpy (default: when installed)
+    """
+
+    def __init__(self, client: Any, use_numpy: Optional[bool] = None):
+        self.client = client
+        self.use_numpy = HAS_NUMPY if use_numpy is None else (use_numpy and HAS_NUMPY)
+        self.loaded = False
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # LOADING
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def load(self) -> 'DriverInferenceEngine':
+        """(Re)load drivers, components and component_driver_map."""
+        components = _fetch_all(self.client, 'system_components', 'id, slug, name')
+        drivers = _fetch_all(self.client, 'drivers', 'id, slug, name, driver_type')
+        mappings = _fetch_all(self.client, 'component_driver_map', 'component_id, driver_id, relevance')
+
+        self.components = components
+        self.drivers = drivers
+        self.component_index = {c['id']: i for i, c in enumerate(components)}
+        self.component_slugs = {c['slug']: i for i, c in enumerate(components) if c.get('slug')}
+        driver_index = {d['id']: i for i, d in enumerate(drivers)}
+
+        # Sparse edges per component: [(driver, weight, inverse)]
+        self.edges: Dict[int, List[Tuple[int, float, bool]]] = {}
+        for mapping in mappings:
+            c = self.component_index.get(mapping.get('component_id'))
+            d = driver_index.get(mapping.get('driver_id'))
+            if c is None or d is None:
+                continue
+            relevance = mapping.get('relevance')
+            self.edges.setdefault(c, []).append(
+                (d, RELEVANCE_WEIGHTS.get(relevance, DEFAULT_WEIGHT), relevance == 'inverse')
+            )
+
+        if self.use_numpy:
+            shape = (len(components), len(drivers))
+            self.direct_weights = np.zeros(shape)
+            self.inverse_weights = np.zeros(shape)
+            for c, edges in self.edges.items():
+                for d, weight, inverse in edges:
+                    # Duplicate (component, driver) rows add up, as in the SQL join
+                    (self.inverse_weights if inverse else self.direct_weights)[c, d] += weight
+
+        self.loaded = True
+        logger.info(
+            f"✓ Loaded driver inference map: {sum(map(len, self.edges.values()))} mappings, "
+            f"{len(components)} components, {len(drivers)} drivers"
+        )
+        return self
+
+    def invalidate(self) -> None:
+        """Reload the map on next use."""
+        self.loaded = False
+
+    def _ensure_loaded(self) -> None:
+        if not self.loaded:
+            self.load()
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # INFERENCE
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def infer(self, mind_id: str) -> List[Dict[str, Any]]:
+        """Inferred drivers for one mind, like the infer_drivers_from_scores RPC."""
+        self._ensure_loaded()
+        rows = _fetch_all(
+            self.client, 'mind_component_scores', 'mind_id, component_id, score_numeric', mind_id=mind_id
+        )
+        return self._infer_matrix([mind_id], rows).get(mind_id, [])
+
+    def infer_all(self, mind_ids: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Inferred drivers for many minds in one pass.
+
+        Args:
+            mind_ids: Minds to score (default: every mind with component scores)
+
+        Returns:
+            mind_id -> inferred driver rows
+        """
+        self._ensure_loaded()
+        rows = _fetch_all(self.client, 'mind_component_scores', 'mind_id, component_id, score_numeric')
+        if mind_ids is None:
+            mind_ids = list(dict.fromkeys(row['mind_id'] for row in rows))
+        return self._infer_matrix(mind_ids, rows)
+
+    def infer_scores(self, scores: Dict[str, float]) -> List[Dict[str, Any]]:
+        """
+        What-if inference from component scores, without touching the database.
+
+        Args:
+            scores: component slug (or id) -> score 0-100
+        """
+        self._ensure_loaded()
+        rows = []
+        for key, score in scores.items():
+            c = self.component_slugs.get(key, self.component_index.get(key))
+            if c is None:
+                logger.warning(f"✗ Component not found: {key}")
+                continue
+            rows.append({'mind_id': None, 'component_id': self.components[c]['id'], 'score_numeric': score})
+        return self._infer_matrix([None], rows).get(None, [])
+
+    def _infer_matrix(self, mind_ids: List[Any], rows: List[Dict[str, Any]]) -> Dict[Any, List[Dict[str, Any]]]:
+        mind_index = {m: i for i, m in enumerate(mind_ids)}
+        scores: Dict[Tuple[int, int], float] = {}
+        for row in rows:
+            m = mind_index.get(row.get('mind_id'))
+            c = self.component_index.get(row.get('component_id'))
+            if m is not None and c is not None and row.get('score_numeric') is not None:
+                scores[(m, c)] = float(row['score_numeric'])
+
+        if self.use_numpy:
+            strengths, weights = self._strengths_numpy(len(mind_ids), scores)
+        else:
+            strengths, weights = self._strengths_python(len(mind_ids), scores)
+
+        # Source components per (mind, driver), in component order
+        sources: Dict[Tuple[int, int], List[str]] = {}
+        for m, c in sorted(scores):
+            for d, _, _ in self.edges.get(c, ()):
+                sources.setdefault((m, d), []).append(self.components[c].get('name'))
+
+        results: Dict[Any, List[Dict[str, Any]]] = {}
+        for mind_id, m in mind_index.items():
+            inferred = []
+            for d, driver in enumerate(self.drivers):
+                if weights[m][d] <= 0:
+                    continue
+                inferred.append({
+                    'driver_slug': driver.get('slug'),
+                    'driver_name': driver.get('name'),
+                    'driver_type': driver.get('driver_type'),
+                    'inferred_strength': round(float(strengths[m][d]), 2),
+                    'source_components': sources.get((m, d), [])
+                })
+            inferred.sort(key=lambda r: -r['inferred_strength'])
+            results[mind_id] = inferred
+        return results
+
+    def _strengths_numpy(self, minds: int, scores: Dict[Tuple[int, int], float]):
+        values = np.zeros((minds, len(self.components)))
+        present = np.zeros((minds, len(self.components)))
+        for (m, c), score in scores.items():
+            values[m, c] = score
+            present[m, c] = 1.0
+
+        numerator = values @ self.direct_weights + (100.0 * present - values) @ self.inverse_weights
+        weights = present @ (self.direct_weights + self.inverse_weights)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            strengths = np.where(weights > 0, numerator / weights, 0.0)
+        # Lists index faster than arrays when building the result rows
+        return strengths.tolist(), weights.tolist()
+
+    def _strengths_python(self, minds: int, scores: Dict[Tuple[int, int], float]):
+        numerator = [[0.0] * len(self.drivers) for _ in range(minds)]
+        weights = [[0.0] * len(self.drivers) for _ in range(minds)]
+        for (m, c), score in scores.items():
+            for d, weight, inverse in self.edges.get(c, ()):
+                numerator[m][d] += weight * (100.0 - score if inverse else score)
+                weights[m][d] += weight
+        strengths = [
+            [n / w if w > 0 else 0.0 for n, w in zip(num_row, w_row)]
+            for num_row, w_row in zip(numerator, weights)
+        ]
+        return strengths, weights
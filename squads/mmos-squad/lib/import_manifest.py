@@ -0,0 +1,173 @@
+"""
+MMOS Import Manifest
+====================
+Per-mind record of what SourcesImporter has imported, so re-imports only
+touch files that changed.
+
+For every imported source and artifact the manifest keeps:
+- the file's size and mtime (checked without reading the file)
+- a SHA-256 of the file, read in chunks (checked when the stat changed,
+  e.g. after a checkout that rewrote an identical file)
+- a hash of its sources.yaml entry / artifact info, so title or status edits
+  count as changes
+- the contents row it was imported as
+
+Manifests live under MMOS_IMPORT_MANIFEST_DIR, one directory per database
+(keyed by a hash of the connection URL), as {mind_slug}.json. They are only
+written after the import transaction commits.
+
+Author: MMOS Team
+Created: 2026-10-17
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+MANIFEST_DIR = Path(os.getenv(
+    'MMOS_IMPORT_MANIFEST_DIR',
+    str(Path.home() / '.aios' / 'mmos' / 'import-manifests')
+))
+MANIFEST_VERSION = 1
+HASH_CHUNK_BYTES = 1024 * 1024
+
+# (size, mtime_ns); None for a missing file
+FileState = Optional[Tuple[int, int]]
+
+
+def file_state(path: Optional[Path]) -> FileState:
+    """Size and mtime of a file, without reading it."""
+    if path is None:
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def file_digest(path: Path, chunk_size: int = HASH_CHUNK_BYTES) -> Optional[str]:
+    """SHA-256 of a file, read chunk by chunk; None if it can't be read."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def content_hash(content: Optional[str]) -> str:
+    return hashlib.sha256((content or '').encode('utf-8')).hexdigest()
+
+
+def entry_hash(entry: Dict[str, Any]) -> str:
+    """Hash of an inventory entry (sources.yaml item or artifact info)."""
+    return hashlib.sha256(json.dumps(entry, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def database_key(db_url: Optional[str]) -> str:
+    """Directory name for a database; hashed so credentials never reach the disk."""
+    return hashlib.sha256((db_url or 'default').encode('utf-8')).hexdigest()[:16]
+
+
+class ImportManifest:
+    """
+    slug -> last imported state, for one mind and one database.
+
+    Args:
+        path: Manifest JSON file (missing or unreadable means empty)
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data.get('version') == MANIFEST_VERSION:
+                self.entries = data.get('entries') or {}
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    @classmethod
+    def for_mind(cls, mind_slug: str, db_url: Optional[str],
+                 manifest_dir: Path = MANIFEST_DIR) -> 'ImportManifest':
+        return cls(Path(manifest_dir) / database_key(db_url) / f"{mind_slug}.json")
+
+    def unchanged(self, slug: str, content_id: Optional[str], entry: str, state: FileState) -> bool:
+        """
+        True if `slug` was imported as `content_id` from the same entry and a
+        file with the same size and mtime (no need to read it).
+        """
+        recorded = self.entries.get(slug)
+        return bool(
+            recorded
+            and content_id is not None
+            and recorded.get('content_id') == content_id
+            and recorded.get('entry_hash') == entry
+            and _state(recorded) == state
+        )
+
+    def same_content(self, slug: str, content_id: Optional[str], entry: str, digest: str) -> bool:
+        """True if the file was rewritten with the content already imported."""
+        recorded = self.entries.get(slug)
+        return bool(
+            recorded
+            and content_id is not None
+            and recorded.get('content_id') == content_id
+            and recorded.get('entry_hash') == entry
+            and recorded.get('content_hash') == digest
+        )
+
+    def record(self, slug: str, kind: str, content_id: str, entry: str,
+               file_path: Optional[str], state: FileState, digest: str) -> None:
+        self.entries[slug] = {
+            'kind': kind,
+            'content_id': content_id,
+            'entry_hash': entry,
+            'file_path': file_path,
+            'size': state[0] if state else None,
+            'mtime_ns': state[1] if state else None,
+            'content_hash': digest,
+            'imported_at': datetime.now().isoformat(),
+        }
+
+    def touch(self, slug: str, state: FileState) -> None:
+        """Store a new stat for an entry whose content did not change."""
+        recorded = self.entries.get(slug)
+        if recorded:
+            recorded['size'], recorded['mtime_ns'] = state if state else (None, None)
+
+    def prune(self, kind: str, slugs: Iterable[str]) -> None:
+        """Drop entries of `kind` that are no longer in the inventory."""
+        keep = set(slugs)
+        self.entries = {
+            slug: recorded for slug, recorded in self.entries.items()
+            if recorded.get('kind') != kind or slug in keep
+        }
+
+    def save(self) -> None:
+        """Write atomically (temp file + rename)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{self.path.name}.", dir=str(self.path.parent))
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'version': MANIFEST_VERSION, 'entries': self.entries}, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+
+def _state(recorded: Dict[str, Any]) -> FileState:
+    if recorded.get('size') is None:
+        return None
+    return (recorded['size'], recorded['mtime_ns'])
@@ -0,0 +1,240 @@
+"""
+MMOS In-Memory Database Client
+==============================
+Local stand-in for the supabase-py client, for offline runs, benchmarks and
+tests of MMOSPersister without a network.
+
+Supports the subset of the fluent API the persister uses:
+
+    client.table('fragments').insert([...]).execute()
+    client.table('minds').select('id').eq('slug', 'sam_altman').execute()
+    client.table('mind_drivers').upsert(rows, on_conflict='mind_id,driver_id').execute()
+
+Optional simulated latency and injected 429/503 failures make it usable for
+throughput and retry benchmarks.
+
+Usage:
+    client = MemoryClient(latency_ms=20, fail_rate=0.05)
+    persister = MMOSPersister(client=client)
+
+Author: MMOS Team
+Created: 2026-10-17
+"""
+
+import copy
+import random
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class MemoryClientError(Exception):
+    """Simulated HTTP error (status_code 429 or 5xx)."""
+
+    def __init__(self, status_code: int, message: str = ''):
+        super().__init__(message or f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class MemoryResponse:
+    """Mirrors the `.data` attribute of a supabase-py APIResponse."""
+
+    def __init__(self, data: Any):
+        self.data = data
+
+
+class MemoryQuery:
+    """One fluent query against a MemoryClient table."""
+
+    def __init__(self, client: 'MemoryClient', table: str):
+        self._client = client
+        self._table = table
+        self._op = 'select'
+        self._payload: Any = None
+        self._on_conflict: List[str] = []
+        self._filters: List[Tuple[str, str, Any]] = []
+        self._range: Optional[Tuple[int, int]] = None
+        self._order: Optional[Tuple[str, bool]] = None
+
+    # ── operations ────────────────────────────────────────────────────────
+
+    def select(self, columns: str = '*', **kwargs) -> 'MemoryQuery':
+        self._op = 'select'
+        return self
+
+    def insert(self, payload: Any, **kwargs) -> 'MemoryQuery':
+        self._op = 'insert'
+        self._payload = payload
+        return self
+
+    def upsert(self, payload: Any, on_conflict: str = 'id', **kwargs) -> 'MemoryQuery':
+        self._op = 'upsert'
+        self._payload = payload
+        self._on_conflict = [c.strip() for c in on_conflict.split(',')]
+        return self
+
+    def update(self, payload: Dict[str, Any], **kwargs) -> 'MemoryQuery':
+        self._op = 'update'
+        self._payload = payload
+        return self
+
+    def delete(self, **kwargs) -> 'MemoryQuery':
+        self._op = 'delete'
+        return self
+
+    # ── filters ───────────────────────────────────────────────────────────
+
+    def eq(self, column: str, value: Any) -> 'MemoryQuery':
+        self._filters.append(('eq', column, value))
+        return self
+
+    def in_(self, column: str, values: List[Any]) -> 'MemoryQuery':
+        self._filters.append(('in', column, list(values)))
+        return self
+
+    def is_(self, column: str, value: Any) -> 'MemoryQuery':
+        """IS NULL filter (supabase-py's is_(column, 'null'))."""
+        self._filters.append(('is', column, None if value in (None, 'null') else value))
+        return self
+
+    def range(self, start: int, end: int) -> 'MemoryQuery':
+        self._range = (start, end)
+        return self
+
+    def limit(self, count: int) -> 'MemoryQuery':
+        self._range = (0, count - 1)
+        return self
+
+    def order(self, column: str, desc: bool = False) -> 'MemoryQuery':
+        self._order = (column, desc)
+        return self
+
+    def _matches(self, row: Dict[str, Any]) -> bool:
+        for op, column, value in self._filters:
+            if op == 'eq' and row.get(column) != value:
+                return False
+            if op == 'in' and row.get(column) not in value:
+                return False
+            if op == 'is' and row.get(column) is not value:
+                return False
+        return True
+
+    # ── execution ─────────────────────────────────────────────────────────
+
+    def execute(self) -> MemoryResponse:
+        self._client._before_request(self._table, self._op)
+        with self._client._lock:
+            rows = self._client.tables.setdefault(self._table, [])
+            return MemoryResponse(copy.deepcopy(getattr(self, f'_execute_{self._op}')(rows)))
+
+    def _execute_select(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        result = [row for row in rows if self._matches(row)]
+        if self._order:
+            column, desc = self._order
+            result.sort(key=lambda row: (row.get(column) is None, row.get(column)), reverse=desc)
+        if self._range:
+            result = result[self._range[0]:self._range[1] + 1]
+        return result
+
+    def _payload_rows(self) -> List[Dict[str, Any]]:
+        return self._payload if isinstance(self._payload, list) else [self._payload]
+
+    def _execute_insert(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        inserted = []
+        for payload in self._payload_rows():
+            row = {'id': str(uuid.uuid4()), **copy.deepcopy(payload)}
+            rows.append(row)
+            inserted.append(row)
+        return inserted
+
+    def _execute_upsert(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        saved = []
+        for payload in self._payload_rows():
+            existing = next(
+                (row for row in rows if all(row.get(c) == payload.get(c) for c in self._on_conflict)),
+                None
+            )
+            if existing is not None:
+                existing.update(copy.deepcopy(payload))
+                saved.append(existing)
+            else:
+                row = {'id': str(uuid.uuid4()), **copy.deepcopy(payload)}
+                rows.append(row)
+                saved.append(row)
+        return saved
+
+    def _execute_update(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        updated = []
+        for row in rows:
+            if self._matches(row):
+                row.update(copy.deepcopy(self._payload))
+                updated.append(row)
+        return updated
+
+    def _execute_delete(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        deleted = [row for row in rows if self._matches(row)]
+        rows[:] = [row for row in rows if not self._matches(row)]
+        return deleted
+
+
+class MemoryRPC:
+    def __init__(self, client: 'MemoryClient', name: str, params: Dict[str, Any]):
+        self._client = client
+        self._name = name
+        self._params = params
+
+    def execute(self) -> MemoryResponse:
+        self._client._before_request(self._name, 'rpc')
+        handler = self._client.rpc_handlers.get(self._name)
+        return MemoryResponse(handler(self._client, self._params) if handler else [])
+
+
+class MemoryClient:
+    """
+    In-memory, thread-safe stand-in for supabase.Client.
+
+    Attributes:
+        tables: table name -> list of row dicts
+        requests: Number of executed requests
+        rpc_handlers: rpc name -> callable(client, params) returning rows
+    """
+
+    def __init__(
+        self,
+        tables: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        latency_ms: float = 0.0,
+        fail_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            tables: Initial rows per table (e.g. reference tables)
+            latency_ms: Simulated round-trip time per request
+            fail_rate: Fraction of requests that fail with 429/503
+            seed: Random seed for reproducible failures
+        """
+        self.tables: Dict[str, List[Dict[str, Any]]] = copy.deepcopy(tables) if tables else {}
+        self.latency_ms = latency_ms
+        self.fail_rate = fail_rate
+        self.requests = 0
+        self.rpc_handlers: Dict[str, Any] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def table(self, name: str) -> MemoryQuery:
+        return MemoryQuery(self, name)
+
+    def rpc(self, name: str, params: Optional[Dict[str, Any]] = None) -> MemoryRPC:
+        return MemoryRPC(self, name, params or {})
+
+    def _before_request(self, target: str, op: str) -> None:
+        with self._lock:
+            self.requests += 1
+            fail = self.fail_rate > 0 and self._random.random() < self.fail_rate
+            status = self._random.choice((429, 503))
+        if self.latency_ms:
+            # Outside the lock, so concurrent requests overlap like real ones
+            time.sleep(self.latency_ms / 1000)
+        if fail:
+            raise MemoryClientError(status, f"Simulated HTTP {status} on {op} {target}")
@@ -0,0 +1,255 @@
+"""
+MMOS Database Resilience
+========================
+Shared retry policy and circuit breaker for MMOSPersister client calls.
+
+- RetryPolicy: which errors are transient (429, 5xx, timeouts, dropped
+  connections) and how long to back off before the next attempt
+  (exponential, with full jitter so concurrent writers do not retry in
+  lockstep)
+- CircuitBreaker: after MMOS_DB_BREAKER_THRESHOLD consecutive transient
+  failures the circuit opens and calls fail fast with CircuitOpenError
+  instead of waiting on a degraded database. After MMOS_DB_BREAKER_RESET
+  seconds one probe call is let through; success closes the circuit again
+- GuardedClient: client proxy that runs every execute() through a breaker
+  and retries transient failures with the policy's backoff
+
+MMOSPersister diverts writes made while the circuit is open to its
+write-behind journal and replays them once it closes (see db_persister.py).
+
+Author: MMOS Team
+Created: 2026-10-17
+"""
+
+import os
+import time
+import random
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DB_MAX_RETRIES = int(os.getenv('MMOS_DB_MAX_RETRIES', '5'))
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+BREAKER_THRESHOLD = int(os.getenv('MMOS_DB_BREAKER_THRESHOLD', '5'))
+BREAKER_RESET_SECONDS = float(os.getenv('MMOS_DB_BREAKER_RESET', '30'))
+
+CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the database while the circuit is open."""
+
+
+def error_status(error: Exception) -> Optional[int]:
+    """HTTP status carried by a client exception, if any."""
+    for candidate in (error, getattr(error, 'response', None)):
+        status = getattr(candidate, 'status_code', None)
+        if isinstance(status, int):
+            return status
+    code = getattr(error, 'code', None)
+    # PostgREST puts SQLSTATEs (e.g. '42703') in code too; only 3 digits is HTTP
+    if isinstance(code, str) and code.isdigit() and len(code) == 3:
+        return int(code)
+    return None
+
+
+class RetryPolicy:
+    """
+    Transient-error classification and jittered exponential backoff.
+
+    Args:
+        max_retries: Retries after the first attempt (MMOS_DB_MAX_RETRIES)
+        base_delay: Backoff ceiling for the first retry, in seconds
+        max_delay: Upper bound for any backoff
+        jitter: Sleep a random time up to the ceiling (full jitter)
+    """
+
+    def __init__(
+        self,
+        max_retries: int = DB_MAX_RETRIES,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+        jitter: bool = True
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def is_transient(self, error: Exception) -> bool:
+        """Rate limiting (429), server errors (5xx), timeouts and connection failures."""
+        if isinstance(error, CircuitOpenError):
+            return False
+        status = error_status(error)
+        if status is not None:
+            return status == 429 or status >= 500
+        if isinstance(error, (ConnectionError, TimeoutError)):
+            return True
+        name = type(error).__name__.lower()
+        return 'timeout' in name or 'connect' in name
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        """attempt: 0 for the first call."""
+        return attempt < self.max_retries and self.is_transient(error)
+
+    def backoff(self, attempt: int) -> float:
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker (thread-safe).
+
+    Args:
+        failure_threshold: Consecutive transient failures that open the circuit
+        reset_timeout: Seconds open before a probe call is allowed
+        policy: Decides which failures count (non-transient errors mean the
+                database answered, so they count as successes)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_SECONDS,
+        policy: Optional[RetryPolicy] = None
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.policy = policy or RetryPolicy()
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self._on_close: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def on_close(self, callback: Callable[[], None]) -> None:
+        """Call `callback` whenever the circuit closes after being open."""
+        self._on_close.append(callback)
+
+    def is_open(self) -> bool:
+        """True while calls fail fast (open, and no probe due yet)."""
+        with self._lock:
+            if self.state == OPEN:
+                return time.monotonic() - self.opened_at < self.reset_timeout
+            return self.state == HALF_OPEN
+
+    def allow(self) -> bool:
+        """Whether a call may go to the database; the first call after the timeout is the probe."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+                return True
+            return False
+
+    def record(self, error: Optional[Exception] = None) -> None:
+        """Report the outcome of an allowed call."""
+        if error is not None and self.policy.is_transient(error):
+            self._record_failure(error)
+        else:
+            self._record_success()
+
+    def _record_success(self) -> None:
+        with self._lock:
+            recovered = self.state != CLOSED
+            self.state = CLOSED
+            self.failures = 0
+        if recovered:
+            logger.info("✓ Database circuit closed, replaying diverted writes")
+            for callback in self._on_close:
+                callback()
+
+    def _record_failure(self, error: Exception) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self.times_opened += 1
+                opened = True
+            else:
+                opened = False
+        if opened:
+            logger.warning(
+                f"✗ Database circuit open after {self.failures} consecutive failures ({error}); "
+                f"failing fast for {self.reset_timeout:g}s"
+            )
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CLIENT PROXY
+# ═══════════════════════════════════════════════════════════════════════════
+
+class GuardedQuery:
+    """
+    Fluent query proxy whose execute() goes through the breaker and retries
+    transient failures. `retries` counts the retries of the last execute().
+    """
+
+    def __init__(self, query: Any, breaker: CircuitBreaker, name: str, policy: Optional[RetryPolicy] = None):
+        self._query = query
+        self._breaker = breaker
+        self._name = name
+        self._policy = policy or breaker.policy
+        self.retries = 0
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._query, name)
+        if not callable(attr):
+            return attr
+
+        def chained(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            if result is not None and hasattr(result, 'execute'):
+                self._query = result
+                return self
+            return result
+
+        return chained
+
+    def execute(self) -> Any:
+        self.retries = 0
+        while True:
+            if not self._breaker.allow():
+                raise CircuitOpenError(f"Database circuit open, skipped {self._name} call")
+            try:
+                result = self._query.execute()
+            except Exception as e:
+                self._breaker.record(e)
+                # Stop as soon as the circuit opens; the caller diverts the write
+                if self._breaker.is_open() or not self._policy.should_retry(e, self.retries):
+                    raise
+                delay = self._policy.backoff(self.retries)
+                self.retries += 1
+                logger.warning(f"⟳ {self._name} call failed ({e}), retry {self.retries} in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            self._breaker.record()
+            return result
+
+
+class GuardedClient:
+    """
+    Wraps a supabase-py style client; every call checks the breaker first
+    and is retried per `policy` (default: the breaker's policy).
+    """
+
+    def __init__(self, client: Any, breaker: CircuitBreaker, policy: Optional[RetryPolicy] = None):
+        self.wrapped = client
+        self.breaker = breaker
+        self.policy = policy or breaker.policy
+
+    def table(self, name: str) -> GuardedQuery:
+        return GuardedQuery(self.wrapped.table(name), self.breaker, name, self.policy)
+
+    def rpc(self, name: str, params: Optional[Dict[str, Any]] = None) -> GuardedQuery:
+        return GuardedQuery(self.wrapped.rpc(name, params or {}), self.breaker, name, self.policy)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.wrapped, name)
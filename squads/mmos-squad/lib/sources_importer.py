@@ -6,25 +6,56 @@ Import mind sources from filesystem (outputs/minds/{mind_slug}/sources/) into Su
 Features:
 - Read sources.yaml inventory + actual content files
 - Map to contents table schema
-- Skip duplicates (based on slug)
+- Incremental re-imports: a per-mind import manifest (import_manifest.py)
+  records each imported file's size, mtime and content hash. Unchanged files
+  are skipped without being read, and changed files UPDATE their contents row,
+  so a re-import costs as much as the change, not the corpus
+- Existing contents rows of a mind's items looked up in one query
+- Multi-mind import: import_all() imports every mind under outputs/minds/
+  with a bounded worker pool (MMOS_IMPORT_WORKERS) sharing the connection pool
+- Bulk insert: new contents rows and their content_minds links go in with
+  multi-row inserts of MMOS_IMPORT_BATCH_SIZE rows, so a mind with hundreds
+  of sources takes a handful of statements
 - Raw content import (no AI processing)
-- Transaction-based safety
+- Streaming for large files: files are hashed in chunks, and batches are
+  flushed every MMOS_IMPORT_BATCH_BYTES of content. Files over
+  MMOS_IMPORT_STREAM_BYTES are never loaded whole: they become a parent row
+  plus linked part rows (parent_content_id, sequence_number) of at most
+  MMOS_IMPORT_PART_CHARS characters, streamed into the database with COPY,
+  so memory stays flat for corpora of hundreds of MB
+- Transaction-based safety: connections come from a pool shared by the
+  importer (MMOS_IMPORT_POOL_SIZE), each import run is one transaction and
+  each item gets a savepoint, so a bad item rolls back alone and a failed run
+  leaves nothing half-imported
 - Detailed import reporting
 
 Usage:
     from sources_importer import SourcesImporter
 
-    importer = SourcesImporter()
-    result = importer.import_mind_sources("sam_altman", preview=False)
-    print(result)
+    with SourcesImporter() as importer:
+        result = importer.import_mind_sources("sam_altman", preview=False)
+        print(result)
 """
 
 import os
+import io
+import csv
+import json
 import yaml
+import time
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterator, List, Optional, Any, Set, Tuple
 from datetime import datetime
 
+try:
+    from .import_manifest import MANIFEST_DIR, ImportManifest, content_hash, entry_hash, file_digest, file_state
+except ImportError:
+    from import_manifest import MANIFEST_DIR, ImportManifest, content_hash, entry_hash, file_digest, file_state
+
 # Try Supabase client first, fall back to psycopg2
 try:
     from supabase import create_client, Client
@@ -35,10 +66,76 @@ except ImportError:
 try:
     import psycopg2
     import psycopg2.extras
+    import psycopg2.pool
     HAS_PSYCOPG2 = True
 except ImportError:
     HAS_PSYCOPG2 = False
 
+# Max pooled connections per importer (min 1 is opened up front as the connection test)
+IMPORT_POOL_SIZE = int(os.getenv('MMOS_IMPORT_POOL_SIZE', '4'))
+# Minds imported concurrently by import_all() (capped at the pool size)
+IMPORT_WORKERS = int(os.getenv('MMOS_IMPORT_WORKERS', '4'))
+# Rows per multi-row INSERT
+IMPORT_BATCH_SIZE = int(os.getenv('MMOS_IMPORT_BATCH_SIZE', '500'))
+# Content held in memory before a batch is written
+IMPORT_BATCH_BYTES = int(os.getenv('MMOS_IMPORT_BATCH_BYTES', str(32 * 1024 * 1024)))
+# Files larger than this are split into parts and streamed with COPY
+IMPORT_STREAM_BYTES = int(os.getenv('MMOS_IMPORT_STREAM_BYTES', str(8 * 1024 * 1024)))
+# Characters per part (extended to the end of the line, up to PART_LINE_SLACK more)
+IMPORT_PART_CHARS = int(os.getenv('MMOS_IMPORT_PART_CHARS', str(1024 * 1024)))
+PART_LINE_SLACK = 64 * 1024
+COPY_BUFFER_BYTES = 64 * 1024
+
+# contents columns written by the importer, in insert order
+CONTENT_COLUMNS = (
+    'ai_generated', 'content_type', 'slug', 'title', 'content', 'file_path', 'status', 'metadata'
+)
+CONTENT_TEMPLATE = "(%s, %s, %s, %s, %s, %s, %s, %s::jsonb)"
+# Part rows add the link to their parent
+PART_COLUMNS = CONTENT_COLUMNS + ('parent_content_id', 'sequence_number')
+PART_COPY = f"COPY contents ({', '.join(PART_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+CONTENT_UPDATE = (
+    "UPDATE contents SET "
+    + ", ".join(f"{c} = %s::jsonb" if c == 'metadata' else f"{c} = %s" for c in CONTENT_COLUMNS if c != 'slug')
+    + " WHERE id = %s"
+)
+
+
+class ItemFailed(Exception):
+    """Rolls an import item back to its savepoint; `reason` goes into the report."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class CopyStream:
+    """
+    Read-only file object over an iterator of CSV rows, for cursor.copy_expert().
+
+    Rows are encoded as COPY asks for data, so only the current row is held.
+    """
+
+    def __init__(self, rows: Iterator[str]):
+        self._rows = rows
+        self._buffer = b''
+        self._pos = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            rest = self._buffer[self._pos:] + b''.join(row.encode('utf-8') for row in self._rows)
+            self._buffer, self._pos = b'', 0
+            return rest
+        while len(self._buffer) - self._pos < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._buffer = self._buffer[self._pos:] + row.encode('utf-8')
+            self._pos = 0
+        data = self._buffer[self._pos:self._pos + size]
+        self._pos += len(data)
+        return data
+
 
 class SourcesImporter:
     """Import MMOS mind sources into Supabase database."""
@@ -67,14 +164,36 @@ class SourcesImporter:
         'PROCESSING': 'draft',
     }
 
-    def __init__(self, db_url: Optional[str] = None):
+    def __init__(
+        self,
+        db_url: Optional[str] = None,
+        pool: Optional[Any] = None,
+        pool_size: int = IMPORT_POOL_SIZE,
+        verbose: bool = True,
+        manifest_dir: Optional[Path] = None
+    ):
         """
-        Initialize importer with database connection.
+        Initialize importer with a database connection pool.
 
         Args:
             db_url: PostgreSQL connection URL (defaults to SUPABASE_DB_URL or DATABASE_URL env var)
+            pool: Existing psycopg2 pool to share (e.g. between importers); not closed by close()
+            pool_size: Max connections when creating the pool (MMOS_IMPORT_POOL_SIZE)
+            verbose: Print per-item progress (import_all() turns it off while minds run concurrently)
+            manifest_dir: Where import manifests are kept (MMOS_IMPORT_MANIFEST_DIR)
         """
         self.db_url = db_url or os.getenv("SUPABASE_DB_URL") or os.getenv("DATABASE_URL")
+        self.verbose = verbose
+        self.manifest_dir = Path(manifest_dir) if manifest_dir else MANIFEST_DIR
+        self.project_root = Path(__file__).parent.parent.parent.parent
+        # Connection of the transaction running on this thread (see transaction())
+        self._local = threading.local()
+        self._savepoints = itertools.count(1)
+
+        if pool is not None:
+            self.pool = pool
+            self._owns_pool = False
+            return
 
         if not self.db_url:
             raise ValueError(
@@ -84,14 +203,122 @@ class SourcesImporter:
         if not HAS_PSYCOPG2:
             raise ValueError("psycopg2 not installed. Run: pip install psycopg2-binary")
 
-        # Test connection
+        # Opening the first pooled connection doubles as the connection test
         try:
-            conn = psycopg2.connect(self.db_url)
-            conn.close()
+            self.pool = psycopg2.pool.ThreadedConnectionPool(1, max(1, pool_size), self.db_url)
         except Exception as e:
             raise ValueError(f"Failed to connect to database: {e}")
+        self._owns_pool = True
 
-        self.project_root = Path(__file__).parent.parent.parent.parent
+    def __enter__(self) -> 'SourcesImporter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled connections (only if this importer created the pool)."""
+        if self._owns_pool and not self.pool.closed:
+            self.pool.closeall()
+
+    def _say(self, message: str) -> None:
+        if self.verbose:
+            print(message)
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # CONNECTIONS & TRANSACTIONS
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def _checkout(self) -> Any:
+        """Get a pooled connection, replacing ones the server has closed."""
+        conn = self.pool.getconn()
+        if conn.closed:
+            self.pool.putconn(conn, close=True)
+            conn = self.pool.getconn()
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[Any]:
+        """
+        Connection for one operation.
+
+        Inside transaction() this is the transaction's connection and nothing
+        is committed here; otherwise a pooled connection is committed (or
+        rolled back on error) and returned to the pool.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            yield conn
+            return
+
+        conn = self._checkout()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.pool.putconn(conn)
+
+    @contextmanager
+    def transaction(self) -> Iterator[Any]:
+        """
+        Run everything inside the block on one connection, in one transaction.
+
+        Commits when the block succeeds and rolls back if it raises. Nested
+        calls join the outer transaction.
+        """
+        if getattr(self._local, 'conn', None) is not None:
+            yield self._local.conn
+            return
+
+        conn = self._checkout()
+        self._local.conn = conn
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            self.pool.putconn(conn)
+
+    @contextmanager
+    def _savepoint(self) -> Iterator[None]:
+        """
+        Savepoint for one item inside transaction(): if the block raises, only
+        the item's statements are rolled back and the transaction continues.
+        """
+        conn = self._local.conn
+        name = f"item_{next(self._savepoints)}"
+        with conn.cursor() as cur:
+            cur.execute(f"SAVEPOINT {name}")
+        try:
+            yield
+        except Exception:
+            with conn.cursor() as cur:
+                cur.execute(f"ROLLBACK TO SAVEPOINT {name}")
+            raise
+        with conn.cursor() as cur:
+            cur.execute(f"RELEASE SAVEPOINT {name}")
+
+    def _import_item(self, content_data: Dict[str, Any], mind_id: str, role: str) -> str:
+        """
+        Insert one content row and its content_minds link under a savepoint.
+
+        Raises:
+            ItemFailed: with reason 'insert_failed' or 'link_failed'; nothing
+                        of the item is kept
+        """
+        with self._savepoint():
+            content_id = self.insert_content(content_data)
+            if not content_id:
+                raise ItemFailed('insert_failed')
+            if not self.link_content_to_mind(content_id, mind_id, role=role):
+                raise ItemFailed('link_failed')
+            return content_id
 
     def get_mind_id(self, mind_slug: str) -> Optional[str]:
         """
@@ -104,12 +331,9 @@ class SourcesImporter:
             Mind UUID or None if not found
         """
         try:
-            conn = psycopg2.connect(self.db_url)
-            cur = conn.cursor()
-            cur.execute("SELECT id FROM minds WHERE slug = %s", (mind_slug,))
-            result = cur.fetchone()
-            cur.close()
-            conn.close()
+            with self._connection() as conn, conn.cursor() as cur:
+                cur.execute("SELECT id FROM minds WHERE slug = %s", (mind_slug,))
+                result = cur.fetchone()
             return str(result[0]) if result else None
         except Exception as e:
             raise ValueError(f"Failed to fetch mind ID for '{mind_slug}': {e}")
@@ -136,6 +360,9 @@ class SourcesImporter:
         """
         Read content from source file.
 
+        Imports don't call this for files over MMOS_IMPORT_STREAM_BYTES;
+        those are streamed in parts (see _stream_item).
+
         Args:
             file_path: Relative path from project root
 
@@ -151,16 +378,22 @@ class SourcesImporter:
             with open(full_path, 'r', encoding='utf-8') as f:
                 return f.read()
         except Exception as e:
-            print(f"⚠️  Failed to read {file_path}: {e}")
+            self._say(f"⚠️  Failed to read {file_path}: {e}")
             return None
 
-    def map_source_to_content(self, source: Dict[str, Any], mind_slug: str) -> Dict[str, Any]:
+    def map_source_to_content(
+        self,
+        source: Dict[str, Any],
+        mind_slug: str,
+        read_content: bool = True
+    ) -> Dict[str, Any]:
         """
         Map source YAML entry to contents table schema.
 
         Args:
             source: Source entry from YAML
             mind_slug: Mind slug for prefixing
+            read_content: If False, leave 'content' empty (the file is streamed)
 
         Returns:
             Mapped content data for database insertion
@@ -176,7 +409,7 @@ class SourcesImporter:
 
         # Read content from file
         file_path = source.get('file_path')
-        content = self.read_source_content(file_path) if file_path else None
+        content = self.read_source_content(file_path) if file_path and read_content else None
 
         # Build metadata
         metadata = {
@@ -213,13 +446,9 @@ class SourcesImporter:
             True if exists, False otherwise
         """
         try:
-            conn = psycopg2.connect(self.db_url)
-            cur = conn.cursor()
-            cur.execute("SELECT id FROM contents WHERE slug = %s", (slug,))
-            result = cur.fetchone()
-            cur.close()
-            conn.close()
-            return result is not None
+            with self._connection() as conn, conn.cursor() as cur:
+                cur.execute("SELECT id FROM contents WHERE slug = %s", (slug,))
+                return cur.fetchone() is not None
         except Exception:
             return False
 
@@ -234,41 +463,32 @@ class SourcesImporter:
             Inserted content UUID or None if failed
         """
         try:
-            import json
-            conn = psycopg2.connect(self.db_url)
-            cur = conn.cursor()
-
             # Convert metadata dict to JSON string
             metadata_json = json.dumps(content_data['metadata'])
 
-            cur.execute("""
-                INSERT INTO contents (
-                    ai_generated, content_type, slug, title, content,
-                    file_path, status, metadata
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s::jsonb
-                ) RETURNING id
-            """, (
-                content_data['ai_generated'],
-                content_data['content_type'],
-                content_data['slug'],
-                content_data['title'],
-                content_data['content'],
-                content_data['file_path'],
-                content_data['status'],
-                metadata_json
-            ))
-
-            result = cur.fetchone()
-            content_id = str(result[0]) if result else None
+            with self._connection() as conn, conn.cursor() as cur:
+                cur.execute("""
+                    INSERT INTO contents (
+                        ai_generated, content_type, slug, title, content,
+                        file_path, status, metadata
+                    ) VALUES (
+                        %s, %s, %s, %s, %s, %s, %s, %s::jsonb
+                    ) RETURNING id
+                """, (
+                    content_data['ai_generated'],
+                    content_data['content_type'],
+                    content_data['slug'],
+                    content_data['title'],
+                    content_data['content'],
+                    content_data['file_path'],
+                    content_data['status'],
+                    metadata_json
+                ))
+                result = cur.fetchone()
 
-            conn.commit()
-            cur.close()
-            conn.close()
-
-            return content_id
+            return str(result[0]) if result else None
         except Exception as e:
-            print(f"❌ Failed to insert content '{content_data['slug']}': {e}")
+            self._say(f"❌ Failed to insert content '{content_data['slug']}': {e}")
             return None
 
     def link_content_to_mind(self, content_id: str, mind_id: str, role: str = 'author') -> bool:
@@ -284,22 +504,484 @@ class SourcesImporter:
             True if successful, False otherwise
         """
         try:
-            conn = psycopg2.connect(self.db_url)
-            cur = conn.cursor()
-
-            cur.execute("""
-                INSERT INTO content_minds (content_id, mind_id, role)
-                VALUES (%s, %s, %s)
-            """, (content_id, mind_id, role))
-
-            conn.commit()
-            cur.close()
-            conn.close()
+            with self._connection() as conn, conn.cursor() as cur:
+                cur.execute("""
+                    INSERT INTO content_minds (content_id, mind_id, role)
+                    VALUES (%s, %s, %s)
+                """, (content_id, mind_id, role))
             return True
         except Exception as e:
-            print(f"❌ Failed to link content to mind: {e}")
+            self._say(f"❌ Failed to link content to mind: {e}")
             return False
 
+    def existing_slugs(self, slugs: List[str]) -> Set[str]:
+        """
+        Which of `slugs` already exist in contents, in one query.
+
+        Args:
+            slugs: Content slugs
+
+        Returns:
+            The subset of slugs found
+        """
+        return set(self.existing_content_ids(slugs))
+
+    def existing_content_ids(self, slugs: List[str]) -> Dict[str, str]:
+        """
+        Content UUIDs of the `slugs` that already exist, in one query.
+
+        Returns:
+            slug -> content UUID
+        """
+        return {slug: content_id for slug, (content_id, _) in self.existing_contents(slugs).items()}
+
+    def existing_contents(self, slugs: List[str]) -> Dict[str, Tuple[str, bool]]:
+        """
+        Like existing_content_ids(), also telling which rows were split into
+        parts (metadata.split_into_parts), in one query.
+
+        Returns:
+            slug -> (content UUID, split into parts)
+        """
+        if not slugs:
+            return {}
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                "SELECT slug, id, metadata->>'split_into_parts' = 'true' FROM contents WHERE slug = ANY(%s)",
+                (list(slugs),)
+            )
+            return {slug: (str(content_id), bool(split)) for slug, content_id, split in cur.fetchall()}
+
+    def insert_contents(self, rows: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Insert many contents rows with multi-row INSERTs (execute_values).
+
+        Args:
+            rows: Content data dicts (see map_source_to_content)
+
+        Returns:
+            slug -> inserted content UUID
+
+        Raises:
+            The database error if any page fails (nothing is caught here)
+        """
+        values = [
+            tuple(json.dumps(row[c]) if c == 'metadata' else row[c] for c in CONTENT_COLUMNS)
+            for row in rows
+        ]
+        with self._connection() as conn, conn.cursor() as cur:
+            returned = psycopg2.extras.execute_values(
+                cur,
+                f"INSERT INTO contents ({', '.join(CONTENT_COLUMNS)}) VALUES %s RETURNING slug, id",
+                values,
+                template=CONTENT_TEMPLATE,
+                page_size=IMPORT_BATCH_SIZE,
+                fetch=True
+            )
+        return {slug: str(content_id) for slug, content_id in returned}
+
+    def update_contents(self, rows: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Rewrite existing contents rows (execute_batch, MMOS_IMPORT_BATCH_SIZE per round trip).
+
+        Args:
+            rows: (content UUID, content data) pairs; the slug is not changed
+
+        Raises:
+            The database error if any update fails
+        """
+        if not rows:
+            return
+        values = [
+            tuple(json.dumps(data[c]) if c == 'metadata' else data[c] for c in CONTENT_COLUMNS if c != 'slug')
+            + (content_id,)
+            for content_id, data in rows
+        ]
+        with self._connection() as conn, conn.cursor() as cur:
+            psycopg2.extras.execute_batch(cur, CONTENT_UPDATE, values, page_size=IMPORT_BATCH_SIZE)
+
+    def delete_parts(self, content_ids: List[str]) -> None:
+        """
+        Delete the part rows of split contents (before they are rewritten).
+
+        Needs the part columns (migrations/002_contents_parts.sql), so only
+        call it for rows recorded as split_into_parts.
+        """
+        if not content_ids:
+            return
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.execute("DELETE FROM contents WHERE parent_content_id = ANY(%s)", (list(content_ids),))
+
+    def copy_parts(self, parent_id: str, content_data: Dict[str, Any], path: Path) -> int:
+        """
+        Stream a file into part rows of `parent_id` with one COPY.
+
+        The file is read MMOS_IMPORT_PART_CHARS characters at a time, and each
+        part ends at a line break when one follows within PART_LINE_SLACK.
+
+        Args:
+            parent_id: Parent content UUID
+            content_data: The parent's content data (title, type, status, ...)
+            path: File to stream
+
+        Returns:
+            Number of parts written
+
+        Raises:
+            The database or read/decode error; nothing is caught here
+        """
+        parts = [0]
+
+        def rows() -> Iterator[str]:
+            line = io.StringIO()
+            writer = csv.writer(line, quoting=csv.QUOTE_ALL, lineterminator='\n')
+            with open(path, 'r', encoding='utf-8') as f:
+                for sequence in itertools.count(1):
+                    chunk = f.read(IMPORT_PART_CHARS)
+                    if not chunk:
+                        return
+                    if not chunk.endswith('\n'):
+                        chunk += f.readline(PART_LINE_SLACK)
+                    parts[0] = sequence
+                    part = {
+                        **content_data,
+                        'slug': f"{content_data['slug']}-part-{sequence:04d}",
+                        'title': f"{content_data['title']} (part {sequence})",
+                        'content': chunk,
+                        'metadata': {'part_of': content_data['slug'], 'part': sequence},
+                        'parent_content_id': parent_id,
+                        'sequence_number': sequence,
+                    }
+                    writer.writerow([
+                        json.dumps(part[c]) if c == 'metadata'
+                        else str(part[c]).lower() if isinstance(part[c], bool)
+                        else part[c]
+                        for c in PART_COLUMNS
+                    ])
+                    yield line.getvalue()
+                    line.seek(0)
+                    line.truncate()
+
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.copy_expert(PART_COPY, CopyStream(rows()), size=COPY_BUFFER_BYTES)
+        return parts[0]
+
+    def link_contents_to_mind(self, content_ids: List[str], mind_id: str, role: str = 'author') -> None:
+        """
+        Link many contents to a mind with one multi-row content_minds INSERT.
+
+        Raises:
+            The database error if the insert fails
+        """
+        if not content_ids:
+            return
+        with self._connection() as conn, conn.cursor() as cur:
+            psycopg2.extras.execute_values(
+                cur,
+                "INSERT INTO content_minds (content_id, mind_id, role) VALUES %s",
+                [(content_id, mind_id, role) for content_id in content_ids],
+                page_size=IMPORT_BATCH_SIZE
+            )
+
+    def _import_batch(
+        self,
+        items: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+        mind_id: str,
+        role: str,
+        result: Dict[str, Any]
+    ) -> Dict[str, str]:
+        """
+        Insert and link new items in bulk, inside the run's transaction.
+
+        If the bulk statements fail (e.g. a row violates a constraint), they
+        are rolled back to a savepoint and the items are imported one by one,
+        so one bad item only fails itself.
+
+        Args:
+            items: (report detail with source_id/slug, content data) pairs
+            mind_id: Mind UUID
+            role: content_minds role
+            result: Import result to update
+
+        Returns:
+            slug -> content UUID of the items imported
+        """
+        if not items:
+            return {}
+
+        try:
+            with self._savepoint():
+                ids = self.insert_contents([content_data for _, content_data in items])
+                self.link_contents_to_mind([ids[data['slug']] for _, data in items], mind_id, role)
+        except Exception as e:
+            self._say(f"⚠️  Bulk insert of {len(items)} items failed, importing one by one: {e}")
+            ids = {}
+            for detail, content_data in items:
+                try:
+                    ids[content_data['slug']] = self._import_item(content_data, mind_id, role)
+                except ItemFailed as failure:
+                    result['failed'] += 1
+                    result['details'].append({**detail, 'status': 'failed', 'reason': failure.reason})
+
+        for detail, content_data in items:
+            content_id = ids.get(content_data['slug'])
+            if content_id:
+                result['imported'] += 1
+                result['details'].append({**detail, 'content_id': content_id, 'status': 'imported'})
+                self._say(f"✅ Imported: {content_data['slug']}")
+        return ids
+
+    def _update_batch(
+        self,
+        items: List[Tuple[Dict[str, Any], Dict[str, Any], str]],
+        result: Dict[str, Any],
+        split_ids: Set[str]
+    ) -> Dict[str, str]:
+        """
+        Rewrite the contents rows of changed items, like _import_batch().
+
+        Args:
+            items: (report detail, content data, existing content UUID) triples
+            result: Import result to update
+            split_ids: Content UUIDs currently split into parts (their parts are deleted)
+
+        Returns:
+            slug -> content UUID of the items updated
+        """
+        if not items:
+            return {}
+
+        try:
+            with self._savepoint():
+                self.update_contents([(content_id, data) for _, data, content_id in items])
+                # Parts left from when the file was large enough to be split
+                self.delete_parts([content_id for _, _, content_id in items if content_id in split_ids])
+            ids = {data['slug']: content_id for _, data, content_id in items}
+        except Exception as e:
+            self._say(f"⚠️  Bulk update of {len(items)} items failed, updating one by one: {e}")
+            ids = {}
+            for detail, content_data, content_id in items:
+                try:
+                    with self._savepoint():
+                        self.update_contents([(content_id, content_data)])
+                        if content_id in split_ids:
+                            self.delete_parts([content_id])
+                    ids[content_data['slug']] = content_id
+                except Exception as item_error:
+                    self._say(f"❌ Failed to update content '{content_data['slug']}': {item_error}")
+                    result['failed'] += 1
+                    result['details'].append({**detail, 'status': 'failed', 'reason': 'update_failed'})
+
+        for detail, content_data, content_id in items:
+            if content_data['slug'] in ids:
+                result['updated'] += 1
+                result['details'].append({**detail, 'content_id': content_id, 'status': 'updated'})
+                self._say(f"🔄 Updated: {content_data['slug']}")
+        return ids
+
+    def _stream_item(
+        self,
+        detail: Dict[str, Any],
+        content_data: Dict[str, Any],
+        path: Path,
+        content_id: Optional[str],
+        was_split: bool,
+        mind_id: str,
+        role: str,
+        result: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Write an oversize file as a parent row (no content) plus part rows
+        streamed with COPY, under a savepoint. Needs the part columns
+        (migrations/002_contents_parts.sql).
+
+        Args:
+            detail: Report detail with slug
+            content_data: Content data without 'content'
+            path: File to stream
+            content_id: Existing parent row to rewrite, if any
+            was_split: The existing row already has parts (deleted first)
+            mind_id: Mind UUID (the parent is linked; parts hang off the parent)
+            role: content_minds role for a new parent
+            result: Import result to update
+
+        Returns:
+            Parent content UUID, or None if the item failed
+        """
+        slug = content_data['slug']
+        status = 'updated' if content_id else 'imported'
+        content_data = {
+            **content_data,
+            'content': None,
+            'metadata': {**content_data['metadata'], 'split_into_parts': True, 'size_bytes': path.stat().st_size},
+        }
+        try:
+            with self._savepoint():
+                if content_id:
+                    self.update_contents([(content_id, content_data)])
+                    if was_split:
+                        self.delete_parts([content_id])
+                else:
+                    content_id = self.insert_contents([content_data])[slug]
+                    self.link_contents_to_mind([content_id], mind_id, role)
+                parts = self.copy_parts(content_id, content_data, path)
+        except Exception as e:
+            self._say(f"❌ Failed to stream '{slug}': {e}")
+            result['failed'] += 1
+            result['details'].append({**detail, 'status': 'failed', 'reason': 'stream_failed'})
+            return None
+
+        result[status] += 1
+        result['details'].append({**detail, 'content_id': content_id, 'status': status, 'parts': parts})
+        self._say(f"{'🔄 Updated' if status == 'updated' else '✅ Imported'}: {slug} ({parts} parts)")
+        return content_id
+
+    def _import_inventory(
+        self,
+        entries: List[Tuple[Dict[str, Any], Dict[str, Any], Optional[str]]],
+        build: Callable[[Dict[str, Any], bool], Optional[Dict[str, Any]]],
+        kind: str,
+        role: str,
+        mind_id: str,
+        preview: bool,
+        skip_existing: bool,
+        result: Dict[str, Any],
+        manifest: ImportManifest
+    ) -> None:
+        """
+        Import a mind's sources or artifacts incrementally, inside the run's transaction.
+
+        Items whose inventory entry and file stat match the manifest are
+        skipped without reading the file. Others are hashed (in chunks): if the
+        hash matches the manifest they are skipped too. An existing row with no
+        manifest entry (imported from another machine, or before manifests)
+        is recorded from the file and left as is. Otherwise an existing row is
+        updated and a new one inserted. With skip_existing=False every item is
+        rewritten.
+
+        Content is written every IMPORT_BATCH_SIZE items or IMPORT_BATCH_BYTES
+        of content, and files over IMPORT_STREAM_BYTES are streamed in parts
+        (_stream_item), so memory does not grow with the corpus.
+
+        Args:
+            entries: (report detail with slug, inventory entry, file path) triples
+            build: Maps an inventory entry to content data, reading the file if
+                   the flag is True; None if the file could not be read
+            kind: 'source' or 'artifact' (manifest entry kind)
+            role: content_minds role for new items
+            mind_id: Mind UUID
+            preview: If True, only report what would change
+            skip_existing: If False, ignore the manifest
+            result: Import result to update
+            manifest: The mind's manifest; updated for every item written
+        """
+        # Existing rows for all items in one query
+        slugs = [detail['slug'] for detail, _, _ in entries]
+        existing = self.existing_contents(slugs)
+        split_ids = {content_id for content_id, split in existing.values() if split}
+        seen: Set[str] = set()
+        new_items = []
+        changed_items = []
+        batch_bytes = 0
+        pending: Dict[str, Tuple[str, Optional[str], Any, str]] = {}
+
+        def write_batch() -> None:
+            nonlocal new_items, changed_items, batch_bytes
+            # Insert new contents + link to mind, rewrite changed ones
+            written = self._import_batch(new_items, mind_id, role, result)
+            written.update(self._update_batch(changed_items, result, split_ids))
+            for slug, content_id in written.items():
+                entry_digest, file_path, state, digest = pending.pop(slug)
+                manifest.record(slug, kind, content_id, entry_digest, file_path, state, digest)
+            new_items, changed_items, batch_bytes = [], [], 0
+
+        for detail, entry, file_path in entries:
+            slug = detail['slug']
+
+            # Repeats an earlier item of this run
+            if slug in seen:
+                result['skipped'] += 1
+                result['details'].append({**detail, 'status': 'skipped', 'reason': 'already_exists'})
+                self._say(f"⏭️  Skipped: {slug} (already exists)")
+                continue
+            seen.add(slug)
+
+            content_id = existing[slug][0] if slug in existing else None
+            entry_digest = entry_hash(entry)
+            path = self.project_root / file_path if file_path else None
+            state = file_state(path)
+
+            # Same entry, same file stat: not even read
+            if skip_existing and manifest.unchanged(slug, content_id, entry_digest, state):
+                result['skipped'] += 1
+                result['details'].append({**detail, 'status': 'skipped', 'reason': 'unchanged'})
+                self._say(f"⏭️  Unchanged: {slug}")
+                continue
+
+            # Touched but identical (e.g. rewritten by a checkout)
+            digest = (file_digest(path) if state else None) or content_hash(None)
+            if skip_existing and manifest.same_content(slug, content_id, entry_digest, digest):
+                manifest.touch(slug, state)
+                result['skipped'] += 1
+                result['details'].append({**detail, 'status': 'skipped', 'reason': 'unchanged'})
+                self._say(f"⏭️  Unchanged: {slug}")
+                continue
+
+            # Imported, but not recorded here: seed the manifest instead of rewriting
+            if skip_existing and content_id and slug not in manifest.entries:
+                manifest.record(slug, kind, content_id, entry_digest, file_path, state, digest)
+                result['skipped'] += 1
+                result['details'].append({**detail, 'status': 'skipped', 'reason': 'already_exists'})
+                self._say(f"⏭️  Skipped: {slug} (already exists, recorded in manifest)")
+                continue
+
+            streamed = state is not None and state[0] > IMPORT_STREAM_BYTES
+            content_data = build(entry, not streamed)
+            if content_data is None:
+                result['failed'] += 1
+                result['details'].append({**detail, 'status': 'failed', 'reason': 'file_read_failed'})
+                continue
+
+            action = 'update' if content_id else 'insert'
+
+            # Preview mode: don't actually write
+            if preview:
+                result['details'].append({
+                    **detail,
+                    'status': 'preview',
+                    'action': f"{action} (split into parts)" if streamed else action,
+                    'data': content_data,
+                })
+                self._say(f"👁️  Preview: {slug} ({action}{', split into parts' if streamed else ''})")
+                continue
+
+            if streamed:
+                content_id = self._stream_item(
+                    detail, content_data, path, content_id, content_id in split_ids, mind_id, role, result
+                )
+                if content_id:
+                    manifest.record(slug, kind, content_id, entry_digest, file_path, state, digest)
+                continue
+
+            pending[slug] = (entry_digest, file_path, state, digest)
+            if content_id:
+                changed_items.append((detail, content_data, content_id))
+            else:
+                new_items.append((detail, content_data))
+            batch_bytes += len(content_data['content'] or '')
+            if batch_bytes >= IMPORT_BATCH_BYTES or len(new_items) + len(changed_items) >= IMPORT_BATCH_SIZE:
+                write_batch()
+
+        write_batch()
+        manifest.prune(kind, slugs)
+
+    def _save_manifest(self, manifest: ImportManifest) -> None:
+        """Save after the import committed; a failure only costs re-reading next time."""
+        try:
+            manifest.save()
+        except OSError as e:
+            self._say(f"⚠️  Could not save import manifest {manifest.path}: {e}")
+
     def import_mind_sources(
         self,
         mind_slug: str,
@@ -312,7 +994,8 @@ class SourcesImporter:
         Args:
             mind_slug: Mind slug (e.g., 'sam_altman')
             preview: If True, only show what would be imported (dry run)
-            skip_existing: If True, skip sources that already exist
+            skip_existing: If True, skip sources unchanged since the last import
+                           (import manifest); if False, rewrite every source
 
         Returns:
             Import result with statistics
@@ -323,6 +1006,7 @@ class SourcesImporter:
             'timestamp': datetime.now().isoformat(),
             'total_sources': 0,
             'imported': 0,
+            'updated': 0,
             'skipped': 0,
             'failed': 0,
             'details': [],
@@ -337,79 +1021,47 @@ class SourcesImporter:
 
             # 2. Load sources.yaml
             sources_data = self.load_sources_yaml(mind_slug)
-            sources = sources_data.get('sources', [])
+            sources = sources_data.get('sources') or []
             result['total_sources'] = len(sources)
 
-            # 3. Process each source
-            for source in sources:
-                source_id = source['id']
-
-                # Map to content schema
-                content_data = self.map_source_to_content(source, mind_slug)
-                slug = content_data['slug']
-
-                # Check if already exists
-                if skip_existing and self.content_exists(slug):
-                    result['skipped'] += 1
-                    result['details'].append({
-                        'source_id': source_id,
-                        'slug': slug,
-                        'status': 'skipped',
-                        'reason': 'already_exists',
-                    })
-                    print(f"⏭️  Skipped: {slug} (already exists)")
-                    continue
-
-                # Preview mode: don't actually insert
-                if preview:
-                    result['details'].append({
-                        'source_id': source_id,
-                        'slug': slug,
-                        'status': 'preview',
-                        'data': content_data,
-                    })
-                    print(f"👁️  Preview: {slug}")
-                    continue
-
-                # Insert content
-                content_id = self.insert_content(content_data)
-
-                if content_id:
-                    # Link to mind
-                    linked = self.link_content_to_mind(content_id, mind_id, role='author')
-
-                    if linked:
-                        result['imported'] += 1
-                        result['details'].append({
-                            'source_id': source_id,
-                            'slug': slug,
-                            'content_id': content_id,
-                            'status': 'imported',
-                        })
-                        print(f"✅ Imported: {slug}")
-                    else:
-                        result['failed'] += 1
-                        result['details'].append({
-                            'source_id': source_id,
-                            'slug': slug,
-                            'status': 'failed',
-                            'reason': 'link_failed',
-                        })
-                else:
-                    result['failed'] += 1
-                    result['details'].append({
-                        'source_id': source_id,
-                        'slug': slug,
-                        'status': 'failed',
-                        'reason': 'insert_failed',
-                    })
+            # 3. Process each source (one transaction; see _import_item)
+            manifest = ImportManifest.for_mind(mind_slug, self.db_url, self.manifest_dir)
+            with self.transaction():
+                self._import_sources(sources, mind_slug, mind_id, preview, skip_existing, result, manifest)
+            if not preview:
+                self._save_manifest(manifest)
 
             return result
 
         except Exception as e:
             result['error'] = str(e)
+            if not preview and (result['imported'] or result['updated']):
+                # The transaction was rolled back: nothing of this run was kept
+                result['failed'] += result['imported'] + result['updated']
+                result['imported'] = 0
+                result['updated'] = 0
             return result
 
+    def _import_sources(
+        self,
+        sources: List[Dict[str, Any]],
+        mind_slug: str,
+        mind_id: str,
+        preview: bool,
+        skip_existing: bool,
+        result: Dict[str, Any],
+        manifest: ImportManifest
+    ) -> None:
+        """Process sources.yaml entries inside import_mind_sources' transaction."""
+        entries = [
+            ({'source_id': source['id'], 'slug': f"{mind_slug}-{source['id']}"}, source, source.get('file_path'))
+            for source in sources
+        ]
+        self._import_inventory(
+            entries, lambda source, read: self.map_source_to_content(source, mind_slug, read),
+            'source', 'author', mind_id, preview, skip_existing, result, manifest
+        )
+
     def validate_import(self, mind_slug: str) -> Dict[str, Any]:
         """
         Validate sources before import.
@@ -441,7 +1093,7 @@ class SourcesImporter:
             # Check 2: sources.yaml exists
             try:
                 sources_data = self.load_sources_yaml(mind_slug)
-                sources = sources_data.get('sources', [])
+                sources = sources_data.get('sources') or []
                 validation['checks'].append(f"✓ sources.yaml loaded ({len(sources)} sources)")
             except FileNotFoundError as e:
                 validation['valid'] = False
@@ -464,14 +1116,10 @@ class SourcesImporter:
                 validation['checks'].append(f"✓ All {len(sources)} source files exist")
 
             # Check 4: Check for duplicates
-            existing_count = 0
-            for source in sources:
-                slug = f"{mind_slug}-{source['id']}"
-                if self.content_exists(slug):
-                    existing_count += 1
+            existing_count = len(self.existing_slugs([f"{mind_slug}-{source['id']}" for source in sources]))
 
             if existing_count > 0:
-                validation['warnings'].append(f"⚠ {existing_count}/{len(sources)} sources already exist (will be skipped)")
+                validation['warnings'].append(f"⚠ {existing_count}/{len(sources)} sources already exist (only changed ones are re-imported)")
             else:
                 validation['checks'].append(f"✓ No duplicates found")
 
@@ -547,7 +1195,7 @@ class SourcesImporter:
         Args:
             mind_slug: Mind slug
             preview: If True, dry run
-            skip_existing: If True, skip existing artifacts
+            skip_existing: If True, skip artifacts unchanged since the last import
 
         Returns:
             Import result with statistics
@@ -558,6 +1206,7 @@ class SourcesImporter:
             'timestamp': datetime.now().isoformat(),
             'total_artifacts': 0,
             'imported': 0,
+            'updated': 0,
             'skipped': 0,
             'failed': 0,
             'details': [],
@@ -578,99 +1227,85 @@ class SourcesImporter:
                 result['error'] = "No artifacts found"
                 return result
 
-            # 3. Process each artifact
-            for artifact in artifacts:
-                artifact_name = artifact['name']
-                slug = f"{mind_slug}-{artifact['dir']}-{artifact_name}"
-
-                # Check if exists
-                if skip_existing and self.content_exists(slug):
-                    result['skipped'] += 1
-                    result['details'].append({
-                        'slug': slug,
-                        'status': 'skipped',
-                        'reason': 'already_exists',
-                    })
-                    print(f"⏭️  Skipped: {slug}")
-                    continue
+            # 3. Process each artifact (one transaction; see _import_item)
+            manifest = ImportManifest.for_mind(mind_slug, self.db_url, self.manifest_dir)
+            with self.transaction():
+                self._import_artifacts(artifacts, mind_slug, mind_id, preview, skip_existing, result, manifest)
+            if not preview:
+                self._save_manifest(manifest)
 
-                # Read content
-                content = self.read_source_content(artifact['file_path'])
+            return result
 
-                if not content:
-                    result['failed'] += 1
-                    result['details'].append({
-                        'slug': slug,
-                        'status': 'failed',
-                        'reason': 'file_read_failed',
-                    })
-                    continue
+        except Exception as e:
+            result['error'] = str(e)
+            if not preview and (result['imported'] or result['updated']):
+                # The transaction was rolled back: nothing of this run was kept
+                result['failed'] += result['imported'] + result['updated']
+                result['imported'] = 0
+                result['updated'] = 0
+            return result
 
-                # Build metadata
-                metadata = {
-                    'artifact_type': artifact['artifact_type'],
-                    'artifact_dir': artifact['dir'],
-                    'file_extension': artifact['extension'],
-                    'generated_by': 'mmos_pipeline',
-                }
-
-                # Map to content data
-                content_data = {
-                    'ai_generated': True,  # KEY DIFFERENCE from sources
-                    'content_type': 'other',
-                    'slug': slug,
-                    'title': artifact_name.replace('-', ' ').replace('_', ' ').title(),
-                    'content': content,
-                    'file_path': artifact['file_path'],
-                    'status': 'published',
-                    'metadata': metadata,
-                }
-
-                # Preview mode
-                if preview:
-                    result['details'].append({
-                        'slug': slug,
-                        'status': 'preview',
-                        'data': content_data,
-                    })
-                    print(f"👁️  Preview: {slug}")
-                    continue
+    def map_artifact_to_content(
+        self,
+        artifact: Dict[str, Any],
+        mind_slug: str,
+        read_content: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Map a discovered artifact to contents table schema (reads the file).
 
-                # Insert
-                content_id = self.insert_content(content_data)
+        Args:
+            artifact: Artifact info from discover_artifacts()
+            mind_slug: Mind slug for prefixing
+            read_content: If False, leave 'content' empty (the file is streamed)
 
-                if content_id:
-                    # Link to mind
-                    linked = self.link_content_to_mind(content_id, mind_id, role='creator')
-
-                    if linked:
-                        result['imported'] += 1
-                        result['details'].append({
-                            'slug': slug,
-                            'content_id': content_id,
-                            'status': 'imported',
-                        })
-                        print(f"✅ Imported: {slug}")
-                    else:
-                        result['failed'] += 1
-                        result['details'].append({
-                            'slug': slug,
-                            'status': 'failed',
-                            'reason': 'link_failed',
-                        })
-                else:
-                    result['failed'] += 1
-                    result['details'].append({
-                        'slug': slug,
-                        'status': 'failed',
-                        'reason': 'insert_failed',
-                    })
+        Returns:
+            Content data, or None if the file is empty or unreadable
+        """
+        content = None
+        if read_content:
+            content = self.read_source_content(artifact['file_path'])
+            if not content:
+                return None
 
-            return result
+        # Build metadata
+        metadata = {
+            'artifact_type': artifact['artifact_type'],
+            'artifact_dir': artifact['dir'],
+            'file_extension': artifact['extension'],
+            'generated_by': 'mmos_pipeline',
+        }
 
-        except Exception as e:
-            result['error'] = str(e)
-            return result
+        return {
+            'ai_generated': True,  # KEY DIFFERENCE from sources
+            'content_type': 'other',
+            'slug': f"{mind_slug}-{artifact['dir']}-{artifact['name']}",
+            'title': artifact['name'].replace('-', ' ').replace('_', ' ').title(),
+            'content': content,
+            'file_path': artifact['file_path'],
+            'status': 'published',
+            'metadata': metadata,
+        }
+
+    def _import_artifacts(
+        self,
+        artifacts: List[Dict[str, Any]],
+        mind_slug: str,
+        mind_id: str,
+        preview: bool,
+        skip_existing: bool,
+        result: Dict[str, Any],
+        manifest: ImportManifest
+    ) -> None:
+        """Process discovered artifacts inside import_mind_artifacts' transaction."""
+        entries = [
+            ({'slug': f"{mind_slug}-{artifact['dir']}-{artifact['name']}"}, artifact, artifact['file_path'])
+            for artifact in artifacts
+        ]
+        self._import_inventory(
+            entries, lambda artifact, read: self.map_artifact_to_content(artifact, mind_slug, read),
+            'artifact', 'creator', mind_id, preview, skip_existing, result, manifest
+        )
 
     def import_mind_complete(
         self,
@@ -684,7 +1319,7 @@ class SourcesImporter:
         Args:
             mind_slug: Mind slug
             preview: If True, dry run
-            skip_existing: If True, skip existing content
+            skip_existing: If True, skip content unchanged since the last import
 
         Returns:
             Combined import result
@@ -696,21 +1331,22 @@ class SourcesImporter:
             'sources': {},
             'artifacts': {},
             'total_imported': 0,
+            'total_updated': 0,
             'total_skipped': 0,
             'total_failed': 0,
         }
 
-        print("\n" + "="*60)
-        print(f"🚀 COMPLETE IMPORT: {mind_slug}")
-        print("="*60 + "\n")
+        self._say("\n" + "="*60)
+        self._say(f"🚀 COMPLETE IMPORT: {mind_slug}")
+        self._say("="*60 + "\n")
 
         # Import sources
-        print("📥 Step 1/2: Importing sources (collected content)...")
+        self._say("📥 Step 1/2: Importing sources (collected content)...")
         sources_result = self.import_mind_sources(mind_slug, preview, skip_existing)
         result['sources'] = sources_result
 
         # Import artifacts
-        print("\n📥 Step 2/2: Importing artifacts (AI-generated content)...")
+        self._say("\n📥 Step 2/2: Importing artifacts (AI-generated content)...")
         artifacts_result = self.import_mind_artifacts(mind_slug, preview, skip_existing)
         result['artifacts'] = artifacts_result
 
@@ -719,6 +1355,10 @@ class SourcesImporter:
             sources_result.get('imported', 0) +
             artifacts_result.get('imported', 0)
         )
+        result['total_updated'] = (
+            sources_result.get('updated', 0) +
+            artifacts_result.get('updated', 0)
+        )
         result['total_skipped'] = (
             sources_result.get('skipped', 0) +
             artifacts_result.get('skipped', 0)
@@ -730,6 +1370,93 @@ class SourcesImporter:
 
         return result
 
+    def discover_minds(self) -> List[str]:
+        """Slugs of every mind directory under outputs/minds/."""
+        minds_dir = self.project_root / "outputs/minds"
+        if not minds_dir.exists():
+            return []
+        return sorted(
+            d.name for d in minds_dir.iterdir()
+            if d.is_dir() and not d.name.startswith(('.', '_'))
+        )
+
+    def import_all(
+        self,
+        mind_slugs: Optional[List[str]] = None,
+        workers: int = IMPORT_WORKERS,
+        preview: bool = False,
+        skip_existing: bool = True,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Import sources + artifacts for many minds concurrently.
+
+        Each worker runs import_mind_complete() for one mind at a time, on its
+        own pooled connection, so workers are capped at the pool size.
+
+        Args:
+            mind_slugs: Minds to import (default: discover_minds())
+            workers: Minds imported at once (MMOS_IMPORT_WORKERS)
+            preview: If True, dry run
+            skip_existing: If True, skip content unchanged since the last import
+            on_result: Called with each mind's result as it finishes (progress)
+
+        Returns:
+            Dict with per-mind 'results' (in slug order, each with 'elapsed'
+            seconds) and totals: minds, errors, imported, updated, skipped,
+            failed, elapsed
+        """
+        mind_slugs = self.discover_minds() if mind_slugs is None else list(mind_slugs)
+        workers = max(1, min(workers, getattr(self.pool, 'maxconn', workers), len(mind_slugs) or 1))
+
+        def run(mind_slug: str) -> Dict[str, Any]:
+            start = time.perf_counter()
+            try:
+                result = self.import_mind_complete(mind_slug, preview, skip_existing)
+            except Exception as e:
+                result = {'mind_slug': mind_slug, 'error': str(e), 'total_imported': 0,
+                          'total_updated': 0, 'total_skipped': 0, 'total_failed': 0}
+            result['elapsed'] = time.perf_counter() - start
+            return result
+
+        # Per-item lines from concurrent minds would interleave
+        verbose, self.verbose = self.verbose, False
+        start = time.perf_counter()
+        results: Dict[str, Dict[str, Any]] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='mmos-import') as executor:
+                futures = [executor.submit(run, slug) for slug in mind_slugs]
+                for future in as_completed(futures):
+                    result = future.result()
+                    results[result['mind_slug']] = result
+                    if on_result:
+                        on_result(result)
+        finally:
+            self.verbose = verbose
+
+        ordered = [results[slug] for slug in mind_slugs]
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'preview': preview,
+            'workers': workers,
+            'results': ordered,
+            'minds': len(ordered),
+            'errors': sum(1 for r in ordered if _mind_error(r)),
+            'imported': sum(r['total_imported'] for r in ordered),
+            'updated': sum(r['total_updated'] for r in ordered),
+            'skipped': sum(r['total_skipped'] for r in ordered),
+            'failed': sum(r['total_failed'] for r in ordered),
+            'elapsed': time.perf_counter() - start,
+        }
+
+
+def _mind_error(result: Dict[str, Any]) -> Optional[str]:
+    """First error of an import_mind_complete() result, if any."""
+    for part in (result, result.get('sources') or {}, result.get('artifacts') or {}):
+        if part.get('error') and part.get('error') != "No artifacts found":
+            return part['error']
+    return None
+
 
 # CLI helper functions
 def print_validation_report(validation: Dict[str, Any]):
@@ -752,6 +1479,39 @@ def print_validation_report(validation: Dict[str, Any]):
     print("="*60 + "\n")
 
 
+def print_import_progress(result: Dict[str, Any], done: int, total: int):
+    """One progress line per finished mind (import_all on_result)."""
+    error = _mind_error(result)
+    status = '❌' if error else '✅'
+    detail = error or (
+        f"{result['total_imported']} imported, {result['total_updated']} updated, {result['total_skipped']} skipped, "
+        f"{result['total_failed']} failed"
+    )
+    print(f"[{done:>{len(str(total))}}/{total}] {status} {result['mind_slug']:<28} {detail} ({result['elapsed']:.1f}s)")
+
+
+def print_import_all_report(summary: Dict[str, Any]):
+    """Pretty print the consolidated import_all() results table."""
+    print("\n" + "="*78)
+    print(f"IMPORT ALL: {summary['minds']} minds, {summary['workers']} workers"
+          f"{' (PREVIEW)' if summary['preview'] else ''}")
+    print("="*78)
+    print(f"{'mind':<28} {'imported':>8} {'updated':>8} {'skipped':>8} {'failed':>7} {'sec':>6}  status")
+    for result in summary['results']:
+        error = _mind_error(result)
+        print(
+            f"{result['mind_slug']:<28} {result['total_imported']:>8} {result['total_updated']:>8} "
+            f"{result['total_skipped']:>8} {result['total_failed']:>7} {result['elapsed']:>6.1f}  "
+            f"{'❌ ' + error if error else '✅'}"
+        )
+    print("-"*78)
+    print(f"✅ Imported: {summary['imported']}   🔄 Updated: {summary['updated']}   "
+          f"⏭️  Skipped: {summary['skipped']}   ❌ Failed: {summary['failed']}   "
+          f"Minds with errors: {summary['errors']}")
+    print(f"Elapsed: {summary['elapsed']:.1f}s")
+    print("="*78 + "\n")
+
+
 def print_import_report(result: Dict[str, Any]):
     """Pretty print import report."""
     print("\n" + "="*60)
@@ -762,6 +1522,7 @@ def print_import_report(result: Dict[str, Any]):
     print("")
     print(f"Total sources: {result['total_sources']}")
     print(f"✅ Imported: {result['imported']}")
+    print(f"🔄 Updated: {result.get('updated', 0)}")
     print(f"⏭️  Skipped: {result['skipped']}")
     print(f"❌ Failed: {result['failed']}")
 
@@ -0,0 +1,605 @@
+"""
+MMOS SQLite Database Client
+===========================
+Local-disk backend for MMOSPersister (MMOS_DB_BACKEND=sqlite).
+
+Mirrors the Supabase tables the persister writes (minds, mind_drivers,
+fragments, job_executions, ...) with the same unique keys and indexes, behind
+the subset of the supabase-py fluent API the persister uses:
+
+    client.table('fragments').insert([...]).execute()
+    client.table('minds').select('id').eq('slug', 'sam_altman').execute()
+    client.table('mind_drivers').upsert(rows, on_conflict='mind_id,driver_id').execute()
+    client.rpc('infer_drivers_from_scores', {'p_mind_id': mind_id}).execute()
+
+Pipelines persist at local-disk speed and without a network; the file can be
+replayed into Supabase later with scripts/sqlite_sync.py. Columns not in the
+schema are added on first write, and dict/list values are stored as JSON.
+
+Usage:
+    client = SQLiteClient('~/.aios/mmos/mmos.db')
+    persister = MMOSPersister(client=client)
+
+Author: MMOS Team
+Created: 2026-10-17
+"""
+
+import json
+import sqlite3
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    from .driver_inference import DriverInferenceEngine
+except ImportError:
+    from driver_inference import DriverInferenceEngine
+
+# table -> columns (name -> declared type), unique keys, indexes.
+# JSON columns hold json.dumps() text; BOOLEAN columns hold 0/1.
+SCHEMA: Dict[str, Dict[str, Any]] = {
+    # Reference tables (pulled from Supabase, see scripts/sqlite_sync.py)
+    'mapping_systems': {
+        'columns': {'slug': 'TEXT', 'name': 'TEXT', 'description': 'TEXT'},
+        'unique': [('slug',)],
+    },
+    'system_components': {
+        'columns': {'system_id': 'TEXT', 'slug': 'TEXT', 'name': 'TEXT', 'description': 'TEXT'},
+        'unique': [('slug',)],
+        'indexes': [('system_id',)],
+    },
+    'drivers': {
+        'columns': {'slug': 'TEXT', 'name': 'TEXT', 'driver_type': 'TEXT', 'domain': 'TEXT'},
+        'unique': [('slug',)],
+    },
+    'toolbox': {
+        'columns': {'slug': 'TEXT', 'name': 'TEXT', 'description': 'TEXT'},
+        'unique': [('slug',)],
+    },
+    'component_driver_map': {
+        'columns': {'component_id': 'TEXT', 'driver_id': 'TEXT', 'relevance': 'TEXT', 'notes': 'TEXT'},
+        'unique': [('component_id', 'driver_id')],
+        'indexes': [('driver_id',)],
+    },
+
+    # Mind data written by MMOSPersister
+    'minds': {
+        'columns': {
+            'slug': 'TEXT', 'name': 'TEXT', 'short_bio': 'TEXT', 'primary_language': 'TEXT',
+            'avatar_url': 'TEXT', 'created_by': 'TEXT', 'mmos_metadata': 'JSON',
+            'privacy_level': 'TEXT', 'apex_score': 'REAL', 'created_at': 'TEXT', 'updated_at': 'TEXT'
+        },
+        'unique': [('slug',)],
+    },
+    'mind_system_mappings': {
+        'columns': {
+            'mind_id': 'TEXT', 'system_id': 'TEXT', 'result': 'JSON', 'confidence': 'INTEGER',
+            'evidence': 'JSON', 'notes': 'TEXT', 'assessed_by': 'TEXT', 'assessed_at': 'TEXT',
+            'updated_at': 'TEXT'
+        },
+        'unique': [('mind_id', 'system_id')],
+    },
+    'mind_component_scores': {
+        'columns': {
+            'mind_id': 'TEXT', 'component_id': 'TEXT', 'score_numeric': 'REAL', 'score_text': 'TEXT',
+            'score_rank': 'INTEGER', 'confidence': 'INTEGER', 'evidence': 'JSON', 'notes': 'TEXT',
+            'assessed_by': 'TEXT', 'assessed_at': 'TEXT', 'updated_at': 'TEXT'
+        },
+        'unique': [('mind_id', 'component_id')],
+        'indexes': [('component_id',)],
+    },
+    'mind_drivers': {
+        'columns': {
+            'mind_id': 'TEXT', 'driver_id': 'TEXT', 'relationship': 'TEXT', 'strength': 'INTEGER',
+            'evidence': 'JSON', 'context': 'TEXT', 'confidence': 'INTEGER', 'assessed_by': 'TEXT',
+            'extracted_at': 'TEXT', 'updated_at': 'TEXT'
+        },
+        'unique': [('mind_id', 'driver_id')],
+        'indexes': [('driver_id',)],
+    },
+    'mind_values': {
+        'columns': {'mind_id': 'TEXT', 'name': 'TEXT', 'importance_10': 'INTEGER', 'notes': 'TEXT'},
+        'unique': [('mind_id', 'name')],
+    },
+    'mind_obsessions': {
+        'columns': {
+            'mind_id': 'TEXT', 'name': 'TEXT', 'intensity_10': 'INTEGER', 'notes': 'TEXT',
+            'driven_by': 'TEXT'
+        },
+        'unique': [('mind_id', 'name')],
+    },
+    'mind_tools': {
+        'columns': {
+            'mind_id': 'TEXT', 'tool_id': 'TEXT', 'usage_frequency': 'TEXT', 'proficiency': 'TEXT',
+            'evidence': 'JSON', 'context': 'TEXT', 'assessed_by': 'TEXT', 'extracted_at': 'TEXT'
+        },
+        'unique': [('mind_id', 'tool_id')],
+    },
+    'mind_profiles': {
+        'columns': {
+            'mind_id': 'TEXT', 'profile_type': 'TEXT', 'content_text': 'TEXT', 'content_json': 'JSON',
+            'storage_format': 'TEXT', 'is_ai_generated': 'BOOLEAN', 'generation_execution_id': 'TEXT',
+            'updated_at': 'TEXT'
+        },
+        'unique': [('mind_id', 'profile_type')],
+    },
+    'fragments': {
+        'columns': {
+            'mind_id': 'TEXT', 'source_id': 'TEXT', 'category_id': 'INTEGER', 'type': 'TEXT',
+            'content': 'TEXT', 'context': 'TEXT', 'insight': 'TEXT', 'location': 'TEXT',
+            'relevance': 'INTEGER', 'metadata': 'JSON', 'content_hash': 'TEXT'
+        },
+        'indexes': [('mind_id',), ('source_id',), ('mind_id', 'source_id', 'content_hash')],
+        'track_changes': True,
+    },
+    'job_executions': {
+        'columns': {
+            'name': 'TEXT', 'status': 'TEXT', 'llm_provider': 'TEXT', 'llm_model': 'TEXT',
+            'tokens_prompt': 'INTEGER', 'tokens_completion': 'INTEGER', 'tokens_total': 'INTEGER',
+            'cost_usd': 'REAL', 'latency_ms': 'INTEGER', 'params': 'JSON', 'result': 'JSON',
+            'error': 'TEXT', 'executed_at': 'TEXT'
+        },
+        'indexes': [('name',), ('executed_at',)],
+        'track_changes': True,
+    },
+
+    # Push watermarks and change log for scripts/sqlite_sync.py. Triggers
+    # give every insert or update of a track_changes table a new seq.
+    'sync_state': {
+        'columns': {'table_name': 'TEXT', 'last_seq': 'INTEGER'},
+        'unique': [('table_name',)],
+    },
+    'sync_changes': {
+        'columns': {'table_name': 'TEXT', 'row_id': 'TEXT', 'seq': 'INTEGER'},
+        'indexes': [('seq',), ('table_name', 'seq')],
+    },
+}
+
+# Embedded selects, e.g. select('id, drivers(slug, name)') on component_driver_map
+FOREIGN_KEYS: Dict[Tuple[str, str], str] = {
+    ('component_driver_map', 'drivers'): 'driver_id',
+    ('component_driver_map', 'system_components'): 'component_id',
+    ('system_components', 'mapping_systems'): 'system_id',
+    ('mind_drivers', 'drivers'): 'driver_id',
+    ('mind_component_scores', 'system_components'): 'component_id',
+    ('mind_tools', 'toolbox'): 'tool_id',
+}
+
+# Bound parameters per statement (SQLITE_MAX_VARIABLE_NUMBER on old builds)
+SQLITE_MAX_PARAMS = 900
+
+
+class SQLiteClientError(Exception):
+    """Query rejected by the SQLite backend."""
+
+
+class SQLiteResponse:
+    """Mirrors the `.data` attribute of a supabase-py APIResponse."""
+
+    def __init__(self, data: Any):
+        self.data = data
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _project(row: Dict[str, Any], wanted: List[str]) -> Dict[str, Any]:
+    if '*' in wanted:
+        return row
+    return {c: row.get(c) for c in wanted}
+
+
+def _split_columns(columns: str) -> List[str]:
+    """Split a select list on top-level commas ('id, drivers(slug, name)')."""
+    parts, depth, current = [], 0, ''
+    for char in columns:
+        if char == ',' and depth == 0:
+            parts.append(current.strip())
+            current = ''
+            continue
+        depth += char == '('
+        depth -= char == ')'
+        current += char
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+class SQLiteQuery:
+    """One fluent query against a SQLiteClient table."""
+
+    def __init__(self, client: 'SQLiteClient', table: str):
+        self._client = client
+        self._table = table
+        self._op = 'select'
+        self._columns = '*'
+        self._payload: Any = None
+        self._on_conflict: List[str] = []
+        self._filters: List[Tuple[str, str, Any]] = []
+        self._range: Optional[Tuple[int, int]] = None
+        self._order: List[Tuple[str, bool]] = []
+
+    # ── operations ────────────────────────────────────────────────────────
+
+    def select(self, columns: str = '*', **kwargs) -> 'SQLiteQuery':
+        self._op = 'select'
+        self._columns = columns
+        return self
+
+    def insert(self, payload: Any, **kwargs) -> 'SQLiteQuery':
+        self._op = 'insert'
+        self._payload = payload
+        return self
+
+    def upsert(self, payload: Any, on_conflict: str = 'id', **kwargs) -> 'SQLiteQuery':
+        self._op = 'upsert'
+        self._payload = payload
+        self._on_conflict = [c.strip() for c in on_conflict.split(',')]
+        return self
+
+    def update(self, payload: Dict[str, Any], **kwargs) -> 'SQLiteQuery':
+        self._op = 'update'
+        self._payload = payload
+        return self
+
+    def delete(self, **kwargs) -> 'SQLiteQuery':
+        self._op = 'delete'
+        return self
+
+    # ── filters ───────────────────────────────────────────────────────────
+
+    def eq(self, column: str, value: Any) -> 'SQLiteQuery':
+        self._filters.append(('eq', column, value))
+        return self
+
+    def in_(self, column: str, values: List[Any]) -> 'SQLiteQuery':
+        self._filters.append(('in', column, list(values)))
+        return self
+
+    def is_(self, column: str, value: Any) -> 'SQLiteQuery':
+        """IS NULL filter (supabase-py's is_(column, 'null'))."""
+        self._filters.append(('is', column, None if value in (None, 'null') else value))
+        return self
+
+    def range(self, start: int, end: int) -> 'SQLiteQuery':
+        self._range = (start, end)
+        return self
+
+    def limit(self, count: int) -> 'SQLiteQuery':
+        self._range = (0, count - 1)
+        return self
+
+    def order(self, column: str, desc: bool = False) -> 'SQLiteQuery':
+        self._order.append((column, desc))
+        return self
+
+    def _where(self, columns: Dict[str, str]) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        for op, column, value in self._filters:
+            if column not in columns:
+                # Unknown column: every row is NULL there, so only IS NULL matches
+                clauses.append('1' if op == 'is' and value is None else '0')
+            elif op == 'is':
+                clauses.append(f"{_quote(column)} IS ?")
+                params.append(self._client._to_db(columns[column], value))
+            elif op == 'eq':
+                clauses.append(f"{_quote(column)} = ?")
+                params.append(self._client._to_db(columns[column], value))
+            elif not value:
+                clauses.append('0')
+            else:
+                clauses.append(f"{_quote(column)} IN ({', '.join('?' * len(value))})")
+                params.extend(self._client._to_db(columns[column], v) for v in value)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    # ── execution ─────────────────────────────────────────────────────────
+
+    def execute(self) -> SQLiteResponse:
+        client = self._client
+        with client._lock, client._conn:
+            columns = client._ensure_table(self._table)
+            data = getattr(self, f'_execute_{self._op}')(columns)
+        return SQLiteResponse(data)
+
+    def _execute_select(self, columns: Dict[str, str]) -> List[Dict[str, Any]]:
+        plain, embeds = [], []
+        for part in _split_columns(self._columns or '*'):
+            if '(' in part:
+                name, inner = part.split('(', 1)
+                embeds.append((name.strip(), _split_columns(inner.rstrip(')'))))
+            else:
+                plain.append(part)
+
+        where, params = self._where(columns)
+        sql = f"SELECT * FROM {_quote(self._table)}{where}"
+        order = [(c, desc) for c, desc in self._order if c in columns]
+        if order:
+            sql += ' ORDER BY ' + ', '.join(f"{_quote(c)} {'DESC' if desc else 'ASC'}" for c, desc in order)
+        if self._range:
+            sql += f" LIMIT {self._range[1] - self._range[0] + 1} OFFSET {self._range[0]}"
+        rows = self._client._fetch(self._table, sql, params)
+
+        for name, wanted in embeds:
+            fk = FOREIGN_KEYS.get((self._table, name))
+            if fk is None:
+                raise SQLiteClientError(f"No relationship between {self._table} and {name}")
+            related = self._client._fetch_by_ids(name, list({row[fk] for row in rows if row.get(fk)}))
+            by_id = {r['id']: _project(r, wanted) for r in related}
+            for row in rows:
+                row[name] = by_id.get(row.get(fk))
+
+        if '*' not in plain:
+            rows = [_project(row, plain + [name for name, _ in embeds]) for row in rows]
+        return rows
+
+    def _payload_rows(self) -> List[Dict[str, Any]]:
+        return self._payload if isinstance(self._payload, list) else [self._payload]
+
+    def _execute_insert(self, columns: Dict[str, str]) -> List[Dict[str, Any]]:
+        rows = [{'id': str(uuid.uuid4()), **row} for row in self._payload_rows()]
+        self._write_rows(rows, conflict=None)
+        return self._client._fetch_by_ids(self._table, [row['id'] for row in rows])
+
+    def _execute_upsert(self, columns: Dict[str, str]) -> List[Dict[str, Any]]:
+        # A fresh id is only used if the row turns out to be new
+        rows = [{'id': str(uuid.uuid4()), **row} for row in self._payload_rows()]
+        self._client._ensure_unique(self._table, self._on_conflict)
+        self._write_rows(rows, conflict=self._on_conflict)
+
+        saved = []
+        for row in rows:
+            lookup = SQLiteQuery(self._client, self._table)
+            for key in self._on_conflict:
+                lookup.eq(key, row.get(key))
+            saved.extend(lookup._execute_select(self._client._columns[self._table])[:1])
+        return saved
+
+    def _write_rows(self, rows: List[Dict[str, Any]], conflict: Optional[List[str]]) -> None:
+        """INSERT (or INSERT ... ON CONFLICT DO UPDATE), one executemany per column set."""
+        client = self._client
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row in rows:
+            client._ensure_columns(self._table, row)
+            groups.setdefault(tuple(row), []).append(row)
+
+        columns = client._columns[self._table]
+        for names, group in groups.items():
+            sql = (
+                f"INSERT INTO {_quote(self._table)} ({', '.join(map(_quote, names))}) "
+                f"VALUES ({', '.join('?' * len(names))})"
+            )
+            if conflict is not None:
+                updates = [c for c in names if c not in conflict and c != 'id']
+                action = 'DO UPDATE SET ' + ', '.join(
+                    f"{_quote(c)} = excluded.{_quote(c)}" for c in updates
+                ) if updates else 'DO NOTHING'
+                sql += f" ON CONFLICT ({', '.join(map(_quote, conflict))}) {action}"
+            client._conn.executemany(
+                sql, [[client._to_db(columns[c], row[c]) for c in names] for row in group]
+            )
+
+    def _execute_update(self, columns: Dict[str, str]) -> List[Dict[str, Any]]:
+        payload = {k: v for k, v in self._payload.items() if k != 'id'}
+        columns = self._client._ensure_columns(self._table, payload)
+        where, params = self._where(columns)
+        ids = [row[0] for row in self._client._conn.execute(
+            f"SELECT id FROM {_quote(self._table)}{where}", params
+        )]
+        if ids and payload:
+            assignments = ', '.join(f"{_quote(c)} = ?" for c in payload)
+            values = [self._client._to_db(columns[c], v) for c, v in payload.items()]
+            self._client._conn.executemany(
+                f"UPDATE {_quote(self._table)} SET {assignments} WHERE id = ?",
+                [values + [row_id] for row_id in ids]
+            )
+        return self._client._fetch_by_ids(self._table, ids)
+
+    def _execute_delete(self, columns: Dict[str, str]) -> List[Dict[str, Any]]:
+        deleted = self._execute_select(columns)
+        where, params = self._where(columns)
+        self._client._conn.execute(f"DELETE FROM {_quote(self._table)}{where}", params)
+        return deleted
+
+
+class SQLiteRPC:
+    def __init__(self, client: 'SQLiteClient', name: str, params: Dict[str, Any]):
+        self._client = client
+        self._name = name
+        self._params = params
+
+    def execute(self) -> SQLiteResponse:
+        handler = self._client.rpc_handlers.get(self._name)
+        if handler is None:
+            raise SQLiteClientError(f"Unknown function: {self._name}")
+        with self._client._lock:
+            return SQLiteResponse(handler(self._client, self._params))
+
+
+def infer_drivers_from_scores(client: 'SQLiteClient', params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """SQLite version of the infer_drivers_from_scores(p_mind_id) SQL function."""
+    return DriverInferenceEngine(client).infer(params.get('p_mind_id'))
+
+
+class SQLiteClient:
+    """
+    SQLite-backed, thread-safe stand-in for supabase.Client.
+
+    Attributes:
+        path: Database file (':memory:' for a throwaway database)
+        rpc_handlers: rpc name -> callable(client, params) returning rows
+    """
+
+    def __init__(self, path: Union[str, Path] = ':memory:'):
+        self.path = str(path) if str(path) == ':memory:' else str(Path(path).expanduser())
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._columns: Dict[str, Dict[str, str]] = {}
+        self.rpc_handlers: Dict[str, Any] = {'infer_drivers_from_scores': infer_drivers_from_scores}
+
+        with self._lock, self._conn:
+            for table in SCHEMA:
+                self._ensure_table(table)
+
+    def table(self, name: str) -> SQLiteQuery:
+        return SQLiteQuery(self, name)
+
+    def rpc(self, name: str, params: Optional[Dict[str, Any]] = None) -> SQLiteRPC:
+        return SQLiteRPC(self, name, params or {})
+
+    def tables(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name"
+            )]
+
+    def changes_since(self, table: str, after_seq: int = 0) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        (seq, row) pairs inserted or updated after a change seq, oldest change
+        first (incremental sync of track_changes tables).
+        """
+        with self._lock:
+            rows = self._fetch(
+                table,
+                f"SELECT c.seq AS sync_seq, t.* FROM sync_changes c "
+                f"JOIN {_quote(table)} t ON t.id = c.row_id "
+                f"WHERE c.table_name = ? AND c.seq > ? ORDER BY c.seq",
+                [table, after_seq]
+            )
+        return [(row.pop('sync_seq'), row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ── schema ────────────────────────────────────────────────────────────
+
+    def _ensure_table(self, table: str) -> Dict[str, str]:
+        """Create the table (and its indexes) if needed; returns column -> type."""
+        if table in self._columns:
+            return self._columns[table]
+
+        spec = SCHEMA.get(table, {})
+        declared = spec.get('columns', {})
+        definitions = ['id TEXT PRIMARY KEY'] + [f"{_quote(c)} {t}" for c, t in declared.items()]
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS {_quote(table)} ({', '.join(definitions)})")
+
+        # Includes columns added by earlier runs; schema columns newer than the file are added
+        columns = {
+            row[1]: row[2] or '' for row in self._conn.execute(f"PRAGMA table_info({_quote(table)})")
+        }
+        for column, column_type in declared.items():
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(column)} {column_type}")
+                columns[column] = column_type
+        self._columns[table] = columns
+
+        for unique in spec.get('unique', []):
+            self._create_index(table, unique, unique=True)
+        for index in spec.get('indexes', []):
+            self._create_index(table, index, unique=False)
+        if spec.get('track_changes'):
+            self._track_changes(table)
+        return columns
+
+    def _track_changes(self, table: str) -> None:
+        """Log inserts and updates of a table in sync_changes."""
+        self._ensure_table('sync_changes')
+        tracked = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?", [f"sync_{table}_insert"]
+        ).fetchone()
+
+        # UPDATE, then INSERT if missing, rather than INSERT OR REPLACE: an
+        # outer upsert's conflict handling would override the trigger's
+        next_seq = "(SELECT COALESCE(MAX(seq), 0) + 1 FROM sync_changes)"
+        for event in ('INSERT', 'UPDATE'):
+            self._conn.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {_quote(f'sync_{table}_{event.lower()}')} "
+                f"AFTER {event} ON {_quote(table)} BEGIN "
+                f"UPDATE sync_changes SET seq = {next_seq} WHERE id = '{table}:' || NEW.id; "
+                f"INSERT INTO sync_changes (id, table_name, row_id, seq) "
+                f"SELECT '{table}:' || NEW.id, '{table}', NEW.id, {next_seq} "
+                f"WHERE NOT EXISTS (SELECT 1 FROM sync_changes WHERE id = '{table}:' || NEW.id); END"
+            )
+
+        if not tracked:
+            # Rows written before the log existed (older files) are pushed once more
+            base = self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM sync_changes").fetchone()[0]
+            self._conn.execute(
+                f"INSERT OR IGNORE INTO sync_changes (id, table_name, row_id, seq) "
+                f"SELECT ? || id, ?, id, ? + rowid FROM {_quote(table)}",
+                [f"{table}:", table, base]
+            )
+
+    def _create_index(self, table: str, columns: Tuple[str, ...], unique: bool) -> None:
+        name = f"{'ux' if unique else 'ix'}_{table}_{'_'.join(columns)}"
+        self._conn.execute(
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {_quote(name)} "
+            f"ON {_quote(table)} ({', '.join(map(_quote, columns))})"
+        )
+
+    def _ensure_unique(self, table: str, columns: List[str]) -> None:
+        if columns != ['id']:
+            self._ensure_columns(table, dict.fromkeys(columns))
+            self._create_index(table, tuple(columns), unique=True)
+
+    def _ensure_columns(self, table: str, row: Dict[str, Any]) -> Dict[str, str]:
+        """Add columns seen in a payload but missing from the table."""
+        columns = self._ensure_table(table)
+        for column, value in row.items():
+            if column not in columns:
+                declared = 'JSON' if isinstance(value, (dict, list)) else ''
+                self._conn.execute(f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(column)} {declared}")
+                columns[column] = declared
+        return columns
+
+    # ── conversion ────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _to_db(declared: str, value: Any) -> Any:
+        if value is None:
+            return None
+        if declared == 'JSON':
+            return json.dumps(value, default=str)
+        if isinstance(value, bool):
+            return int(value)
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, default=str)
+        return value
+
+    def _fetch(self, table: str, sql: str, params: List[Any]) -> List[Dict[str, Any]]:
+        """Run a SELECT on one table, decoding JSON and BOOLEAN columns."""
+        columns = self._ensure_table(table)
+        cursor = self._conn.execute(sql, params)
+        names = [d[0] for d in cursor.description]
+        result = []
+        for row in cursor:
+            record = {}
+            for column, value in zip(names, row):
+                declared = columns.get(column, '')
+                if value is not None and declared == 'JSON':
+                    value = json.loads(value)
+                elif value is not None and declared == 'BOOLEAN':
+                    value = bool(value)
+                record[column] = value
+            result.append(record)
+        return result
+
+    def _fetch_by_ids(self, table: str, ids: List[str]) -> List[Dict[str, Any]]:
+        """Rows by id, in the order of ids."""
+        if not ids:
+            return []
+        by_id = {}
+        for start in range(0, len(ids), SQLITE_MAX_PARAMS):
+            chunk = ids[start:start + SQLITE_MAX_PARAMS]
+            for row in self._fetch(
+                table, f"SELECT * FROM {_quote(table)} WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+            ):
+                by_id[row['id']] = row
+        return [by_id[i] for i in ids if i in by_id]
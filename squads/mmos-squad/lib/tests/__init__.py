@@ -0,0 +1 @@
+# Tests for MMOS lib modules
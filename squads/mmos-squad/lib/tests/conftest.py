@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for MMOS lib tests
+"""
+
+import os
+import sys
+import tempfile
+import pytest
+from pathlib import Path
+
+# Keep write-behind journals of the persisters under test out of ~/.aios
+os.environ.setdefault('MMOS_WRITE_BEHIND_DIR', tempfile.mkdtemp(prefix='mmos-write-behind-'))
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from memory_client import MemoryClient
+from db_persister import MMOSPersister
+
+# Reference rows resolved by slug through the persister's lookup cache
+REFERENCE_TABLES = {
+    'drivers': [
+        {'id': 'driver-curiosity', 'slug': 'curiosity'},
+        {'id': 'driver-autonomy', 'slug': 'autonomy'},
+    ],
+    'system_components': [
+        {'id': 'component-mbti-ei', 'slug': 'mbti-ei'},
+    ],
+}
+
+
+@pytest.fixture
+def make_client():
+    """Factory for MemoryClients seeded with the reference tables (MemoryClient kwargs)"""
+    return lambda **kwargs: MemoryClient(tables=REFERENCE_TABLES, **kwargs)
+
+
+@pytest.fixture
+def memory_client(make_client):
+    """MemoryClient seeded with the reference tables"""
+    return make_client()
+
+
+@pytest.fixture
+def persister(memory_client):
+    """Synchronous MMOSPersister writing to memory_client"""
+    return MMOSPersister(client=memory_client, write_behind=False)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Tests for async_persister.py
+Run with: pytest squads/mmos-squad/lib/tests/test_async_persister.py -v
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+from async_persister import AsyncMMOSPersister, PERSISTER_METHODS
+from db_persister import MMOSPersister
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+import persist_all_minds
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestAsyncMethods:
+    """Tests for the coroutine versions of persister methods"""
+
+    def test_every_listed_method_is_a_coroutine(self):
+        """Each name in PERSISTER_METHODS exists on both classes"""
+        for name in PERSISTER_METHODS:
+            assert hasattr(MMOSPersister, name)
+            assert asyncio.iscoroutinefunction(getattr(AsyncMMOSPersister, name))
+
+    def test_create_and_save(self, memory_client):
+        """Coroutines write through the wrapped persister"""
+        async def scenario():
+            async with AsyncMMOSPersister(client=memory_client) as db:
+                mind_id = await db.create_or_update_mind('sam_altman', 'Sam Altman')
+                await db.save_drivers(mind_id, [{'driver_slug': 'curiosity', 'strength': 9}])
+                return mind_id
+
+        mind_id = run(scenario())
+
+        drivers = memory_client.tables['mind_drivers']
+        assert [(d['mind_id'], d['driver_id'], d['strength']) for d in drivers] == [
+            (mind_id, 'driver-curiosity', 9)
+        ]
+
+    def test_gather_many_minds(self, memory_client):
+        """Concurrent calls all complete, results in call order"""
+        slugs = [f"mind_{i}" for i in range(20)]
+
+        async def scenario():
+            async with AsyncMMOSPersister(client=memory_client, concurrency=4) as db:
+                return await db.gather(db.create_or_update_mind(s, s.title()) for s in slugs)
+
+        mind_ids = run(scenario())
+
+        assert len(set(mind_ids)) == 20
+        by_id = {row['id']: row['slug'] for row in memory_client.tables['minds']}
+        assert [by_id[i] for i in mind_ids] == slugs
+
+    def test_lookup_cache_is_shared(self, memory_client):
+        """A reference table is loaded once for all concurrent calls"""
+        async def scenario():
+            async with AsyncMMOSPersister(client=memory_client, concurrency=4) as db:
+                return await db.gather(db.get_driver_id('autonomy') for _ in range(10))
+
+        before = memory_client.requests
+        assert run(scenario()) == ['driver-autonomy'] * 10
+        assert memory_client.requests - before == 1
+
+
+class TestConcurrency:
+    """Tests for the in-flight cap and error handling"""
+
+    def test_calls_in_flight_are_capped(self, persister):
+        """No more than `concurrency` calls run at once"""
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def slow_call():
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.02)
+            with lock:
+                state['active'] -= 1
+
+        async def scenario():
+            async with AsyncMMOSPersister(persister=persister, concurrency=3) as db:
+                await db.gather(db.run(slow_call) for _ in range(12))
+
+        run(scenario())
+
+        assert state['peak'] == 3
+
+    def test_gather_returns_none_for_failures(self, persister):
+        """A failing call does not cancel the others"""
+        def fail():
+            raise ValueError("boom")
+
+        async def scenario():
+            async with AsyncMMOSPersister(persister=persister) as db:
+                return await db.gather([db.run(lambda: 1), db.run(fail), db.run(lambda: 3)])
+
+        assert run(scenario()) == [1, None, 3]
+
+    def test_database_errors_are_swallowed(self, make_client):
+        """Writes against a failing database return instead of raising"""
+        persister = MMOSPersister(client=make_client(fail_rate=1.0, seed=1), write_behind=False)
+        persister.retry_policy.max_retries = 0
+
+        async def scenario():
+            async with AsyncMMOSPersister(persister=persister) as db:
+                return await db.save_values('mind-1', [{'name': 'Truth'}])
+
+        assert run(scenario()) == []
+
+
+class TestWriteBehind:
+    """Tests for close() with a write-behind persister"""
+
+    def test_close_flushes_queued_writes(self, memory_client):
+        """Queued writes are applied by the time close() returns"""
+        persister = MMOSPersister(client=memory_client, write_behind=True)
+        mind_id = persister.create_or_update_mind('naval', 'Naval')
+
+        async def scenario():
+            db = AsyncMMOSPersister(persister=persister)
+            queued = await db.save_values(mind_id, [{'name': 'Truth', 'importance_10': 9}])
+            await db.close()
+            return queued
+
+        assert run(scenario()) is None
+        assert [v['name'] for v in memory_client.tables['mind_values']] == ['Truth']
+
+
+class TestPersistAllMinds:
+    """Tests for scripts/persist_all_minds.py"""
+
+    def test_rerun_keeps_pipeline_metadata(self, tmp_path, persister):
+        """Persisting an existing mind again merges into its mmos_metadata"""
+        mind_dir = tmp_path / "naval"
+        mind_dir.mkdir()
+        (mind_dir / "metadata.yaml").write_text("mind:\n  display_name: Naval Ravikant\n", encoding='utf-8')
+
+        async def persist():
+            async with AsyncMMOSPersister(persister=persister) as db:
+                return await persist_all_minds.persist_mind(db, mind_dir, with_kb=False)
+
+        mind_id = run(persist())['mind_id']
+        persister.save_viability_result(mind_id, 8.5, recommendation='GO')
+        persister.update_pipeline_status(mind_id, 'analysis', phase_completed='research')
+
+        assert run(persist())['mind_id'] == mind_id
+
+        metadata = persister.client.tables['minds'][0]['mmos_metadata']
+        assert metadata['filesystem'] == {'display_name': 'Naval Ravikant'}
+        assert metadata['viability']['recommendation'] == 'GO'
+        assert metadata['pipeline_status'] == 'analysis'
+
+    def test_update_without_metadata_leaves_it_alone(self, persister):
+        """create_or_update_mind without mmos_metadata does not reset it"""
+        mind_id = persister.create_or_update_mind('naval', 'Naval', mmos_metadata={'source': 'kb'})
+        persister.create_or_update_mind('naval', 'Naval Ravikant')
+
+        row = persister.client.tables['minds'][0]
+        assert (row['id'], row['name'], row['mmos_metadata']) == (mind_id, 'Naval Ravikant', {'source': 'kb'})
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for driver_inference.py
+Run with: pytest squads/mmos-squad/lib/tests/test_driver_inference.py -v
+"""
+
+import pytest
+
+from driver_inference import HAS_NUMPY, DriverInferenceEngine
+from memory_client import MemoryClient
+
+BACKENDS = [
+    pytest.param(False, id='python'),
+    pytest.param(True, id='numpy', marks=pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")),
+]
+
+
+@pytest.fixture
+def client():
+    """A small map with a duplicated (component, driver) row and an inverse mapping"""
+    return MemoryClient(tables={
+        'system_components': [
+            {'id': 'c-ei', 'slug': 'mbti-ei', 'name': 'Extraversion'},
+            {'id': 'c-open', 'slug': 'big-five-openness', 'name': 'Openness'},
+        ],
+        'drivers': [
+            {'id': 'd-curiosity', 'slug': 'curiosity', 'name': 'Curiosity', 'driver_type': 'core'},
+            {'id': 'd-solitude', 'slug': 'solitude', 'name': 'Solitude', 'driver_type': 'core'},
+        ],
+        'component_driver_map': [
+            {'component_id': 'c-open', 'driver_id': 'd-curiosity', 'relevance': 'primary'},
+            {'component_id': 'c-ei', 'driver_id': 'd-curiosity', 'relevance': 'partial'},
+            {'component_id': 'c-ei', 'driver_id': 'd-curiosity', 'relevance': 'secondary'},
+            {'component_id': 'c-ei', 'driver_id': 'd-solitude', 'relevance': 'inverse'},
+        ],
+        'mind_component_scores': [
+            {'mind_id': 'm1', 'component_id': 'c-ei', 'score_numeric': 20},
+            {'mind_id': 'm1', 'component_id': 'c-open', 'score_numeric': 90},
+            {'mind_id': 'm2', 'component_id': 'c-ei', 'score_numeric': 80},
+        ],
+    })
+
+
+def strengths(rows):
+    return {row['driver_slug']: row['inferred_strength'] for row in rows}
+
+
+class TestInference:
+    """Tests for weighted driver inference"""
+
+    @pytest.mark.parametrize('use_numpy', BACKENDS)
+    def test_duplicate_mappings_add_up(self, client, use_numpy):
+        """Duplicate (component, driver) rows each contribute their weight"""
+        engine = DriverInferenceEngine(client, use_numpy=use_numpy)
+
+        # curiosity: (1.0·90 + 0.5·20 + 0.7·20) / (1.0 + 0.5 + 0.7); solitude: 100 - 20
+        assert strengths(engine.infer('m1')) == {'curiosity': round(114 / 2.2, 2), 'solitude': 80.0}
+
+    @pytest.mark.parametrize('use_numpy', BACKENDS)
+    def test_infer_all_and_what_if(self, client, use_numpy):
+        """infer_all scores every mind; infer_scores uses slugs without the database"""
+        engine = DriverInferenceEngine(client, use_numpy=use_numpy)
+
+        everything = engine.infer_all()
+        assert strengths(everything['m2']) == {'curiosity': 80.0, 'solitude': 20.0}
+        assert strengths(engine.infer_scores({'mbti-ei': 80, 'unknown': 5})) == strengths(everything['m2'])
+
+    @pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+    def test_backends_agree(self, client):
+        """numpy and pure Python give the same rows"""
+        python = DriverInferenceEngine(client, use_numpy=False).infer_all()
+        vectorized = DriverInferenceEngine(client, use_numpy=True).infer_all()
+
+        assert python == vectorized
+
+    def test_source_components(self, client):
+        """Each inferred driver lists the scored components behind it"""
+        rows = {r['driver_slug']: r for r in DriverInferenceEngine(client, use_numpy=False).infer('m2')}
+
+        assert rows['solitude']['source_components'] == ['Extraversion']
+        assert rows['solitude']['driver_type'] == 'core'
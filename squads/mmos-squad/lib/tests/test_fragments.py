@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests for MMOSPersister.save_fragments dedup and id reporting
+Run with: pytest squads/mmos-squad/lib/tests/test_fragments.py -v
+"""
+
+import pytest
+
+from db_persister import MMOSPersister
+from memory_client import MemoryClient
+
+
+class PostgrestError(Exception):
+    """Stand-in for postgrest.APIError (code is the SQLSTATE)"""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+class FailingSelectClient(MemoryClient):
+    """MemoryClient whose fragment selects raise a given error"""
+
+    def __init__(self, error, **kwargs):
+        super().__init__(**kwargs)
+        self.error = error
+
+    def _before_request(self, target, op):
+        super()._before_request(target, op)
+        if target == 'fragments' and op == 'select':
+            raise self.error
+
+
+def fragment(content, **fields):
+    return {'content': content, 'type': 'quote', **fields}
+
+
+class TestIds:
+    """Tests that report['ids'] lines up with the input fragments"""
+
+    def test_ids_keep_input_positions(self, persister):
+        """Fragments without content get None in their slot"""
+        report = persister.save_fragments('m1', 's1', [fragment('a'), {'content': ''}, fragment('b')])
+
+        assert len(report['ids']) == 3
+        assert report['ids'][0] and report['ids'][2]
+        assert report['ids'][1] is None
+        assert report['inserted'] == 2
+
+    def test_failed_writes_are_none(self, persister, monkeypatch):
+        """A row whose insert failed reports None at its own position"""
+        def insert(table, rows, batch_size=None, concurrency=None):
+            return [None if row['content'] == 'b' else f"id-{row['content']}" for row in rows]
+
+        monkeypatch.setattr(persister, '_batch_insert', insert)
+
+        report = persister.save_fragments('m1', 's1', [fragment('a'), fragment('b'), fragment('c')])
+
+        assert report['ids'] == ['id-a', None, 'id-c']
+        assert report['failed'] == 1
+
+    def test_failed_save_reports_none_per_input(self, persister, monkeypatch):
+        """When the whole save fails, every slot is None"""
+        def insert(*args, **kwargs):
+            raise RuntimeError('boom')
+
+        monkeypatch.setattr(persister, '_batch_insert', insert)
+
+        report = persister.save_fragments('m1', 's1', [fragment('a'), fragment('b')])
+
+        assert report['ids'] == [None, None]
+        assert report['failed'] == 2
+
+    def test_ids_without_dedup(self, persister):
+        """The plain insert path reports ids per input too"""
+        persister._fragment_dedup = False
+
+        report = persister.save_fragments('m1', 's1', [{'content': None}, fragment('a')])
+
+        assert report['ids'][0] is None and report['ids'][1]
+
+
+class TestDedup:
+    """Tests for the per mind/source content_hash index"""
+
+    def test_rerun_is_unchanged(self, make_client):
+        """Saving the same fragments again writes nothing and returns the same ids"""
+        first = MMOSPersister(client=make_client(), write_behind=False)
+        fragments = [fragment('a'), fragment('b'), fragment('a')]
+        saved = first.save_fragments('m1', 's1', fragments)
+        assert saved['ids'][0] == saved['ids'][2]
+
+        # A new persister starts with an empty cache and preloads from the table
+        second = MMOSPersister(client=first.client, write_behind=False)
+        again = second.save_fragments('m1', 's1', fragments)
+
+        assert again['ids'] == saved['ids']
+        assert again['unchanged'] == 3 and again['inserted'] == 0
+
+    def test_changed_fields_update_in_place(self, persister):
+        """Same content with a new insight keeps the id and is updated"""
+        saved = persister.save_fragments('m1', 's1', [fragment('a', insight='old')])
+        persister._fragment_hashes.clear()
+
+        again = persister.save_fragments('m1', 's1', [fragment('a', insight='new')])
+
+        assert again['ids'] == saved['ids'] and again['updated'] == 1
+        rows = persister.client.table('fragments').select('*').execute().data
+        assert [row['insight'] for row in rows] == ['new']
+
+    def test_sources_are_kept_apart(self, persister):
+        """The same content under another source, or no source, is a new fragment"""
+        with_source = persister.save_fragments('m1', 's1', [fragment('a')])
+        without_source = persister.save_fragments('m1', None, [fragment('a')])
+        persister._fragment_hashes.clear()
+
+        assert without_source['inserted'] == 1
+        assert without_source['ids'] != with_source['ids']
+        # NULL source rows are found again on reload
+        again = persister.save_fragments('m1', None, [fragment('a')])
+        assert again['ids'] == without_source['ids'] and again['unchanged'] == 1
+
+
+class TestMissingColumn:
+    """Tests for running against a table without content_hash"""
+
+    @pytest.mark.parametrize('error', [
+        PostgrestError('42703', 'column fragments.content_hash does not exist'),
+        Exception('no such column: content_hash'),
+    ])
+    def test_missing_content_hash_disables_dedup(self, error):
+        """An undefined-column error naming content_hash falls back to inserting"""
+        persister = MMOSPersister(client=FailingSelectClient(error), write_behind=False)
+
+        report = persister.save_fragments('m1', 's1', [fragment('a')])
+
+        assert report['inserted'] == 1
+        assert persister._fragment_dedup is False
+
+    @pytest.mark.parametrize('error', [
+        PostgrestError('42501', 'permission denied for table fragments (content_hash)'),
+        PostgrestError('42703', 'column fragments.source_id does not exist'),
+        Exception('timeout while reading content_hash'),
+    ])
+    def test_other_errors_fail_the_save(self, error):
+        """Other errors keep dedup on and write nothing, rather than inserting blind"""
+        persister = MMOSPersister(client=FailingSelectClient(error), write_behind=False)
+
+        report = persister.save_fragments('m1', 's1', [fragment('a')])
+
+        assert report['inserted'] == 0 and report['ids'] == [None]
+        assert persister._fragment_dedup is True
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Tests for resilience.py retry policy, circuit breaker and guarded client
+Run with: pytest squads/mmos-squad/lib/tests/test_resilience.py -v
+"""
+
+import time
+
+import pytest
+
+from db_persister import MMOSPersister
+from memory_client import MemoryClient, MemoryClientError
+from resilience import (
+    CLOSED, OPEN, HALF_OPEN, CircuitBreaker, CircuitOpenError, GuardedClient, RetryPolicy
+)
+
+
+class PostgrestError(Exception):
+    """Stand-in for postgrest.APIError (code is the SQLSTATE or HTTP status)"""
+
+    def __init__(self, code, message=''):
+        super().__init__(message or code)
+        self.code = code
+
+
+class Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class HTTPError(Exception):
+    """Stand-in for httpx.HTTPStatusError (status on the response)"""
+
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.response = Response(status_code)
+
+
+class ReadTimeout(Exception):
+    """Stand-in for httpx.ReadTimeout"""
+
+
+class FlakyClient(MemoryClient):
+    """MemoryClient that fails the next `failures` requests, or all while `down`"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.failures = 0
+        self.down = False
+
+    def _before_request(self, target, op):
+        super()._before_request(target, op)
+        if self.down or self.failures > 0:
+            self.failures -= 1
+            raise MemoryClientError(503)
+
+
+def no_wait_policy(max_retries=3):
+    return RetryPolicy(max_retries=max_retries, base_delay=0, jitter=False)
+
+
+class TestRetryPolicy:
+    """Tests for transient-error classification and backoff"""
+
+    @pytest.mark.parametrize('error', [
+        MemoryClientError(429),
+        MemoryClientError(503),
+        HTTPError(502),
+        PostgrestError('500'),
+        ConnectionResetError(),
+        TimeoutError(),
+        ReadTimeout(),
+    ])
+    def test_transient(self, error):
+        """Rate limits, 5xx, timeouts and dropped connections are retried"""
+        assert RetryPolicy().is_transient(error)
+
+    @pytest.mark.parametrize('error', [
+        MemoryClientError(400),
+        HTTPError(404),
+        PostgrestError('409'),
+        PostgrestError('42703', 'column fragments.content_hash does not exist'),
+        PostgrestError('23505', 'duplicate key value violates unique constraint'),
+        ValueError('bad row'),
+        CircuitOpenError('open'),
+    ])
+    def test_not_transient(self, error):
+        """Client errors, SQLSTATEs and an open circuit are not retried"""
+        assert not RetryPolicy().is_transient(error)
+
+    def test_should_retry_stops_at_max_retries(self):
+        """attempt counts from 0; max_retries retries follow the first call"""
+        policy = RetryPolicy(max_retries=2)
+        error = MemoryClientError(503)
+
+        assert [policy.should_retry(error, attempt) for attempt in range(3)] == [True, True, False]
+
+    def test_backoff_is_capped(self):
+        """Without jitter the delay doubles up to max_delay"""
+        policy = RetryPolicy(base_delay=0.5, max_delay=3, jitter=False)
+
+        assert [policy.backoff(attempt) for attempt in range(4)] == [0.5, 1, 2, 3]
+
+
+class TestCircuitBreaker:
+    """Tests for opening, probing and closing the circuit"""
+
+    def test_opens_after_threshold(self):
+        """Consecutive transient failures open the circuit"""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        for _ in range(2):
+            breaker.record(MemoryClientError(503))
+        assert breaker.state == CLOSED and breaker.allow()
+
+        breaker.record(MemoryClientError(503))
+
+        assert breaker.state == OPEN and breaker.times_opened == 1
+        assert breaker.is_open() and not breaker.allow()
+
+    def test_answers_reset_the_count(self):
+        """Successes and non-transient errors mean the database answered"""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.record(MemoryClientError(503))
+        breaker.record(ValueError('bad row'))
+        breaker.record(MemoryClientError(503))
+
+        assert breaker.state == CLOSED and breaker.failures == 1
+
+    def test_half_open_probe_success_closes(self):
+        """After reset_timeout one probe is allowed; its success closes the circuit"""
+        closed = []
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.on_close(lambda: closed.append(True))
+        breaker.record(MemoryClientError(503))
+        assert not breaker.allow()
+
+        time.sleep(0.06)
+        assert breaker.allow()
+        assert breaker.state == HALF_OPEN
+        # Only the probe goes through
+        assert not breaker.allow() and breaker.is_open()
+
+        breaker.record()
+
+        assert breaker.state == CLOSED and closed == [True]
+        assert breaker.allow()
+
+    def test_half_open_probe_failure_reopens(self):
+        """A failed probe opens the circuit for another reset_timeout"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.record(MemoryClientError(503))
+        time.sleep(0.06)
+        assert breaker.allow()
+
+        breaker.record(MemoryClientError(503))
+
+        assert breaker.state == OPEN and breaker.times_opened == 2
+        assert not breaker.allow()
+
+
+class TestGuardedClient:
+    """Tests for retries and fast failure on every execute()"""
+
+    def test_retries_transient_failures(self):
+        """A call that fails transiently is retried until it succeeds"""
+        client = FlakyClient()
+        guarded = GuardedClient(client, CircuitBreaker(failure_threshold=10), no_wait_policy())
+        client.failures = 2
+
+        query = guarded.table('minds').insert({'slug': 'naval'})
+        result = query.execute()
+
+        assert result.data[0]['slug'] == 'naval'
+        assert query.retries == 2
+        assert len(client.tables['minds']) == 1
+
+    def test_gives_up_after_max_retries(self):
+        """The last error is raised once retries run out"""
+        client = FlakyClient()
+        guarded = GuardedClient(client, CircuitBreaker(failure_threshold=10), no_wait_policy(max_retries=2))
+        client.down = True
+
+        with pytest.raises(MemoryClientError):
+            guarded.table('minds').select('*').execute()
+        assert client.requests == 3
+
+    def test_non_transient_errors_are_not_retried(self):
+        """Errors the database answered with are raised at once"""
+        class RejectingClient(MemoryClient):
+            def _before_request(self, target, op):
+                super()._before_request(target, op)
+                raise PostgrestError('23505')
+
+        client = RejectingClient()
+        guarded = GuardedClient(client, CircuitBreaker(), no_wait_policy())
+
+        with pytest.raises(PostgrestError):
+            guarded.table('minds').insert({'slug': 'naval'}).execute()
+        assert client.requests == 1
+
+    def test_open_circuit_stops_retrying(self):
+        """Retries stop when the circuit opens; later calls fail fast"""
+        client = FlakyClient()
+        guarded = GuardedClient(client, CircuitBreaker(failure_threshold=2, reset_timeout=60), no_wait_policy(5))
+        client.down = True
+
+        with pytest.raises(MemoryClientError):
+            guarded.table('minds').select('*').execute()
+        assert client.requests == 2
+
+        with pytest.raises(CircuitOpenError):
+            guarded.table('minds').select('*').execute()
+        assert client.requests == 2
+
+    def test_row_level_writes_are_retried(self, make_client):
+        """Persister writes outside the bulk paths get the policy too, and show in metrics"""
+        client = FlakyClient(tables=make_client().tables)
+        persister = MMOSPersister(client=client, write_behind=False, retry_policy=no_wait_policy())
+        mind_id = persister.create_or_update_mind('naval', 'Naval')
+        client.failures = 2
+
+        persister.update_pipeline_status(mind_id, 'running')
+
+        assert client.tables['minds'][0]['mmos_metadata']['pipeline_status'] == 'running'
+        retries = sum(call['retries'] for call in persister.metrics.snapshot()['calls'])
+        assert retries == 2
+
+
+class TestReplayOnClose:
+    """Tests for diverting writes while the circuit is open"""
+
+    def test_diverted_write_is_replayed_when_circuit_closes(self, make_client):
+        """A write made during an outage is journaled and applied after a successful probe"""
+        client = FlakyClient(tables=make_client().tables)
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05, policy=no_wait_policy(0))
+        persister = MMOSPersister(
+            client=client, write_behind=False, retry_policy=breaker.policy, breaker=breaker
+        )
+        mind_id = persister.create_or_update_mind('naval', 'Naval')
+
+        client.down = True
+        assert persister.save_values(mind_id, [{'name': 'Truth'}]) is None
+        assert breaker.state == OPEN
+        assert persister._outage_queue.pending() == 1
+
+        client.down = False
+        time.sleep(0.06)
+        # Any call after reset_timeout is the probe; its success closes the circuit
+        persister.client.table('minds').select('id').execute()
+        assert breaker.state == CLOSED
+        assert persister._outage_queue.flush(timeout=5)
+
+        assert [row['name'] for row in client.tables['mind_values']] == ['Truth']
+        persister._outage_queue.close(timeout=5)
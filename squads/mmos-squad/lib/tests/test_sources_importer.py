@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+Tests for SourcesImporter incremental imports (no database needed)
+Run with: pytest squads/mmos-squad/lib/tests/test_sources_importer.py -v
+"""
+
+import csv
+import io
+import json
+import os
+
+import pytest
+import yaml
+
+import sources_importer
+from import_manifest import ImportManifest
+from sources_importer import PART_COLUMNS, PART_COPY, CopyStream, SourcesImporter
+
+MIND = 'naval'
+
+
+class FakeCursor:
+    """psycopg2 cursor stand-in that records statements"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.statements.append(sql)
+
+    def copy_expert(self, sql, file, size=8192):
+        # Like psycopg2: read() until it returns nothing
+        self.conn.statements.append(sql)
+        data = b''
+        while True:
+            chunk = file.read(size)
+            if not chunk:
+                break
+            assert len(chunk) <= size
+            data += chunk
+        self.conn.copied.append(data)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.statements = []
+        self.copied = []
+        self.commits = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+class FakePool:
+    """Pool with a single connection"""
+
+    def __init__(self):
+        self.conn = FakeConnection()
+        self.closed = False
+
+    def getconn(self):
+        return self.conn
+
+    def putconn(self, conn, close=False):
+        pass
+
+
+class FakeImporter(SourcesImporter):
+    """SourcesImporter whose contents table is a dict (slug -> row)"""
+
+    def __init__(self, project_root, manifest_dir):
+        super().__init__(pool=FakePool(), verbose=False, manifest_dir=manifest_dir)
+        self.project_root = project_root
+        self.contents = {}
+        self.writes = []
+
+    def get_mind_id(self, mind_slug):
+        return 'mind-1'
+
+    def existing_contents(self, slugs):
+        return {
+            slug: (row['id'], bool(row['metadata'].get('split_into_parts')))
+            for slug, row in self.contents.items() if slug in slugs
+        }
+
+    def insert_contents(self, rows):
+        for row in rows:
+            self.contents[row['slug']] = {**row, 'id': f"content-{len(self.contents) + 1}"}
+            self.writes.append(('insert', row['slug']))
+        return {row['slug']: self.contents[row['slug']]['id'] for row in rows}
+
+    def update_contents(self, rows):
+        for content_id, data in rows:
+            self.contents[data['slug']] = {**data, 'id': content_id}
+            self.writes.append(('update', data['slug']))
+
+    def link_contents_to_mind(self, content_ids, mind_id, role='author'):
+        pass
+
+    def delete_parts(self, content_ids):
+        pass
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project root with a mind whose sources.yaml lists two files"""
+    sources_dir = tmp_path / 'outputs' / 'minds' / MIND / 'sources'
+    sources_dir.mkdir(parents=True)
+    (sources_dir / 's1.md').write_text('first source', encoding='utf-8')
+    (sources_dir / 's2.md').write_text('second source', encoding='utf-8')
+    write_inventory(tmp_path, [source('s1'), source('s2')])
+    return tmp_path
+
+
+def source(source_id, **fields):
+    return {
+        'id': source_id,
+        'title': f"Source {source_id}",
+        'type': 'blog',
+        'status': 'COLLECTED',
+        'file_path': f"outputs/minds/{MIND}/sources/{source_id}.md",
+        **fields,
+    }
+
+
+def write_inventory(root, sources):
+    path = root / 'outputs' / 'minds' / MIND / 'sources' / 'sources.yaml'
+    path.write_text(yaml.safe_dump({'sources': sources}), encoding='utf-8')
+
+
+def source_file(root, source_id):
+    return root / 'outputs' / 'minds' / MIND / 'sources' / f"{source_id}.md"
+
+
+def statuses(result):
+    return {detail['slug']: (detail['status'], detail.get('reason')) for detail in result['details']}
+
+
+@pytest.fixture
+def make_importer(project, tmp_path):
+    return lambda manifest_dir=tmp_path / 'manifests': FakeImporter(project, manifest_dir)
+
+
+@pytest.fixture
+def file_reads(monkeypatch):
+    """Counts of file hashes and content reads made by the importer"""
+    counts = {'digest': 0, 'read': 0}
+    digest = sources_importer.file_digest
+    read = SourcesImporter.read_source_content
+
+    def counting_digest(*args, **kwargs):
+        counts['digest'] += 1
+        return digest(*args, **kwargs)
+
+    def counting_read(self, file_path):
+        counts['read'] += 1
+        return read(self, file_path)
+
+    monkeypatch.setattr(sources_importer, 'file_digest', counting_digest)
+    monkeypatch.setattr(SourcesImporter, 'read_source_content', counting_read)
+    return counts
+
+
+class TestIncrementalImport:
+    """Tests for the manifest-driven skip, seed and update decisions"""
+
+    def test_first_import_inserts_and_records(self, make_importer):
+        """New sources are inserted and recorded in the saved manifest"""
+        importer = make_importer()
+
+        result = importer.import_mind_sources(MIND)
+
+        assert result['imported'] == 2 and result['failed'] == 0
+        assert importer.contents[f"{MIND}-s1"]['content'] == 'first source'
+        manifest = ImportManifest.for_mind(MIND, None, importer.manifest_dir)
+        assert manifest.entries[f"{MIND}-s1"]['content_id'] == importer.contents[f"{MIND}-s1"]['id']
+
+    def test_unchanged_files_are_not_read(self, make_importer, file_reads):
+        """Same entry and same stat: skipped without hashing or reading the file"""
+        importer = make_importer()
+        importer.import_mind_sources(MIND)
+        importer.writes.clear()
+        file_reads.update(digest=0, read=0)
+
+        result = importer.import_mind_sources(MIND)
+
+        assert result['skipped'] == 2 and result['imported'] == result['updated'] == 0
+        assert set(statuses(result).values()) == {('skipped', 'unchanged')}
+        assert importer.writes == []
+        assert file_reads == {'digest': 0, 'read': 0}
+
+    def test_touched_file_with_same_content_is_skipped(self, make_importer, project, file_reads):
+        """A new mtime costs a hash, not a write, and the stat is refreshed"""
+        importer = make_importer()
+        importer.import_mind_sources(MIND)
+        importer.writes.clear()
+        path = source_file(project, 's1')
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        file_reads.update(digest=0, read=0)
+
+        result = importer.import_mind_sources(MIND)
+
+        assert statuses(result)[f"{MIND}-s1"] == ('skipped', 'unchanged')
+        assert importer.writes == []
+        assert file_reads == {'digest': 1, 'read': 0}
+
+        # The refreshed stat was saved: the next run does not hash again
+        file_reads.update(digest=0)
+        importer.import_mind_sources(MIND)
+        assert file_reads['digest'] == 0
+
+    def test_existing_rows_seed_the_manifest(self, make_importer, tmp_path, file_reads):
+        """Rows imported elsewhere are recorded, not rewritten"""
+        first = make_importer()
+        first.import_mind_sources(MIND)
+        # Same database, but no manifest on this machine
+        importer = make_importer(tmp_path / 'other-manifests')
+        importer.contents = first.contents
+        file_reads.update(digest=0, read=0)
+
+        result = importer.import_mind_sources(MIND)
+
+        assert set(statuses(result).values()) == {('skipped', 'already_exists')}
+        assert importer.writes == [] and file_reads['read'] == 0
+        manifest = ImportManifest.for_mind(MIND, None, importer.manifest_dir)
+        assert manifest.entries[f"{MIND}-s2"]['content_id'] == first.contents[f"{MIND}-s2"]['id']
+
+        # Seeded entries make the next run skip by stat
+        again = importer.import_mind_sources(MIND)
+        assert set(statuses(again).values()) == {('skipped', 'unchanged')}
+
+    def test_changed_file_updates_its_row(self, make_importer, project):
+        """New content rewrites the existing row, keeping its id"""
+        importer = make_importer()
+        importer.import_mind_sources(MIND)
+        content_id = importer.contents[f"{MIND}-s1"]['id']
+        importer.writes.clear()
+        source_file(project, 's1').write_text('first source, revised', encoding='utf-8')
+
+        result = importer.import_mind_sources(MIND)
+
+        assert result['updated'] == 1 and result['skipped'] == 1
+        assert importer.writes == [('update', f"{MIND}-s1")]
+        row = importer.contents[f"{MIND}-s1"]
+        assert (row['id'], row['content']) == (content_id, 'first source, revised')
+        # Recorded: unchanged on the next run
+        assert importer.import_mind_sources(MIND)['updated'] == 0
+
+    def test_edited_entry_updates_its_row(self, make_importer, project):
+        """A sources.yaml change (e.g. the title) counts as a change"""
+        importer = make_importer()
+        importer.import_mind_sources(MIND)
+        importer.writes.clear()
+        write_inventory(project, [source('s1', title='Renamed'), source('s2')])
+
+        result = importer.import_mind_sources(MIND)
+
+        assert importer.writes == [('update', f"{MIND}-s1")]
+        assert importer.contents[f"{MIND}-s1"]['title'] == 'Renamed'
+        assert result['updated'] == 1
+
+    def test_removed_sources_are_pruned(self, make_importer, project):
+        """Entries gone from sources.yaml leave the manifest"""
+        importer = make_importer()
+        importer.import_mind_sources(MIND)
+        write_inventory(project, [source('s2')])
+
+        importer.import_mind_sources(MIND)
+
+        manifest = ImportManifest.for_mind(MIND, None, importer.manifest_dir)
+        assert set(manifest.entries) == {f"{MIND}-s2"}
+
+    def test_force_rewrites_everything(self, make_importer):
+        """skip_existing=False ignores the manifest"""
+        importer = make_importer()
+        importer.import_mind_sources(MIND)
+        importer.writes.clear()
+
+        result = importer.import_mind_sources(MIND, skip_existing=False)
+
+        assert result['updated'] == 2
+        assert sorted(importer.writes) == [('update', f"{MIND}-s1"), ('update', f"{MIND}-s2")]
+
+    def test_preview_writes_nothing(self, make_importer):
+        """Preview reports the actions without writing rows or the manifest"""
+        importer = make_importer()
+
+        result = importer.import_mind_sources(MIND, preview=True)
+
+        assert [detail['action'] for detail in result['details']] == ['insert', 'insert']
+        assert importer.writes == []
+        assert not ImportManifest.for_mind(MIND, None, importer.manifest_dir).path.exists()
+
+
+class TestCopyStream:
+    """Tests for the file object handed to copy_expert()"""
+
+    ROWS = ['"a","b"\n', '"olá ""quoted"", 世界"\n', '', '"x' + 'y' * 100 + '"\n', '"😀"\n']
+
+    @pytest.mark.parametrize('size', [1, 2, 3, 7, 64, 64 * 1024])
+    def test_read_size_reassembles_rows(self, size):
+        """Reads of any size return the encoded rows exactly, then b''"""
+        stream = CopyStream(iter(self.ROWS))
+        chunks = []
+        while True:
+            chunk = stream.read(size)
+            if not chunk:
+                break
+            assert len(chunk) <= size
+            chunks.append(chunk)
+
+        assert b''.join(chunks) == ''.join(self.ROWS).encode('utf-8')
+        assert stream.read(size) == b''
+
+    def test_read_all_after_partial_read(self):
+        """read() with no size returns the rest, including the buffered tail"""
+        stream = CopyStream(iter(self.ROWS))
+        head = stream.read(5)
+
+        assert head + stream.read() == ''.join(self.ROWS).encode('utf-8')
+        assert stream.read() == b''
+
+
+class TestCopyParts:
+    """Tests for streaming a large file into part rows with COPY"""
+
+    CONTENT_DATA = {
+        'ai_generated': False,
+        'content_type': 'article',
+        'slug': f"{MIND}-big",
+        'title': 'Big "source", part one',
+        'content': None,
+        'file_path': 'outputs/big.md',
+        'status': 'published',
+        'metadata': {'split_into_parts': True},
+    }
+
+    @pytest.fixture
+    def small_parts(self, monkeypatch):
+        monkeypatch.setattr(sources_importer, 'IMPORT_PART_CHARS', 40)
+        monkeypatch.setattr(sources_importer, 'PART_LINE_SLACK', 25)
+        monkeypatch.setattr(sources_importer, 'COPY_BUFFER_BYTES', 16)
+
+    def copy(self, tmp_path, text):
+        path = tmp_path / 'big.md'
+        path.write_text(text, encoding='utf-8', newline='')
+        importer = FakeImporter(tmp_path, tmp_path / 'manifests')
+        parts = importer.copy_parts('parent-1', self.CONTENT_DATA, path)
+        conn = importer.pool.conn
+        assert conn.statements == [PART_COPY]
+        rows = list(csv.reader(io.StringIO(conn.copied[0].decode('utf-8'), newline='')))
+        return parts, [dict(zip(PART_COLUMNS, row)) for row in rows]
+
+    def test_parts_reassemble_the_file(self, tmp_path, small_parts):
+        """CSV-quoted content (quotes, commas, line breaks, non-ASCII) round-trips exactly"""
+        text = ''.join(
+            f'line {i}: "quoted", comma, olá 世界 😀\r\n' if i % 3 == 0 else f'line {i}, plain\n'
+            for i in range(30)
+        )
+
+        parts, rows = self.copy(tmp_path, text)
+
+        assert parts == len(rows) > 1
+        # Same text a non-streamed import stores (read_source_content, universal newlines)
+        assert ''.join(row['content'] for row in rows) == (tmp_path / 'big.md').read_text(encoding='utf-8')
+
+    def test_part_rows(self, tmp_path, small_parts):
+        """Each part links to the parent with its sequence number and a derived slug"""
+        parts, rows = self.copy(tmp_path, 'word ' * 50)
+
+        assert [row['sequence_number'] for row in rows] == [str(n) for n in range(1, parts + 1)]
+        assert {row['parent_content_id'] for row in rows} == {'parent-1'}
+        assert rows[0]['slug'] == f"{MIND}-big-part-0001"
+        assert rows[0]['title'] == 'Big "source", part one (part 1)'
+        assert rows[0]['ai_generated'] == 'false'
+        assert json.loads(rows[1]['metadata']) == {'part_of': f"{MIND}-big", 'part': 2}
+
+    def test_parts_end_at_line_breaks(self, tmp_path, small_parts):
+        """A part runs on to the next line break when it is within the slack"""
+        text = ''.join(f"{'x' * 15} {i:02d}\n" for i in range(40))
+
+        _, rows = self.copy(tmp_path, text)
+
+        assert len(rows) > 1
+        assert all(row['content'].endswith('\n') for row in rows)
+        assert all(len(row['content']) <= 40 + 25 for row in rows)
+
+    def test_long_lines_are_cut_after_the_slack(self, tmp_path, small_parts):
+        """Without a line break in reach, a part stops at IMPORT_PART_CHARS + PART_LINE_SLACK"""
+        text = 'y' * 200 + '\n'
+
+        _, rows = self.copy(tmp_path, text)
+
+        assert [len(row['content']) for row in rows] == [65, 65, 65, 6]
+        assert ''.join(row['content'] for row in rows) == text
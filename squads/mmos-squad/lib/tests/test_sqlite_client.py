@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Tests for sqlite_client.py and scripts/sqlite_sync.py
+Run with: pytest squads/mmos-squad/lib/tests/test_sqlite_client.py -v
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+from db_persister import MMOSPersister
+from memory_client import MemoryClient
+from sqlite_client import SQLiteClient, SQLiteClientError
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+import sqlite_sync
+
+
+@pytest.fixture
+def sqlite_client(tmp_path):
+    """SQLiteClient on a temp file"""
+    client = SQLiteClient(tmp_path / "mmos.db")
+    yield client
+    client.close()
+
+
+class TestUpsert:
+    """Tests for upsert on natural keys"""
+
+    def test_insert_then_update_keeps_id(self, sqlite_client):
+        """A second upsert on the same key updates the row in place"""
+        table = sqlite_client.table
+        first = table('mind_values').upsert(
+            {'mind_id': 'm1', 'name': 'Truth', 'importance_10': 9}, on_conflict='mind_id,name'
+        ).execute().data
+        second = table('mind_values').upsert(
+            {'mind_id': 'm1', 'name': 'Truth', 'importance_10': 4}, on_conflict='mind_id,name'
+        ).execute().data
+
+        rows = table('mind_values').select('*').execute().data
+        assert len(rows) == 1
+        assert second[0]['id'] == first[0]['id']
+        assert rows[0]['importance_10'] == 4
+
+    def test_missing_column_is_not_overwritten(self, sqlite_client):
+        """Columns absent from the payload keep their stored value"""
+        table = sqlite_client.table
+        table('mind_values').upsert(
+            {'mind_id': 'm1', 'name': 'Truth', 'importance_10': 9, 'notes': 'core'},
+            on_conflict='mind_id,name'
+        ).execute()
+        table('mind_values').upsert(
+            {'mind_id': 'm1', 'name': 'Truth', 'importance_10': 7}, on_conflict='mind_id,name'
+        ).execute()
+
+        row = table('mind_values').select('*').execute().data[0]
+        assert (row['importance_10'], row['notes']) == (7, 'core')
+
+    def test_bulk_upsert_returns_rows_in_order(self, sqlite_client):
+        """A list payload returns one saved row per input row"""
+        rows = [{'mind_id': 'm1', 'driver_id': f"d{i}", 'strength': i} for i in range(5)]
+        saved = sqlite_client.table('mind_drivers').upsert(rows, on_conflict='mind_id,driver_id').execute().data
+
+        assert [r['driver_id'] for r in saved] == [f"d{i}" for i in range(5)]
+
+    def test_json_and_boolean_round_trip(self, sqlite_client):
+        """JSON columns come back as dicts/lists and BOOLEAN columns as bools"""
+        sqlite_client.table('mind_profiles').upsert({
+            'mind_id': 'm1', 'profile_type': 'generalista',
+            'content_json': {'layers': [1, 2]}, 'is_ai_generated': True,
+        }, on_conflict='mind_id,profile_type').execute()
+
+        row = sqlite_client.table('mind_profiles').select('*').execute().data[0]
+        assert row['content_json'] == {'layers': [1, 2]}
+        assert row['is_ai_generated'] is True
+
+    def test_unknown_columns_are_added(self, sqlite_client):
+        """Columns not in the schema are created on first write"""
+        sqlite_client.table('minds').insert({'slug': 'naval', 'extra': {'a': 1}}).execute()
+
+        row = sqlite_client.table('minds').select('slug, extra').execute().data[0]
+        assert row == {'slug': 'naval', 'extra': {'a': 1}}
+
+
+class TestSelect:
+    """Tests for filters, ordering, paging and embedded selects"""
+
+    @pytest.fixture
+    def drivers(self, sqlite_client):
+        rows = [{'slug': s, 'name': s.title()} for s in ('curiosity', 'autonomy', 'mastery')]
+        return sqlite_client.table('drivers').insert(rows).execute().data
+
+    def test_filters(self, sqlite_client, drivers):
+        """eq and in_ filter rows; an unknown column matches nothing"""
+        table = sqlite_client.table
+
+        assert [r['slug'] for r in table('drivers').select('slug').eq('slug', 'autonomy').execute().data] == ['autonomy']
+        assert len(table('drivers').select('id').in_('slug', ['autonomy', 'mastery']).execute().data) == 2
+        assert table('drivers').select('id').in_('slug', []).execute().data == []
+        assert table('drivers').select('id').eq('nope', 1).execute().data == []
+
+    def test_order_and_range(self, sqlite_client, drivers):
+        """order() and range() page through rows"""
+        page = sqlite_client.table('drivers').select('slug').order('slug').range(1, 2).execute().data
+
+        assert page == [{'slug': 'curiosity'}, {'slug': 'mastery'}]
+
+    def test_embedded_select(self, sqlite_client, drivers):
+        """select('x, table(cols)') joins through the known foreign keys"""
+        sqlite_client.table('component_driver_map').insert(
+            {'component_id': 'c1', 'driver_id': drivers[0]['id'], 'relevance': 'high'}
+        ).execute()
+
+        rows = sqlite_client.table('component_driver_map').select('relevance, drivers(slug)').execute().data
+        assert rows == [{'relevance': 'high', 'drivers': {'slug': 'curiosity'}}]
+
+    def test_unknown_relationship_raises(self, sqlite_client, drivers):
+        """Embedding a table with no foreign key is an error"""
+        with pytest.raises(SQLiteClientError):
+            sqlite_client.table('drivers').select('id, minds(slug)').execute()
+
+    def test_changes_since(self, sqlite_client):
+        """changes_since returns rows inserted or updated after a change seq"""
+        table = sqlite_client.table
+        table('fragments').insert([{'id': 'f1', 'content': 'a'}, {'id': 'f2', 'content': 'b'}]).execute()
+        marked = sqlite_client.changes_since('fragments')
+        assert [row['id'] for _, row in marked] == ['f1', 'f2']
+
+        table('fragments').update({'content': 'a2'}).eq('id', 'f1').execute()
+        table('fragments').upsert({'id': 'f3', 'content': 'c'}, on_conflict='id').execute()
+
+        newer = sqlite_client.changes_since('fragments', marked[-1][0])
+        assert [(row['id'], row['content']) for _, row in newer] == [('f1', 'a2'), ('f3', 'c')]
+
+    def test_existing_rows_are_logged_once(self, tmp_path):
+        """A file written before change tracking gets its rows logged on open"""
+        import sqlite3
+        path = tmp_path / "old.db"
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE fragments (id TEXT PRIMARY KEY, content TEXT)")
+        conn.execute("INSERT INTO fragments VALUES ('f1', 'a'), ('f2', 'b')")
+        conn.commit()
+        conn.close()
+
+        for _ in range(2):
+            client = SQLiteClient(path)
+            assert [row['id'] for _, row in client.changes_since('fragments')] == ['f1', 'f2']
+            client.close()
+
+
+class TestPersisterOnSQLite:
+    """Tests for MMOSPersister writing to SQLite"""
+
+    def test_repeated_saves_stay_unique(self, tmp_path):
+        """Saving the same drivers twice keeps one row per driver, across reopen"""
+        path = tmp_path / "mmos.db"
+        client = SQLiteClient(path)
+        client.table('drivers').insert({'slug': 'curiosity'}).execute()
+        persister = MMOSPersister(client=client, write_behind=False)
+        mind_id = persister.create_or_update_mind('naval', 'Naval')
+        persister.save_drivers(mind_id, [{'driver_slug': 'curiosity', 'strength': 6}])
+        persister.save_drivers(mind_id, [{'driver_slug': 'curiosity', 'strength': 8}])
+        client.close()
+
+        reopened = SQLiteClient(path)
+        rows = reopened.table('mind_drivers').select('strength').execute().data
+        reopened.close()
+        assert rows == [{'strength': 8}]
+
+
+class TestSync:
+    """Tests for sqlite_sync pull and push"""
+
+    @pytest.fixture
+    def remote(self):
+        """Remote reference tables, with ids that differ from the local ones"""
+        return MemoryClient(tables={
+            'drivers': [{'id': 'remote-curiosity', 'slug': 'curiosity'}],
+            'system_components': [{'id': 'remote-ei', 'slug': 'mbti-ei'}],
+        })
+
+    def test_pull_copies_reference_tables(self, sqlite_client, remote):
+        """pull() upserts the remote reference rows by slug"""
+        sqlite_sync.pull(sqlite_client, remote)
+        sqlite_sync.pull(sqlite_client, remote)
+
+        assert sqlite_client.table('drivers').select('id, slug').execute().data == [
+            {'id': 'remote-curiosity', 'slug': 'curiosity'}
+        ]
+
+    def test_push_remaps_ids_and_is_incremental(self, sqlite_client, remote):
+        """Minds and reference ids are remapped by slug; fragments are sent once"""
+        sqlite_client.table('drivers').insert({'id': 'local-curiosity', 'slug': 'curiosity'}).execute()
+        local = MMOSPersister(client=sqlite_client, write_behind=False)
+        mind_id = local.create_or_update_mind('naval', 'Naval')
+        local.save_drivers(mind_id, [{'driver_slug': 'curiosity', 'strength': 9}])
+        local.save_fragments(mind_id, 'source-1', [{'type': 'quote', 'content': 'Seek wealth'}])
+
+        sqlite_sync.Pusher(sqlite_client, remote).push()
+
+        remote_mind = remote.tables['minds'][0]
+        assert remote_mind['slug'] == 'naval' and remote_mind['id'] != mind_id
+        assert [(d['mind_id'], d['driver_id']) for d in remote.tables['mind_drivers']] == [
+            (remote_mind['id'], 'remote-curiosity')
+        ]
+        assert len(remote.tables['fragments']) == 1
+
+        # Only the new fragment is sent: the watermark skips the pushed one
+        local.save_fragments(mind_id, 'source-1', [{'type': 'quote', 'content': 'Play long-term games'}])
+        sqlite_sync.Pusher(sqlite_client, remote).push()
+
+        assert len(remote.tables['fragments']) == 2
+        assert len(remote.tables['mind_drivers']) == 1
+
+    def test_skipped_row_is_pushed_next_time(self, sqlite_client, remote):
+        """A row skipped for a missing mind holds the watermark until it is pushed"""
+        local = MMOSPersister(client=sqlite_client, write_behind=False)
+        mind_id = local.create_or_update_mind('naval', 'Naval')
+        # Written for a mind that is not in the local minds table yet
+        sqlite_client.table('fragments').insert({'id': 'f-early', 'mind_id': 'mind-2', 'content': 'early'}).execute()
+        local.save_fragments(mind_id, 'source-1', [{'type': 'quote', 'content': 'Seek wealth'}])
+
+        sqlite_sync.Pusher(sqlite_client, remote).push()
+        assert [f['content'] for f in remote.tables['fragments']] == ['Seek wealth']
+
+        sqlite_client.table('minds').insert({'id': 'mind-2', 'slug': 'pg', 'name': 'Paul Graham'}).execute()
+        sqlite_sync.Pusher(sqlite_client, remote).push()
+
+        assert sorted(f['content'] for f in remote.tables['fragments']) == ['Seek wealth', 'early']
+        assert len(remote.tables['fragments']) == 2
+
+    def test_failed_row_is_pushed_next_time(self, sqlite_client, remote, monkeypatch):
+        """A row whose remote write failed is sent again on the next push"""
+        local = MMOSPersister(client=sqlite_client, write_behind=False)
+        mind_id = local.create_or_update_mind('naval', 'Naval')
+        local.save_fragments(mind_id, 'source-1', [{'type': 'quote', 'content': c} for c in ('a', 'b', 'c')])
+
+        pusher = sqlite_sync.Pusher(sqlite_client, remote)
+        real_upsert = pusher.remote._bulk_upsert
+
+        def fail_second_fragment(table, rows, on_conflict):
+            ids = real_upsert(table, rows, on_conflict)
+            if table == 'fragments':
+                remote.tables['fragments'] = [f for f in remote.tables['fragments'] if f['content'] != 'b']
+                ids[1] = None
+            return ids
+
+        monkeypatch.setattr(pusher.remote, '_bulk_upsert', fail_second_fragment)
+        pusher.push()
+        assert sorted(f['content'] for f in remote.tables['fragments']) == ['a', 'c']
+
+        sqlite_sync.Pusher(sqlite_client, remote).push()
+        assert sorted(f['content'] for f in remote.tables['fragments']) == ['a', 'b', 'c']
+
+    def test_updated_row_is_pushed(self, sqlite_client, remote):
+        """A fragment updated in place (same id, same rowid) is pushed again"""
+        local = MMOSPersister(client=sqlite_client, write_behind=False)
+        mind_id = local.create_or_update_mind('naval', 'Naval')
+        local.save_fragments(mind_id, 'source-1', [{'type': 'quote', 'content': 'Seek wealth'}])
+        sqlite_sync.Pusher(sqlite_client, remote).push()
+
+        local.save_fragments(mind_id, 'source-1', [{'type': 'quote', 'content': 'Seek wealth', 'insight': 'leverage'}])
+        sqlite_sync.Pusher(sqlite_client, remote).push()
+
+        [fragment] = remote.tables['fragments']
+        assert fragment['insight'] == 'leverage'
+
+    def test_dry_run_writes_nothing(self, sqlite_client, remote):
+        """--dry-run counts rows without writing remotely or moving watermarks"""
+        local = MMOSPersister(client=sqlite_client, write_behind=False)
+        mind_id = local.create_or_update_mind('naval', 'Naval')
+        local.save_fragments(mind_id, 'source-1', [{'type': 'quote', 'content': 'Seek wealth'}])
+
+        sqlite_sync.Pusher(sqlite_client, remote, dry_run=True).push()
+
+        assert 'minds' not in remote.tables
+        assert sqlite_client.table('sync_state').select('*').execute().data == []
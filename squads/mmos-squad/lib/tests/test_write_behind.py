@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Tests for write_behind.py coalescing, holding and crash replay
+Run with: pytest squads/mmos-squad/lib/tests/test_write_behind.py -v
+"""
+
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from write_behind import WriteBehindQueue, journal_dir_for, orphaned_journals
+
+
+class Recorder:
+    """apply() stand-in that records calls"""
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, op, kwargs):
+        with self.lock:
+            self.calls.append((op, kwargs))
+
+
+@pytest.fixture
+def journal_dir(tmp_path):
+    return tmp_path / "journals"
+
+
+@pytest.fixture
+def make_queue(journal_dir):
+    """Queues with a long interval, so only flush() applies writes; closed after the test"""
+    queues = []
+
+    def make(apply, **kwargs):
+        queue = WriteBehindQueue(apply, journal_dir=journal_dir, interval=60, **kwargs)
+        queues.append(queue)
+        return queue
+
+    yield make
+    for queue in queues:
+        queue.close(timeout=5)
+
+
+def dead_pid():
+    """pid of a process that has exited"""
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def write_journal(path, records):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+
+
+def crash_with_queued_writes(journal_dir):
+    """Child process: queue writes that are held, then die without cleanup"""
+    queue = WriteBehindQueue(lambda op, kwargs: None, journal_dir=journal_dir, interval=60, hold=lambda: True)
+    queue.enqueue("create_or_update_mind", {"slug": "naval"}, key=("naval",))
+    queue.enqueue("save_values", {"mind_id": "m1", "values": [{"name": "Truth"}]}, key=("m1",),
+                  list_arg="values", item_key="name")
+    queue.enqueue("save_fragments", {"mind_id": "m1", "fragments": [{"content": "x"}]})
+    os._exit(0)
+
+
+class TestQueue:
+    """Tests for enqueue, coalescing and flush"""
+
+    def test_flush_applies_in_order(self, make_queue):
+        """Writes are applied in enqueue order and acknowledged"""
+        apply = Recorder()
+        queue = make_queue(apply)
+        queue.enqueue("a", {"n": 1})
+        queue.enqueue("b", {"n": 2})
+
+        assert queue.flush(timeout=5)
+        assert apply.calls == [("a", {"n": 1}), ("b", {"n": 2})]
+        assert queue.pending() == 0
+        # Drained: the journal is truncated
+        assert queue.journal_path.read_text() == ""
+
+    def test_same_key_replaces_pending_write(self, make_queue):
+        """A repeated write to a key supersedes the queued one"""
+        apply = Recorder()
+        queue = make_queue(apply, hold=lambda: True)
+        queue.enqueue("update_pipeline_status", {"status": "running"}, key=("m1",))
+        queue.enqueue("update_pipeline_status", {"status": "done"}, key=("m1",))
+        queue.enqueue("update_pipeline_status", {"status": "running"}, key=("m2",))
+
+        assert queue.pending() == 2
+
+        queue.hold = None
+        queue.flush(timeout=5)
+        assert apply.calls == [
+            ("update_pipeline_status", {"status": "done"}),
+            ("update_pipeline_status", {"status": "running"}),
+        ]
+
+    def test_list_rows_are_merged_by_item_key(self):
+        """List upserts keep one row per item key, newest wins; unkeyed rows are kept"""
+        merged = WriteBehindQueue._coalesce(
+            {"mind_id": "m1", "drivers": [{"slug": "a", "s": 1}, {"slug": "b", "s": 1}, {"s": 0}]},
+            {"mind_id": "m1", "drivers": [{"slug": "b", "s": 2}, {"slug": "c", "s": 2}]},
+            "drivers", "slug"
+        )
+
+        assert merged == {"mind_id": "m1", "drivers": [
+            {"slug": "a", "s": 1}, {"slug": "b", "s": 2}, {"slug": "c", "s": 2}, {"s": 0}
+        ]}
+
+    def test_coalesce_without_list_arg_takes_newest(self):
+        """Plain writes are replaced wholesale"""
+        assert WriteBehindQueue._coalesce({"a": 1}, {"b": 2}, None, None) == {"b": 2}
+
+    def test_hold_keeps_writes_queued(self, make_queue):
+        """While held, flush returns False and nothing is applied"""
+        apply = Recorder()
+        held = {"on": True}
+        queue = make_queue(apply, hold=lambda: held["on"])
+        queue.enqueue("a", {"n": 1})
+
+        assert queue.flush(timeout=5) is False
+        assert apply.calls == []
+        assert queue.pending() == 1
+
+        held["on"] = False
+        assert queue.flush(timeout=5)
+        assert apply.calls == [("a", {"n": 1})]
+
+    def test_failed_apply_is_acknowledged(self, make_queue):
+        """A write that raises is logged, not retried forever"""
+        def apply(op, kwargs):
+            raise RuntimeError("boom")
+
+        queue = make_queue(apply)
+        queue.enqueue("a", {})
+
+        assert queue.flush(timeout=5)
+        assert queue.pending() == 0
+
+    def test_close_removes_drained_journal(self, make_queue):
+        """close() flushes and deletes the journal"""
+        apply = Recorder()
+        queue = make_queue(apply)
+        queue.enqueue("a", {})
+        queue.close(timeout=5)
+
+        assert apply.calls == [("a", {})]
+        assert not queue.journal_path.exists()
+
+
+class TestReplay:
+    """Tests for adopting journals left by dead processes"""
+
+    def test_replays_unacknowledged_entries_in_order(self, make_queue, journal_dir):
+        """Only entries without an ack are replayed, by seq; the orphan is removed"""
+        orphan = journal_dir / f"journal-{dead_pid()}-1.jsonl"
+        write_journal(orphan, [
+            {"seq": 1, "op": "a", "kwargs": {"n": 1}, "key": None},
+            {"seq": 2, "op": "b", "kwargs": {"n": 2}, "key": None},
+            {"ack": [1]},
+            {"seq": 3, "op": "c", "kwargs": {"n": 3}, "key": ["k"]},
+        ])
+        apply = Recorder()
+
+        queue = make_queue(apply)
+        queue.flush(timeout=5)
+
+        assert apply.calls == [("b", {"n": 2}), ("c", {"n": 3})]
+        assert not orphan.exists()
+
+    def test_replayed_list_writes_are_merged(self, make_queue, journal_dir):
+        """Replayed entries keep their key, list_arg and item_key"""
+        row = {"op": "save_values", "key": ["m1"], "list_arg": "values", "item_key": "name"}
+        write_journal(journal_dir / f"journal-{dead_pid()}-1.jsonl", [
+            {**row, "seq": 1, "kwargs": {"values": [{"name": "Truth", "v": 1}]}},
+            {**row, "seq": 2, "kwargs": {"values": [{"name": "Truth", "v": 2}, {"name": "Play"}]}},
+        ])
+        apply = Recorder()
+
+        make_queue(apply).flush(timeout=5)
+
+        assert apply.calls == [("save_values", {"values": [{"name": "Truth", "v": 2}, {"name": "Play"}]})]
+
+    def test_skips_corrupt_lines(self, make_queue, journal_dir):
+        """A torn last line does not stop replay"""
+        orphan = journal_dir / f"journal-{dead_pid()}-1.jsonl"
+        write_journal(orphan, [{"seq": 1, "op": "a", "kwargs": {}, "key": None}])
+        with open(orphan, "a") as f:
+            f.write('{"seq": 2, "op": ')
+        apply = Recorder()
+
+        make_queue(apply).flush(timeout=5)
+
+        assert apply.calls == [("a", {})]
+
+    def test_live_process_journals_are_not_adopted(self, make_queue, journal_dir):
+        """Journals of running processes (other than us) are left alone"""
+        live = journal_dir / f"journal-{os.getppid()}-1.jsonl"
+        write_journal(live, [{"seq": 1, "op": "a", "kwargs": {}, "key": None}])
+        apply = Recorder()
+
+        make_queue(apply).flush(timeout=5)
+
+        assert apply.calls == []
+        assert live.exists()
+
+    def test_own_pid_journal_not_in_use_is_adopted(self, make_queue, journal_dir):
+        """A journal with our pid that no queue owns came from a recycled pid"""
+        recycled = journal_dir / f"journal-{os.getpid()}-999999.jsonl"
+        write_journal(recycled, [{"seq": 1, "op": "a", "kwargs": {}, "key": None}])
+
+        assert orphaned_journals(journal_dir) == [recycled]
+        queue = make_queue(Recorder())
+        # The new queue's own journal is never an orphan
+        assert queue.journal_path not in orphaned_journals(journal_dir)
+
+    def test_replays_after_process_crash(self, make_queue, journal_dir):
+        """Writes queued by a process that died are applied by the next queue"""
+        child = multiprocessing.get_context("fork").Process(target=crash_with_queued_writes, args=(journal_dir,))
+        child.start()
+        child.join()
+        assert len(orphaned_journals(journal_dir)) == 1
+        apply = Recorder()
+
+        make_queue(apply).flush(timeout=5)
+
+        assert apply.calls == [
+            ("create_or_update_mind", {"slug": "naval"}),
+            ("save_values", {"mind_id": "m1", "values": [{"name": "Truth"}]}),
+            ("save_fragments", {"mind_id": "m1", "fragments": [{"content": "x"}]}),
+        ]
+        assert orphaned_journals(journal_dir) == []
+
+    def test_journal_dirs_are_per_backend(self, tmp_path):
+        """Each backend gets its own journal directory"""
+        a = journal_dir_for("https://a.supabase.co", tmp_path)
+        b = journal_dir_for("sqlite:/tmp/mmos.db", tmp_path)
+
+        assert a != b and a.parent == b.parent == tmp_path
+        assert journal_dir_for("https://a.supabase.co", tmp_path) == a
+        assert "supabase" not in a.name
@@ -0,0 +1,322 @@
+"""
+MMOS Write-Behind Queue
+=======================
+Background writer for MMOSPersister so pipeline phases never wait on the
+database.
+
+Queued writes are:
+- journaled to a local JSONL file first (one per queue, named after the
+  process), so a crash replays them: a new queue adopts the journals of
+  processes that are no longer running. Journals are kept in one directory
+  per database (journal_dir_for), so writes are only ever replayed into the
+  backend they were meant for. Entries are acknowledged once applied and
+  the journal is truncated whenever the queue is empty
+- coalesced: a repeated write to the same key replaces the pending one, and
+  list upserts (drivers, scores, ...) are merged row by row
+- applied by one worker thread on flush() (phase boundaries), every
+  MMOS_WRITE_BEHIND_INTERVAL seconds, and at interpreter exit
+- held while `hold()` is true (the database circuit is open): they stay in
+  the journal and are applied once it returns false
+
+Author: MMOS Team
+Created: 2026-10-17
+"""
+
+import os
+import re
+import json
+import hashlib
+import atexit
+import logging
+import itertools
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_DIR = Path(os.getenv(
+    'MMOS_WRITE_BEHIND_DIR',
+    str(Path.home() / '.aios' / 'mmos' / 'write-behind')
+))
+FLUSH_INTERVAL_SECONDS = float(os.getenv('MMOS_WRITE_BEHIND_INTERVAL', '2'))
+EXIT_FLUSH_TIMEOUT_SECONDS = 30.0
+
+_JOURNAL_NAME = re.compile(r'^journal-(\d+)-(\d+)\.jsonl$')
+_queue_numbers = itertools.count(1)
+_active_journals = set()
+
+
+def _process_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Exists but belongs to someone else
+        return True
+    return True
+
+
+def journal_dir_for(backend: Optional[str], journal_dir: Path = JOURNAL_DIR) -> Path:
+    """
+    Journal directory for one database backend (a Supabase URL, an SQLite
+    path or 'memory'); hashed so URLs never reach the disk.
+    """
+    return Path(journal_dir) / hashlib.sha256((backend or 'default').encode('utf-8')).hexdigest()[:16]
+
+
+def orphaned_journals(journal_dir: Path = JOURNAL_DIR) -> List[Path]:
+    """Journals left behind by processes that are no longer running."""
+    orphans = []
+    try:
+        candidates = sorted(Path(journal_dir).glob('journal-*.jsonl'))
+    except OSError:
+        return orphans
+    for path in candidates:
+        match = _JOURNAL_NAME.match(path.name)
+        if not match or path in _active_journals:
+            continue
+        pid = int(match.group(1))
+        # Our own pid on a journal we don't own: a dead process with a recycled pid
+        if pid == os.getpid() or not _process_alive(pid):
+            orphans.append(path)
+    return orphans
+
+
+class WriteBehindQueue:
+    """
+    Durable, coalescing queue of persister calls applied by a worker thread.
+
+    Args:
+        apply: Callable(op, kwargs) that performs one write
+        journal_dir: Directory for crash-recovery journals (MMOS_WRITE_BEHIND_DIR)
+        interval: Seconds between background flushes
+        hold: Callable returning True while queued writes must not be applied
+    """
+
+    def __init__(
+        self,
+        apply: Callable[[str, Dict[str, Any]], Any],
+        journal_dir: Path = JOURNAL_DIR,
+        interval: float = FLUSH_INTERVAL_SECONDS,
+        hold: Optional[Callable[[], bool]] = None
+    ):
+        self.apply = apply
+        self.hold = hold
+        self.journal_dir = Path(journal_dir)
+        self.journal_path = self.journal_dir / f"journal-{os.getpid()}-{next(_queue_numbers)}.jsonl"
+        self.interval = interval
+        _active_journals.add(self.journal_path)
+
+        # key -> {'op', 'kwargs', 'seqs', 'list_arg', 'item_key'}; dict keeps insertion order
+        self._pending: Dict[Tuple, Dict[str, Any]] = {}
+        self._in_flight = 0
+        self._seq = 0
+        self._lock = threading.Condition()
+        self._flush_requested = False
+        self._closed = False
+        self._worker_ident: Optional[int] = None
+
+        self._replay_journal()
+
+        self._thread = threading.Thread(target=self._run, name='mmos-write-behind', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    # ── public API ────────────────────────────────────────────────────────
+
+    def enqueue(
+        self,
+        op: str,
+        kwargs: Dict[str, Any],
+        key: Optional[Tuple] = None,
+        list_arg: Optional[str] = None,
+        item_key: Optional[str] = None
+    ) -> None:
+        """
+        Queue a write.
+
+        Args:
+            op: Persister method name
+            kwargs: Keyword arguments for the call (JSON-serializable)
+            key: Coalescing key; None queues the call unconditionally
+            list_arg: For list upserts, the kwarg holding the rows...
+            item_key: ...and the row field that identifies a row
+        """
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+            self._journal({'seq': seq, 'op': op, 'kwargs': kwargs, 'key': key,
+                           'list_arg': list_arg, 'item_key': item_key})
+
+            pending_key = (op, *key) if key is not None else ('#', seq)
+            entry = self._pending.get(pending_key)
+            if entry is None:
+                self._pending[pending_key] = {
+                    'op': op, 'kwargs': kwargs, 'seqs': [seq],
+                    'list_arg': list_arg, 'item_key': item_key
+                }
+            else:
+                entry['kwargs'] = self._coalesce(entry['kwargs'], kwargs, list_arg, item_key)
+                entry['seqs'].append(seq)
+            self._lock.notify_all()
+
+    def flush(self, wait: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        Apply everything queued so far.
+
+        Args:
+            wait: Block until the queue is empty
+            timeout: Max seconds to wait
+
+        Returns:
+            True if the queue was drained (always True when wait=False);
+            False right away while writes are held
+        """
+        with self._lock:
+            self._flush_requested = True
+            self._lock.notify_all()
+            if not wait or self.is_worker_thread():
+                return True
+            self._lock.wait_for(
+                lambda: (not self._pending and not self._in_flight) or self._held(), timeout
+            )
+            return not self._pending and not self._in_flight
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending) + self._in_flight
+
+    def is_worker_thread(self) -> bool:
+        return threading.get_ident() == self._worker_ident
+
+    def _held(self) -> bool:
+        return self.hold is not None and bool(self._pending) and self.hold()
+
+    def close(self, timeout: float = EXIT_FLUSH_TIMEOUT_SECONDS) -> None:
+        """Flush and stop the worker (registered with atexit)."""
+        if self._closed:
+            return
+        if not self.flush(wait=True, timeout=timeout):
+            logger.warning(
+                f"✗ {self.pending()} queued DB writes left in {self.journal_path} "
+                "(replayed on next start)"
+            )
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+        if not self.pending():
+            try:
+                self.journal_path.unlink()
+            except OSError:
+                pass
+        _active_journals.discard(self.journal_path)
+
+    # ── worker ────────────────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        self._worker_ident = threading.get_ident()
+        while True:
+            with self._lock:
+                self._lock.wait_for(lambda: self._closed or self._flush_requested, self.interval)
+                if self._closed and (not self._pending or self._held()):
+                    return
+                if self._held():
+                    # Stay journaled; checked again every interval
+                    self._flush_requested = False
+                    self._lock.notify_all()
+                    continue
+                self._flush_requested = False
+                batch = list(self._pending.values())
+                self._pending = {}
+                self._in_flight = len(batch)
+
+            for entry in batch:
+                try:
+                    self.apply(entry['op'], entry['kwargs'])
+                except Exception as e:
+                    # Persister writes already log and swallow; this is a last resort
+                    logger.error(f"✗ Queued {entry['op']} failed: {e}", exc_info=True)
+                with self._lock:
+                    self._journal({'ack': entry['seqs']})
+                    self._in_flight -= 1
+
+            with self._lock:
+                if not self._pending and not self._in_flight:
+                    self._truncate_journal()
+                self._lock.notify_all()
+
+    @staticmethod
+    def _coalesce(
+        old: Dict[str, Any],
+        new: Dict[str, Any],
+        list_arg: Optional[str],
+        item_key: Optional[str]
+    ) -> Dict[str, Any]:
+        if not list_arg:
+            return new
+
+        rows: Dict[Any, Dict[str, Any]] = {}
+        unkeyed: List[Dict[str, Any]] = []
+        for row in list(old.get(list_arg) or []) + list(new.get(list_arg) or []):
+            if isinstance(row, dict) and row.get(item_key) is not None:
+                rows[row[item_key]] = row
+            else:
+                unkeyed.append(row)
+        return {**new, list_arg: list(rows.values()) + unkeyed}
+
+    # ── journal ───────────────────────────────────────────────────────────
+
+    def _journal(self, record: Dict[str, Any]) -> None:
+        try:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, default=str) + '\n')
+        except OSError as e:
+            logger.warning(f"✗ Write-behind journal unavailable ({e}); queued writes are not crash-safe")
+
+    def _truncate_journal(self) -> None:
+        try:
+            if self.journal_path.exists():
+                self.journal_path.write_text('', encoding='utf-8')
+        except OSError:
+            pass
+
+    def _replay_journal(self) -> None:
+        """Adopt the unapplied entries of orphaned journals."""
+        for path in orphaned_journals(self.journal_dir):
+            try:
+                lines = path.read_text(encoding='utf-8').splitlines()
+            except OSError:
+                continue
+
+            entries: Dict[int, Dict[str, Any]] = {}
+            for line in lines:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if 'ack' in record:
+                    for seq in record['ack']:
+                        entries.pop(seq, None)
+                elif 'seq' in record:
+                    entries[record['seq']] = record
+
+            if entries:
+                logger.info(f"⟳ Replaying {len(entries)} queued DB writes from {path}")
+            for seq in sorted(entries):
+                record = entries[seq]
+                key = tuple(record['key']) if record.get('key') is not None else None
+                # Re-journaled under this queue before the orphan is removed
+                self.enqueue(record['op'], record['kwargs'], key, record.get('list_arg'),
+                             record.get('item_key'))
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+        if self._pending:
+            self._flush_requested = True
@@ -0,0 +1,67 @@
+-- Migration: 001_mmos_upsert_keys
+-- Created: 2026-10-17
+-- Author: MMOS Team
+-- Description: Unique keys used as upsert conflict targets by MMOSPersister
+--              (save_component_scores, save_drivers, save_values,
+--              save_obsessions in lib/db_persister.py). Without them those
+--              writes fall back to select-then-insert/update per row.
+--
+-- IMPORTANT: Run in transaction, test with dry-run first
+-- ROLLBACK: ALTER TABLE <table> DROP CONSTRAINT IF EXISTS <constraint>;
+--           for each constraint below
+
+BEGIN;
+
+-- =============================================================================
+-- PRE-MIGRATION CHECKS
+-- =============================================================================
+
+-- Older select-then-write runs could race and store a key twice. Resolve
+-- duplicates first, e.g. keeping the newest row:
+--   DELETE FROM mind_drivers a USING mind_drivers b
+--   WHERE a.mind_id = b.mind_id AND a.driver_id = b.driver_id AND a.ctid < b.ctid;
+DO $$
+BEGIN
+    ASSERT NOT EXISTS (
+        SELECT 1 FROM mind_component_scores GROUP BY mind_id, component_id HAVING COUNT(*) > 1
+    ), 'Duplicate (mind_id, component_id) rows in mind_component_scores';
+    ASSERT NOT EXISTS (
+        SELECT 1 FROM mind_drivers GROUP BY mind_id, driver_id HAVING COUNT(*) > 1
+    ), 'Duplicate (mind_id, driver_id) rows in mind_drivers';
+    ASSERT NOT EXISTS (
+        SELECT 1 FROM mind_values GROUP BY mind_id, name HAVING COUNT(*) > 1
+    ), 'Duplicate (mind_id, name) rows in mind_values';
+    ASSERT NOT EXISTS (
+        SELECT 1 FROM mind_obsessions GROUP BY mind_id, name HAVING COUNT(*) > 1
+    ), 'Duplicate (mind_id, name) rows in mind_obsessions';
+    RAISE NOTICE 'Pre-migration checks passed';
+END $$;
+
+-- =============================================================================
+-- SCHEMA CHANGES
+-- =============================================================================
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'mind_component_scores_mind_component_key') THEN
+        ALTER TABLE mind_component_scores
+            ADD CONSTRAINT mind_component_scores_mind_component_key UNIQUE (mind_id, component_id);
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'mind_drivers_mind_driver_key') THEN
+        ALTER TABLE mind_drivers
+            ADD CONSTRAINT mind_drivers_mind_driver_key UNIQUE (mind_id, driver_id);
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'mind_values_mind_name_key') THEN
+        ALTER TABLE mind_values
+            ADD CONSTRAINT mind_values_mind_name_key UNIQUE (mind_id, name);
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'mind_obsessions_mind_name_key') THEN
+        ALTER TABLE mind_obsessions
+            ADD CONSTRAINT mind_obsessions_mind_name_key UNIQUE (mind_id, name);
+    END IF;
+END $$;
+
+COMMIT;
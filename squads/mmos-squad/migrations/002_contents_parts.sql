@@ -0,0 +1,30 @@
+-- Migration: 002_contents_parts
+-- Created: 2026-10-17
+-- Author: MMOS Team
+-- Description: Part columns on contents for sources split by the importer
+--              (lib/sources_importer.py). Files over MMOS_IMPORT_STREAM_BYTES
+--              are stored as a parent row (metadata.split_into_parts) plus
+--              part rows streamed in with COPY. Without these columns such
+--              files fail to import with stream_failed; other imports are
+--              unaffected.
+--
+-- IMPORTANT: Run in transaction, test with dry-run first
+-- ROLLBACK: DROP INDEX IF EXISTS contents_parent;
+--           ALTER TABLE contents DROP COLUMN IF EXISTS sequence_number;
+--           ALTER TABLE contents DROP COLUMN IF EXISTS parent_content_id;
+
+BEGIN;
+
+-- =============================================================================
+-- SCHEMA CHANGES
+-- =============================================================================
+
+-- Parts are deleted with their parent
+ALTER TABLE contents
+    ADD COLUMN IF NOT EXISTS parent_content_id UUID REFERENCES contents(id) ON DELETE CASCADE;
+ALTER TABLE contents ADD COLUMN IF NOT EXISTS sequence_number INTEGER;
+
+-- Read a split source back in order
+CREATE INDEX IF NOT EXISTS contents_parent ON contents (parent_content_id, sequence_number);
+
+COMMIT;
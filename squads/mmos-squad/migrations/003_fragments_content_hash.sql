@@ -0,0 +1,27 @@
+-- Migration: 003_fragments_content_hash
+-- Created: 2026-10-17
+-- Author: MMOS Team
+-- Description: Normalized content hash on fragments for idempotent
+--              save_fragments (lib/db_persister.py). Hashes stored for a
+--              mind and source are preloaded with one paged select, so a
+--              re-run skips unchanged fragments. Without the column,
+--              fragment dedup is switched off and every save inserts.
+--              Fragments stored earlier get their hash on the next save.
+--
+-- IMPORTANT: Run in transaction, test with dry-run first
+-- ROLLBACK: DROP INDEX IF EXISTS fragments_mind_source_content_hash;
+--           ALTER TABLE fragments DROP COLUMN IF EXISTS content_hash;
+
+BEGIN;
+
+-- =============================================================================
+-- SCHEMA CHANGES
+-- =============================================================================
+
+ALTER TABLE fragments ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+-- The preload filters on mind and source
+CREATE INDEX IF NOT EXISTS fragments_mind_source_content_hash
+    ON fragments (mind_id, source_id, content_hash);
+
+COMMIT;
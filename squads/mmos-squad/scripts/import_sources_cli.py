@@ -9,6 +9,8 @@ Usage:
     python import_sources_cli.py preview sam_altman
     python import_sources_cli.py import sam_altman
     python import_sources_cli.py import sam_altman --force
+    python import_sources_cli.py import-all --workers 8
+    python import_sources_cli.py import-all sam_altman naval_ravikant --preview
 """
 
 import sys
@@ -18,7 +20,14 @@ from pathlib import Path
 # Add lib/ to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
 
-from sources_importer import SourcesImporter, print_validation_report, print_import_report
+from sources_importer import (
+    IMPORT_WORKERS,
+    SourcesImporter,
+    print_validation_report,
+    print_import_report,
+    print_import_progress,
+    print_import_all_report,
+)
 
 
 def main():
@@ -42,7 +51,7 @@ def main():
     import_parser.add_argument(
         '--force',
         action='store_true',
-        help='Force import even if sources already exist (overwrite)'
+        help='Re-read and rewrite every source, ignoring the import manifest'
     )
 
     # Import artifacts command
@@ -51,7 +60,7 @@ def main():
     import_artifacts_parser.add_argument(
         '--force',
         action='store_true',
-        help='Force import even if artifacts already exist (overwrite)'
+        help='Re-read and rewrite every artifact, ignoring the import manifest'
     )
 
     # Import complete command (sources + artifacts)
@@ -60,9 +69,25 @@ def main():
     import_complete_parser.add_argument(
         '--force',
         action='store_true',
-        help='Force import even if content already exists (overwrite)'
+        help='Re-read and rewrite everything, ignoring the import manifest'
     )
 
+    # Import all command (every mind, concurrently)
+    import_all_parser = subparsers.add_parser('import-all', help='Import EVERYTHING for every mind in outputs/minds/')
+    import_all_parser.add_argument('minds', nargs='*', help='Only these mind slugs (default: all)')
+    import_all_parser.add_argument(
+        '--workers',
+        type=int,
+        default=IMPORT_WORKERS,
+        help=f'Minds imported concurrently, capped at the pool size (default: {IMPORT_WORKERS})'
+    )
+    import_all_parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-read and rewrite everything, ignoring the import manifest'
+    )
+    import_all_parser.add_argument('--preview', action='store_true', help='Dry run')
+
     # Status command
     status_parser = subparsers.add_parser('status', help='Check database connection')
 
@@ -73,7 +98,11 @@ def main():
         sys.exit(1)
 
     try:
-        importer = SourcesImporter()
+        if args.command == 'import-all':
+            # One connection per worker, all from the same pool
+            importer = SourcesImporter(pool_size=max(args.workers, 1))
+        else:
+            importer = SourcesImporter()
 
         if args.command == 'validate':
             validation = importer.validate_import(args.mind_slug)
@@ -134,22 +163,51 @@ def main():
             print("")
             print(f"Sources:")
             print(f"  ✅ Imported: {result['sources'].get('imported', 0)}")
+            print(f"  🔄 Updated: {result['sources'].get('updated', 0)}")
             print(f"  ⏭️  Skipped: {result['sources'].get('skipped', 0)}")
             print(f"  ❌ Failed: {result['sources'].get('failed', 0)}")
             print("")
             print(f"Artifacts:")
             print(f"  ✅ Imported: {result['artifacts'].get('imported', 0)}")
+            print(f"  🔄 Updated: {result['artifacts'].get('updated', 0)}")
             print(f"  ⏭️  Skipped: {result['artifacts'].get('skipped', 0)}")
             print(f"  ❌ Failed: {result['artifacts'].get('failed', 0)}")
             print("")
             print(f"TOTAL:")
             print(f"  ✅ Imported: {result['total_imported']}")
+            print(f"  🔄 Updated: {result['total_updated']}")
             print(f"  ⏭️  Skipped: {result['total_skipped']}")
             print(f"  ❌ Failed: {result['total_failed']}")
             print("="*60 + "\n")
 
             sys.exit(0 if result['total_failed'] == 0 else 1)
 
+        elif args.command == 'import-all':
+            if args.force:
+                print("⚠️  FORCE MODE: Will overwrite ALL existing content\n")
+
+            minds = args.minds or importer.discover_minds()
+            if not minds:
+                print(f"❌ No minds found in {importer.project_root / 'outputs/minds'}")
+                sys.exit(1)
+
+            print(f"🚀 Importing {len(minds)} minds with {min(args.workers, len(minds))} workers...\n")
+            finished = []
+
+            def progress(result):
+                finished.append(result['mind_slug'])
+                print_import_progress(result, len(finished), len(minds))
+
+            summary = importer.import_all(
+                minds,
+                workers=args.workers,
+                preview=args.preview,
+                skip_existing=not args.force,
+                on_result=progress
+            )
+            print_import_all_report(summary)
+            sys.exit(0 if summary['errors'] == 0 and summary['failed'] == 0 else 1)
+
         elif args.command == 'status':
             print("🔍 Checking database connection...")
             # Try to connect
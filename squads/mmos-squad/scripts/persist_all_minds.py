@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+MMOS Persist All Minds
+======================
+Persists every mind under minds/ to the database concurrently.
+
+For each mind directory:
+- minds: record from metadata.yaml (or docs/config.json), upserted by slug
+- mind_profiles: one profile per system_prompts/*.md (profile type = file stem)
+- fragments: one fragment per kb/*.md chunk (skip with --no-kb)
+
+Usage:
+    python persist_all_minds.py
+    python persist_all_minds.py sam_altman paul_graham --concurrency 8
+    python persist_all_minds.py --memory          # offline, in-memory client
+    python persist_all_minds.py --memory --db-metrics metrics.json
+"""
+
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+# Add lib/ to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
+
+import db_persister
+from async_persister import AsyncMMOSPersister
+from memory_client import MemoryClient
+
+MINDS_DIR = Path(__file__).parent.parent / "minds"
+
+
+def load_mind_info(mind_dir: Path) -> Dict[str, Any]:
+    """Display name and metadata for a mind directory."""
+    metadata: Dict[str, Any] = {}
+    metadata_file = mind_dir / "metadata.yaml"
+    if metadata_file.exists():
+        try:
+            with open(metadata_file, 'r', encoding='utf-8') as f:
+                metadata = (yaml.safe_load(f) or {}).get('mind') or {}
+        except yaml.YAMLError as e:
+            print(f"⚠️  {metadata_file}: unreadable metadata ({e.__class__.__name__}), using defaults")
+
+    config: Dict[str, Any] = {}
+    config_file = mind_dir / "docs" / "config.json"
+    if config_file.exists():
+        try:
+            config = json.loads(config_file.read_text(encoding='utf-8'))
+        except ValueError:
+            config = {}
+
+    name = (
+        metadata.get('display_name') or metadata.get('name') or config.get('name')
+        or mind_dir.name.replace('_', ' ').title()
+    )
+    return {'name': name, 'metadata': metadata}
+
+
+def load_kb_fragments(mind_dir: Path) -> List[Dict[str, Any]]:
+    fragments = []
+    for path in sorted((mind_dir / "kb").glob("*.md")):
+        if path.name.lower() == 'readme.md':
+            continue
+        fragments.append({
+            'type': 'kb_chunk',
+            'content': path.read_text(encoding='utf-8'),
+            'location': f"kb/{path.name}",
+            'metadata': {'file': path.name}
+        })
+    return fragments
+
+
+async def persist_mind(db: AsyncMMOSPersister, mind_dir: Path, with_kb: bool) -> Dict[str, Any]:
+    slug = mind_dir.name
+    info = load_mind_info(mind_dir)
+    report = {'slug': slug, 'mind_id': None, 'profiles': 0, 'fragments': 0}
+
+    mind_id = await db.create_or_update_mind(
+        slug, info['name'],
+        mmos_metadata={'filesystem': info['metadata']} if info['metadata'] else None
+    )
+    if not mind_id:
+        return report
+    report['mind_id'] = mind_id
+
+    prompts = sorted((mind_dir / "system_prompts").glob("*.md"))
+    profile_ids = await asyncio.gather(*(
+        db.save_mind_profile(mind_id, path.stem, path.read_text(encoding='utf-8'))
+        for path in prompts
+    ))
+    report['profiles'] = sum(1 for p in profile_ids if p)
+
+    if with_kb:
+        fragments = load_kb_fragments(mind_dir)
+        if fragments:
+            # The async semaphore bounds concurrency; one insert stream per mind
+            saved = await db.save_fragments(mind_id, None, fragments, concurrency=1)
+            report['fragments'] = sum(1 for i in saved['ids'] if i) if saved else 0
+
+    return report
+
+
+async def persist_all(mind_dirs: List[Path], db: AsyncMMOSPersister, with_kb: bool) -> List[Optional[Dict[str, Any]]]:
+    async with db:
+        return await db.gather(persist_mind(db, mind_dir, with_kb) for mind_dir in mind_dirs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Persist all MMOS minds to the database")
+    parser.add_argument('slugs', nargs='*', help='Mind slugs (default: every mind in minds/)')
+    parser.add_argument('--concurrency', type=int, default=db_persister.DB_CONCURRENCY,
+                        help='Database calls in flight (default MMOS_DB_CONCURRENCY)')
+    parser.add_argument('--no-kb', action='store_true', help='Skip kb/ chunks')
+    parser.add_argument('--memory', action='store_true',
+                        help='Use the in-memory client instead of Supabase (offline dry run)')
+    parser.add_argument('--latency-ms', type=float, default=0.0,
+                        help='Simulated request latency with --memory')
+    parser.add_argument('--db-metrics', metavar='JSON', nargs='?', const='',
+                        help='Print database time per table/operation (and write it to JSON)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.slugs:
+        mind_dirs = [MINDS_DIR / slug for slug in args.slugs]
+        missing = [d.name for d in mind_dirs if not d.is_dir()]
+        if missing:
+            print(f"❌ Unknown minds: {', '.join(missing)}")
+            sys.exit(1)
+    else:
+        mind_dirs = sorted(d for d in MINDS_DIR.iterdir() if d.is_dir())
+
+    client = MemoryClient(latency_ms=args.latency_ms) if args.memory else None
+    db = AsyncMMOSPersister(client=client, concurrency=args.concurrency)
+    if not db.is_enabled():
+        print("❌ Database persistence disabled (set MMOS_DB_PERSIST=true and SUPABASE_*, or use --memory)")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    reports = asyncio.run(persist_all(mind_dirs, db, not args.no_kb))
+    elapsed = time.perf_counter() - start
+
+    print(f"\n{'mind':<24} {'status':<8} {'profiles':>8} {'fragments':>9}")
+    failed = 0
+    for mind_dir, report in zip(mind_dirs, reports):
+        ok = bool(report and report['mind_id'])
+        failed += not ok
+        report = report or {'profiles': 0, 'fragments': 0}
+        print(f"{mind_dir.name:<24} {'✅' if ok else '❌':<8} {report['profiles']:>8} {report['fragments']:>9}")
+
+    print(f"\n{len(mind_dirs) - failed}/{len(mind_dirs)} minds persisted in {elapsed:.2f}s "
+          f"(concurrency {db.concurrency})")
+    if client is not None:
+        print(f"{client.requests} requests to the in-memory client")
+    if args.db_metrics is not None:
+        print(db.persister.metrics.summary())
+        if args.db_metrics:
+            db.persister.metrics.export(args.db_metrics)
+            print(f"\n📄 {args.db_metrics}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+MMOS SQLite Sync
+================
+Moves data between a local SQLite database (MMOS_DB_BACKEND=sqlite) and
+Supabase.
+
+- pull: copy the reference tables (mapping_systems, system_components,
+  drivers, toolbox, component_driver_map) from Supabase, so offline runs can
+  resolve slugs
+- push: bulk-upsert the minds and everything written for them. Minds are
+  matched by slug and reference ids are remapped by slug, so local and remote
+  UUIDs may differ. Fragments and job executions keep their ids and only rows
+  inserted or updated since the last push are sent. The watermark stops at
+  the first row that could not be pushed (its mind not synced yet, or a
+  failed write), so that row and everything after it are sent again next time
+
+Usage:
+    python sqlite_sync.py pull
+    python sqlite_sync.py push
+    python sqlite_sync.py push --db ./run.db --dry-run
+    python sqlite_sync.py push --memory      # push into the in-memory client (offline check)
+"""
+
+import os
+import sys
+import argparse
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add lib/ to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
+
+import db_persister
+from db_persister import MMOSPersister, LOOKUP_TABLES, LOOKUP_PAGE_SIZE
+from memory_client import MemoryClient
+from sqlite_client import SQLiteClient
+
+PULL_TABLES = LOOKUP_TABLES + ('component_driver_map',)
+
+# Column -> reference table it points into
+REFERENCE_COLUMNS = {
+    'system_id': 'mapping_systems',
+    'component_id': 'system_components',
+    'driver_id': 'drivers',
+    'driven_by': 'drivers',
+    'tool_id': 'toolbox',
+}
+
+# Tables pushed with upserts on their natural key (full table every push)
+UPSERT_TABLES = {
+    'mind_system_mappings': 'mind_id,system_id',
+    'mind_component_scores': 'mind_id,component_id',
+    'mind_drivers': 'mind_id,driver_id',
+    'mind_values': 'mind_id,name',
+    'mind_obsessions': 'mind_id,name',
+    'mind_tools': 'mind_id,tool_id',
+    'mind_profiles': 'mind_id,profile_type',
+    'component_driver_map': 'component_id,driver_id',
+}
+
+# Tables pushed incrementally from the SQLite change log, keeping their local ids
+APPEND_TABLES = ('job_executions', 'fragments')
+
+
+def fetch_all(client: Any, table: str) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    while True:
+        page = client.table(table).select('*').order('id').range(
+            len(rows), len(rows) + LOOKUP_PAGE_SIZE - 1
+        ).execute().data or []
+        rows.extend(page)
+        if len(page) < LOOKUP_PAGE_SIZE:
+            return rows
+
+
+def remote_client(use_memory: bool) -> Any:
+    if use_memory:
+        return MemoryClient()
+    url, key = os.getenv('SUPABASE_URL'), os.getenv('SUPABASE_SERVICE_KEY')
+    if not db_persister.HAS_SUPABASE or not url or not key:
+        print("❌ Needs supabase-py, SUPABASE_URL and SUPABASE_SERVICE_KEY")
+        sys.exit(1)
+    return db_persister.create_client(url, key)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PULL
+# ═══════════════════════════════════════════════════════════════════════════
+
+def pull(local: SQLiteClient, remote: Any) -> None:
+    for table in PULL_TABLES:
+        rows = fetch_all(remote, table)
+        key = 'component_id,driver_id' if table == 'component_driver_map' else 'slug'
+        if rows:
+            local.table(table).upsert(rows, on_conflict=key).execute()
+        print(f"⬇️  {table:<24} {len(rows):>6} rows")
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PUSH
+# ═══════════════════════════════════════════════════════════════════════════
+
+class Pusher:
+    def __init__(self, local: SQLiteClient, remote: Any, dry_run: bool = False):
+        self.local = local
+        self.remote = MMOSPersister(client=remote, write_behind=False)
+        self.dry_run = dry_run
+        self.mind_ids: Dict[str, str] = {}
+        self.reference_ids: Dict[str, Dict[str, Optional[str]]] = {}
+
+    def _reference_map(self, table: str) -> Dict[str, Optional[str]]:
+        """local id -> remote id, matched by slug."""
+        if table not in self.reference_ids:
+            remote_ids = self.remote._warm_lookup(table) or {}
+            self.reference_ids[table] = {
+                row['id']: remote_ids.get(row['slug'])
+                for row in fetch_all(self.local, table)
+            }
+        return self.reference_ids[table]
+
+    def _remap_row(self, row: Dict[str, Any], keep_id: bool) -> Optional[Dict[str, Any]]:
+        row = dict(row) if keep_id else {k: v for k, v in row.items() if k != 'id'}
+        if 'mind_id' in row:
+            row['mind_id'] = self.mind_ids.get(row['mind_id'])
+            if row['mind_id'] is None:
+                return None
+        for column, reference in REFERENCE_COLUMNS.items():
+            if row.get(column) is not None:
+                row[column] = self._reference_map(reference).get(row[column])
+                if row[column] is None and column != 'driven_by':
+                    return None
+        return {k: v for k, v in row.items() if v is not None}
+
+    def _remap(self, table: str, rows: List[Dict[str, Any]], keep_id: bool) -> List[Optional[Dict[str, Any]]]:
+        """Remapped rows in input order; None where the mind or a reference is not in Supabase."""
+        remapped = [self._remap_row(row, keep_id) for row in rows]
+        skipped = sum(1 for row in remapped if row is None)
+        if skipped:
+            print(f"⚠️  {table}: {skipped} rows skipped (mind or reference slug not in Supabase)")
+        return remapped
+
+    def _upsert(self, table: str, rows: List[Optional[Dict[str, Any]]], on_conflict: str) -> List[bool]:
+        """Whether each row was saved (skipped rows are not; a dry run saves the rest)."""
+        to_send = [row for row in rows if row is not None]
+        if self.dry_run or not to_send:
+            ids = [True] * len(to_send)
+        else:
+            ids = self.remote._bulk_upsert(table, to_send, on_conflict)
+        saved = iter(ids)
+        return [row is not None and bool(next(saved)) for row in rows]
+
+    def push_minds(self) -> None:
+        minds = fetch_all(self.local, 'minds')
+        rows = [{k: v for k, v in m.items() if k != 'id' and v is not None} for m in minds]
+        if self.dry_run:
+            remote_ids = [m['id'] for m in minds]
+        else:
+            remote_ids = self.remote._bulk_upsert('minds', rows, on_conflict='slug')
+        self.mind_ids = {m['id']: rid for m, rid in zip(minds, remote_ids) if rid}
+        print(f"⬆️  {'minds':<24} {len(self.mind_ids):>6}/{len(minds)} rows")
+
+    def push_table(self, table: str) -> None:
+        if table in APPEND_TABLES:
+            state = self.local.table('sync_state').select('*').eq('table_name', table).execute().data
+            after = (state[0]['last_seq'] if state else None) or 0
+            changes = self.local.changes_since(table, after)
+            saved = self._upsert(table, self._remap(table, [row for _, row in changes], keep_id=True), 'id')
+
+            # Advance only past rows pushed without a gap; the rest are sent again
+            watermark = after
+            for (seq, _), ok in zip(changes, saved):
+                if not ok:
+                    break
+                watermark = seq
+            if watermark != after and not self.dry_run:
+                self.local.table('sync_state').upsert(
+                    {'table_name': table, 'last_seq': watermark}, on_conflict='table_name'
+                ).execute()
+            total = len(changes)
+        else:
+            local_rows = fetch_all(self.local, table)
+            saved = self._upsert(table, self._remap(table, local_rows, keep_id=False), UPSERT_TABLES[table])
+            total = len(local_rows)
+        print(f"⬆️  {table:<24} {sum(saved):>6}/{total} rows")
+
+    def push(self) -> None:
+        self.push_minds()
+        # Jobs first: mind_profiles.generation_execution_id points at them
+        for table in ('job_executions', *UPSERT_TABLES, 'fragments'):
+            self.push_table(table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync the local MMOS SQLite database with Supabase")
+    parser.add_argument('command', choices=['pull', 'push'])
+    parser.add_argument('--db', default=db_persister.SQLITE_PATH,
+                        help='SQLite file (default MMOS_SQLITE_PATH)')
+    parser.add_argument('--dry-run', action='store_true', help='Count rows without writing (push)')
+    parser.add_argument('--memory', action='store_true',
+                        help='Use the in-memory client instead of Supabase (offline check)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    local = SQLiteClient(args.db)
+    remote = remote_client(args.memory)
+    print(f"📦 {local.path}\n")
+
+    if args.command == 'pull':
+        pull(local, remote)
+    else:
+        Pusher(local, remote, dry_run=args.dry_run).push()
+
+
+if __name__ == '__main__':
+    main()